@@ -2,6 +2,7 @@
 
 from typing import Dict, Any, Optional
 from datetime import datetime
+import functools
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
@@ -10,6 +11,7 @@ from pydantic import BaseModel, EmailStr
 from sqlalchemy.orm import Session
 
 from ..auth import OktaSSOHandler, JWTManager, RBACManager, Role, Permission
+from ..auth.jwt_manager import get_cached_jwt_manager
 from ..auth.rbac import PermissionDeniedError
 from ..database import get_db
 from ..models.user import User
@@ -72,7 +74,7 @@ def get_jwt_manager() -> JWTManager:
     """Get JWT manager instance."""
     from ..config import settings
     
-    return JWTManager(
+    return get_cached_jwt_manager(
         secret_key=settings.JWT_SECRET_KEY,
         algorithm=settings.JWT_ALGORITHM,
         access_token_expire_minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES,
@@ -80,8 +82,9 @@ def get_jwt_manager() -> JWTManager:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def get_rbac_manager() -> RBACManager:
-    """Get RBAC manager instance."""
+    """Get shared RBAC manager instance (reuses its permission cache)."""
     return RBACManager()
 
 
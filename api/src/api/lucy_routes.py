@@ -18,6 +18,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/lucy", tags=["lucy"])
 
+# Shared by every request so its recognition cache persists between them
+_intent_recognizer = IntentRecognizer()
+
 
 # Request/Response Models
 
@@ -146,8 +149,7 @@ async def chat_with_lucy(
         context.add_message("user", request.message)
         
         # Recognize intent
-        recognizer = IntentRecognizer()
-        recognized_intent = recognizer.recognize(request.message)
+        recognized_intent = _intent_recognizer.recognize(request.message)
         
         # Log the query
         log_lucy_query(
@@ -367,14 +369,12 @@ Just ask me in natural language, like "I need a GPU workspace" or "What are my c
     
     elif intent == Intent.RECOMMEND_BUNDLE:
         requirements = recognized_intent.entities.get("requirements", {})
-        from ..lucy.intent_recognizer import IntentRecognizer
-        recognizer = IntentRecognizer()
-        recommendations = recognizer.recommend_bundle(requirements)
+        recommendations = _intent_recognizer.recommend_bundle(requirements)
         
         if recommendations:
             response = "Based on your requirements, I recommend:\n\n"
             for i, bundle in enumerate(recommendations, 1):
-                desc = recognizer.get_bundle_description(bundle)
+                desc = _intent_recognizer.get_bundle_description(bundle)
                 response += f"{i}. {desc}\n"
             response += "\nWould you like me to provision one of these?"
             return response
@@ -1,10 +1,11 @@
 """Audit logging module for RobCo Forge."""
 
-from .audit_logger import AuditLogger, audit_log
+from .audit_logger import AuditLogger, audit_log, audit_log_bulk
 from .middleware import AuditMiddleware
 
 __all__ = [
     "AuditLogger",
     "audit_log",
+    "audit_log_bulk",
     "AuditMiddleware",
 ]
@@ -6,16 +6,16 @@ Requirements:
 - 10.3: Tamper-evident storage
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 import logging
 import hashlib
 import json
-from uuid import uuid4
+import threading
 
 from sqlalchemy.orm import Session
 
-from ..models.audit_log import AuditLog
+from ..models.audit_log import AuditLog, ActionType, ActionResult
 from ..database import SessionLocal
 
 logger = logging.getLogger(__name__)
@@ -33,8 +33,16 @@ class AuditLogger:
     def __init__(self):
         """Initialize audit logger."""
         self._previous_hash: Optional[str] = None
+        
+        # Serializes read previous hash -> build -> commit -> advance so
+        # concurrent writers cannot fork the hash chain
+        self._chain_lock = threading.Lock()
     
-    def _calculate_hash(self, log_entry: Dict[str, Any]) -> str:
+    def _calculate_hash(
+        self,
+        log_entry: Dict[str, Any],
+        previous_hash: Optional[str] = None,
+    ) -> str:
         """Calculate tamper-evident hash for log entry.
         
         Creates a hash chain where each entry includes the hash of the previous entry.
@@ -44,6 +52,8 @@ class AuditLogger:
         
         Args:
             log_entry: Log entry data
+            previous_hash: Hash of the preceding entry (defaults to the
+                last hash this logger stored)
             
         Returns:
             SHA-256 hash of the entry
@@ -56,7 +66,7 @@ class AuditLogger:
             "resource_type": log_entry["resource_type"],
             "resource_id": log_entry.get("resource_id"),
             "result": log_entry["result"],
-            "previous_hash": self._previous_hash or "genesis",
+            "previous_hash": previous_hash or self._previous_hash or "genesis",
         }
         
         # Create JSON string with sorted keys for consistency
@@ -65,6 +75,87 @@ class AuditLogger:
         # Calculate SHA-256 hash
         return hashlib.sha256(hash_string.encode()).hexdigest()
     
+    def _build_entry(
+        self,
+        previous_hash: Optional[str],
+        user_id: str,
+        action: str,
+        resource_type: str,
+        result: str,
+        resource_id: Optional[str] = None,
+        error_message: Optional[str] = None,
+        source_ip: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        interface: Optional[str] = None,
+        workspace_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        action_type: ActionType = ActionType.OTHER,
+    ) -> Tuple[AuditLog, str]:
+        """Build an audit log entry chained onto a previous hash.
+        
+        Validates: Requirements 10.2, 10.3
+        
+        Args:
+            previous_hash: Hash of the entry this one follows (None for genesis)
+            user_id: User identifier
+            action: Action performed
+            resource_type: Type of resource
+            result: Result of action ("SUCCESS", "FAILURE", "DENIED")
+            resource_id: Optional resource identifier
+            error_message: Optional error message for failures
+            source_ip: Source IP address
+            user_agent: User agent string
+            interface: Interface used (PORTAL, CLI, LUCY)
+            workspace_id: Optional workspace ID for workspace-related actions
+            metadata: Optional additional metadata
+            action_type: Audit action category
+            
+        Returns:
+            Tuple of (unsaved audit log entry, entry hash)
+        """
+        timestamp = datetime.utcnow()
+        result = ActionResult(result)
+        previous_hash = previous_hash or "genesis"
+        
+        # Prepare log entry data
+        log_data = {
+            "timestamp": timestamp,
+            "user_id": user_id,
+            "action": action,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "result": result.value,
+        }
+        
+        # Calculate tamper-evident hash
+        entry_hash = self._calculate_hash(log_data, previous_hash)
+        
+        # Fields without a dedicated column are kept in the context
+        context = dict(metadata or {})
+        if error_message is not None:
+            context["error_message"] = error_message
+        if workspace_id is not None:
+            context["workspace_id"] = workspace_id
+        
+        # Create audit log entry
+        audit_entry = AuditLog(
+            timestamp=timestamp,
+            user_id=user_id,
+            action_type=action_type,
+            action_description=action,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            result=result,
+            source_ip=source_ip or "unknown",
+            user_agent=user_agent,
+            interface=interface,
+            context=context,
+            previous_log_hash=previous_hash,
+            log_hash=entry_hash,
+        )
+        
+        return audit_entry, entry_hash
+    
     def log_action(
         self,
         user_id: str,
@@ -78,6 +169,7 @@ class AuditLogger:
         interface: Optional[str] = None,
         workspace_id: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        action_type: ActionType = ActionType.OTHER,
         db: Optional[Session] = None,
     ) -> AuditLog:
         """Create an audit log entry.
@@ -96,6 +188,7 @@ class AuditLogger:
             interface: Interface used (PORTAL, CLI, LUCY)
             workspace_id: Optional workspace ID for workspace-related actions
             metadata: Optional additional metadata
+            action_type: Audit action category
             db: Database session (creates new if not provided)
             
         Returns:
@@ -107,62 +200,97 @@ class AuditLogger:
             should_close_db = True
         
         try:
-            timestamp = datetime.utcnow()
-            
-            # Prepare log entry data
-            log_data = {
-                "timestamp": timestamp,
-                "user_id": user_id,
-                "action": action,
-                "resource_type": resource_type,
-                "resource_id": resource_id,
-                "result": result,
-            }
-            
-            # Calculate tamper-evident hash
-            entry_hash = self._calculate_hash(log_data)
+            with self._chain_lock:
+                audit_entry, entry_hash = self._build_entry(
+                    previous_hash=self._previous_hash,
+                    user_id=user_id,
+                    action=action,
+                    resource_type=resource_type,
+                    result=result,
+                    resource_id=resource_id,
+                    error_message=error_message,
+                    source_ip=source_ip,
+                    user_agent=user_agent,
+                    interface=interface,
+                    workspace_id=workspace_id,
+                    metadata=metadata,
+                    action_type=action_type,
+                )
+                
+                db.add(audit_entry)
+                db.commit()
+                db.refresh(audit_entry)
+                
+                # Update previous hash for next entry
+                self._previous_hash = entry_hash
             
-            # Create audit log entry
-            audit_entry = AuditLog(
-                id=f"audit-{uuid4().hex[:16]}",
-                timestamp=timestamp,
-                user_id=user_id,
-                action=action,
-                resource_type=resource_type,
-                resource_id=resource_id,
-                result=result,
-                error_message=error_message,
-                source_ip=source_ip,
-                user_agent=user_agent,
-                interface=interface,
-                workspace_id=workspace_id,
-                metadata=metadata or {},
+            logger.info(
+                f"audit_log_created audit_id={audit_entry.id} user_id={user_id} "
+                f"action={action} resource_type={resource_type} result={result}"
             )
             
-            # Store hash in metadata for verification
-            audit_entry.metadata["_hash"] = entry_hash
-            audit_entry.metadata["_previous_hash"] = self._previous_hash or "genesis"
+            return audit_entry
             
-            db.add(audit_entry)
-            db.commit()
-            db.refresh(audit_entry)
+        except Exception as e:
+            logger.error(f"Failed to create audit log: {e}", exc_info=True)
+            if should_close_db:
+                db.rollback()
+            raise
+        finally:
+            if should_close_db:
+                db.close()
+    
+    def log_actions(
+        self,
+        entries: List[Dict[str, Any]],
+        db: Optional[Session] = None,
+    ) -> List[AuditLog]:
+        """Create a batch of audit log entries in one transaction.
+        
+        Entries are chained in order exactly as if each had been passed to
+        log_action, but are inserted with a single commit.
+        
+        Validates: Requirements 10.1, 10.2, 10.3
+        
+        Args:
+            entries: Keyword arguments for log_action, one dict per entry
+                (without db)
+            db: Database session (creates new if not provided)
             
-            # Update previous hash for next entry
-            self._previous_hash = entry_hash
+        Returns:
+            Created audit log entries, in input order
+        """
+        if not entries:
+            return []
+        
+        should_close_db = False
+        if db is None:
+            db = SessionLocal()
+            should_close_db = True
+        
+        try:
+            with self._chain_lock:
+                audit_entries = []
+                previous_hash = self._previous_hash
+                for entry in entries:
+                    audit_entry, previous_hash = self._build_entry(
+                        previous_hash=previous_hash,
+                        **entry,
+                    )
+                    audit_entries.append(audit_entry)
+                
+                db.add_all(audit_entries)
+                db.commit()
+                
+                # Only advance the chain once the whole batch is stored
+                self._previous_hash = previous_hash
             
-            logger.info(
-                "audit_log_created",
-                audit_id=audit_entry.id,
-                user_id=user_id,
-                action=action,
-                resource_type=resource_type,
-                result=result,
-            )
+            logger.info(f"audit_logs_created count={len(audit_entries)}")
             
-            return audit_entry
+            return audit_entries
             
         except Exception as e:
-            logger.error(f"Failed to create audit log: {e}", exc_info=True)
+            logger.error(f"Failed to create audit logs: {e}", exc_info=True)
             if should_close_db:
                 db.rollback()
             raise
@@ -186,7 +314,7 @@ class AuditLogger:
         """
         try:
             # Get recent audit logs ordered by timestamp
-            logs = db.query(AuditLog).order_by(AuditLog.timestamp.desc()).limit(limit).all()
+            logs = db.query(AuditLog).order_by(AuditLog.timestamp.desc(), AuditLog.id.desc()).limit(limit).all()
             logs.reverse()  # Process in chronological order
             
             if not logs:
@@ -201,14 +329,13 @@ class AuditLogger:
             tampered_entries = []
             
             for log in logs:
-                # Get stored hash from metadata
-                stored_hash = log.metadata.get("_hash")
-                stored_previous_hash = log.metadata.get("_previous_hash")
+                stored_hash = log.log_hash
+                stored_previous_hash = log.previous_log_hash
                 
                 if not stored_hash:
                     tampered_entries.append({
                         "audit_id": log.id,
-                        "reason": "Missing hash in metadata",
+                        "reason": "Missing log hash",
                     })
                     continue
                 
@@ -223,13 +350,13 @@ class AuditLogger:
                 log_data = {
                     "timestamp": log.timestamp,
                     "user_id": log.user_id,
-                    "action": log.action,
+                    "action": log.action_description,
                     "resource_type": log.resource_type,
                     "resource_id": log.resource_id,
-                    "result": log.result,
+                    "result": log.result.value,
                 }
                 
-                calculated_hash = self._calculate_hash(log_data)
+                calculated_hash = self._calculate_hash(log_data, stored_previous_hash)
                 
                 if calculated_hash != stored_hash:
                     tampered_entries.append({
@@ -297,6 +424,22 @@ def audit_log(
     )
 
 
+def audit_log_bulk(
+    entries: List[Dict[str, Any]],
+    db: Optional[Session] = None,
+) -> List[AuditLog]:
+    """Convenience function for creating a batch of audit logs.
+    
+    Args:
+        entries: Keyword arguments for audit_log, one dict per entry
+        db: Database session (creates new if not provided)
+        
+    Returns:
+        Created audit log entries
+    """
+    return _audit_logger.log_actions(entries, db=db)
+
+
 def verify_audit_chain(db: Session, limit: int = 100) -> Dict[str, Any]:
     """Verify the integrity of the audit log chain.
     
@@ -2,6 +2,7 @@
 
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
+import functools
 import logging
 
 import jwt
@@ -38,6 +39,11 @@ class JWTManager:
         self.access_token_expire_minutes = access_token_expire_minutes
         self.refresh_token_expire_days = refresh_token_expire_days
     
+    @functools.cached_property
+    def _signing_key(self) -> bytes:
+        """Signing key encoded once for reuse across encode/decode calls."""
+        return self.secret_key.encode("utf-8")
+    
     def generate_token(
         self,
         user_id: str,
@@ -83,7 +89,7 @@ class JWTManager:
         }
         
         # Encode token
-        token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+        token = jwt.encode(payload, self._signing_key, algorithm=self.algorithm)
         
         logger.info(
             f"Generated {token_type} token for user {user_id}",
@@ -116,7 +122,7 @@ class JWTManager:
             # Decode and validate token
             payload = jwt.decode(
                 token,
-                self.secret_key,
+                self._signing_key,
                 algorithms=[self.algorithm],
                 options={
                     "verify_signature": True,
@@ -202,6 +208,35 @@ class JWTManager:
             return {}
 
 
+@functools.lru_cache(maxsize=8)
+def get_cached_jwt_manager(
+    secret_key: str,
+    algorithm: str = "HS256",
+    access_token_expire_minutes: int = 60,
+    refresh_token_expire_days: int = 7,
+) -> JWTManager:
+    """Get a shared JWT manager for the given configuration.
+    
+    Managers are immutable once configured, so one instance per distinct
+    configuration is reused instead of rebuilding it for every request.
+    
+    Args:
+        secret_key: Secret key for signing tokens
+        algorithm: JWT signing algorithm (default: HS256)
+        access_token_expire_minutes: Access token expiration in minutes
+        refresh_token_expire_days: Refresh token expiration in days
+        
+    Returns:
+        Shared JWTManager instance
+    """
+    return JWTManager(
+        secret_key=secret_key,
+        algorithm=algorithm,
+        access_token_expire_minutes=access_token_expire_minutes,
+        refresh_token_expire_days=refresh_token_expire_days,
+    )
+
+
 class TokenExpiredError(Exception):
     """Raised when JWT token has expired."""
     pass
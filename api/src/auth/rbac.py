@@ -1,9 +1,11 @@
 """Role-Based Access Control (RBAC) system."""
 
-from typing import List, Optional, Set, Dict, Any
+from typing import List, Optional, Set, FrozenSet, Dict, Any, Tuple
 from datetime import datetime
 from enum import Enum
+import functools
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -232,11 +234,38 @@ class RBACManager:
     - 8.6: Bundle type restrictions for contractors
     """
     
+    # Maximum distinct (roles, permission) pairs kept in the permission cache
+    PERMISSION_CACHE_SIZE = 512
+    
     def __init__(self):
         """Initialize RBAC manager."""
         self.role_permissions = ROLE_PERMISSIONS
+        self._role_perms: Dict[Role, FrozenSet[Permission]] = {}
+        
+        # Role resolution is pure, so memoize it per role set and per
+        # (roles, permission) pair
+        self._permissions_for_roles_cached = functools.lru_cache(
+            maxsize=self.PERMISSION_CACHE_SIZE
+        )(self._union_role_permissions)
+        self._has_permission_cached = functools.lru_cache(
+            maxsize=self.PERMISSION_CACHE_SIZE
+        )(self._resolve_permission)
+        
+        self.clear_permission_cache()
+    
+    def clear_permission_cache(self) -> None:
+        """Rebuild role permission sets and clear memoized permission checks.
+        
+        Must be called after mutating role_permissions.
+        """
+        self._role_perms = {
+            role: frozenset(permissions)
+            for role, permissions in self.role_permissions.items()
+        }
+        self._permissions_for_roles_cached.cache_clear()
+        self._has_permission_cached.cache_clear()
     
-    def get_permissions_for_role(self, role: Role) -> Set[Permission]:
+    def get_permissions_for_role(self, role: Role) -> FrozenSet[Permission]:
         """Get all permissions for a given role.
         
         Args:
@@ -245,9 +274,9 @@ class RBACManager:
         Returns:
             Set of permissions for the role
         """
-        return self.role_permissions.get(role, set())
+        return self._role_perms.get(role, frozenset())
     
-    def get_permissions_for_roles(self, roles: List[str]) -> Set[Permission]:
+    def get_permissions_for_roles(self, roles: List[str]) -> FrozenSet[Permission]:
         """Get combined permissions for multiple roles.
         
         Args:
@@ -256,23 +285,35 @@ class RBACManager:
         Returns:
             Set of all permissions across all roles
         """
-        all_permissions: Set[Permission] = set()
+        return self._permissions_for_roles_cached(frozenset(roles))
+    
+    def _union_role_permissions(self, roles: FrozenSet[str]) -> FrozenSet[Permission]:
+        """Union the permission sets of a set of roles.
+        
+        Args:
+            roles: Role names
+            
+        Returns:
+            Set of all permissions across all roles
+        """
+        role_sets = []
         
         for role_name in roles:
             try:
                 role = Role(role_name)
-                all_permissions.update(self.get_permissions_for_role(role))
+                role_sets.append(self.get_permissions_for_role(role))
             except ValueError:
                 logger.warning(f"Unknown role: {role_name}")
                 continue
         
-        return all_permissions
+        return frozenset().union(*role_sets)
     
     def has_permission(
         self,
         user_roles: List[str],
         required_permission: Permission,
         credential_expiry: Optional[datetime] = None,
+        now: Optional[datetime] = None,
     ) -> bool:
         """Check if user has required permission.
         
@@ -280,6 +321,8 @@ class RBACManager:
             user_roles: List of user's role names
             required_permission: Permission to check
             credential_expiry: Optional credential expiry time (for contractors)
+            now: Optional current time (UTC); read from the clock only when
+                needed for an expiry check
             
         Returns:
             True if user has permission, False otherwise
@@ -287,22 +330,71 @@ class RBACManager:
         Validates: Requirements 8.4, 8.5
         """
         # Check if credentials have expired (for contractors)
-        if credential_expiry and datetime.utcnow() > credential_expiry:
-            logger.warning(
-                "Access denied: credentials expired",
-                extra={"credential_expiry": credential_expiry.isoformat()}
-            )
-            return False
+        if credential_expiry:
+            if now is None:
+                now = datetime.utcnow()
+            if now > credential_expiry:
+                logger.warning(
+                    "Access denied: credentials expired",
+                    extra={"credential_expiry": credential_expiry.isoformat()}
+                )
+                return False
+        
+        return self._check_role_permission(user_roles, required_permission)
+    
+    def has_permission_epoch(
+        self,
+        user_roles: List[str],
+        required_permission: Permission,
+        credential_expiry_epoch: Optional[float] = None,
+        now_epoch: Optional[float] = None,
+    ) -> bool:
+        """Check if user has required permission using Unix timestamps.
         
-        # Get all permissions for user's roles
-        user_permissions = self.get_permissions_for_roles(user_roles)
+        Hot-path variant of has_permission for callers that already hold
+        epoch seconds (e.g. a JWT "exp" claim), avoiding datetime objects.
         
-        # Admin has all permissions
-        if Permission.ADMIN_FULL in user_permissions:
-            return True
+        Args:
+            user_roles: List of user's role names
+            required_permission: Permission to check
+            credential_expiry_epoch: Optional credential expiry (Unix seconds)
+            now_epoch: Optional current time (Unix seconds)
+            
+        Returns:
+            True if user has permission, False otherwise
+            
+        Validates: Requirements 8.4, 8.5
+        """
+        if credential_expiry_epoch:
+            if now_epoch is None:
+                now_epoch = time.time()
+            if now_epoch > credential_expiry_epoch:
+                logger.warning(
+                    "Access denied: credentials expired",
+                    extra={"credential_expiry": credential_expiry_epoch}
+                )
+                return False
+        
+        return self._check_role_permission(user_roles, required_permission)
+    
+    def _check_role_permission(
+        self,
+        user_roles: List[str],
+        required_permission: Permission,
+    ) -> bool:
+        """Check role-granted permission, logging denials.
         
-        # Check if user has the required permission
-        has_perm = required_permission in user_permissions
+        Args:
+            user_roles: List of user's role names
+            required_permission: Permission to check
+            
+        Returns:
+            True if user has permission, False otherwise
+        """
+        has_perm = self._has_permission_cached(
+            tuple(sorted(set(user_roles))),
+            required_permission,
+        )
         
         if not has_perm:
             logger.warning(
@@ -315,6 +407,30 @@ class RBACManager:
         
         return has_perm
     
+    def _resolve_permission(
+        self,
+        roles: Tuple[str, ...],
+        required_permission: Permission,
+    ) -> bool:
+        """Resolve whether a set of roles grants a permission.
+        
+        Args:
+            roles: Sorted, de-duplicated role names
+            required_permission: Permission to check
+            
+        Returns:
+            True if any role grants the permission, False otherwise
+        """
+        # Get all permissions for user's roles
+        user_permissions = self.get_permissions_for_roles(roles)
+        
+        # Admin has all permissions
+        if Permission.ADMIN_FULL in user_permissions:
+            return True
+        
+        # Check if user has the required permission
+        return required_permission in user_permissions
+    
     def check_bundle_access(
         self,
         user_roles: List[str],
@@ -464,15 +580,12 @@ class RBACMiddleware:
             True if user has permission, False otherwise
         """
         user_roles = user_data.get("roles", [])
-        credential_expiry = user_data.get("exp")
-        
-        if credential_expiry:
-            credential_expiry = datetime.fromtimestamp(credential_expiry)
         
-        return self.rbac_manager.has_permission(
+        # JWT "exp" is already Unix seconds; compare without datetime conversion
+        return self.rbac_manager.has_permission_epoch(
             user_roles=user_roles,
             required_permission=required_permission,
-            credential_expiry=credential_expiry,
+            credential_expiry_epoch=user_data.get("exp"),
         )
 
 
@@ -6,17 +6,46 @@ Requirements:
 - 12.3: Hard limit at 100% threshold
 """
 
+import functools
 from datetime import datetime
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 import logging
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, bindparam, select, tuple_
 
 from ..models.user_budget import UserBudget, BudgetScope
 from ..models.cost_record import CostRecord
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of (scope, scope_id, period) -> budget id entries cached per tracker
+BUDGET_LOOKUP_CACHE_SIZE = 256
+
+
+# Budget lookups built once with bound parameters so SQLAlchemy's compiled
+# statement cache reuses a single compilation per lookup shape
+_BUDGET_BY_SCOPE = select(UserBudget).where(
+    UserBudget.scope == bindparam("scope"),
+    UserBudget.scope_id == bindparam("scope_id"),
+)
+
+_BUDGET_ANY_PERIOD = _BUDGET_BY_SCOPE.limit(1)
+
+_BUDGET_COVERING_PERIOD = _BUDGET_BY_SCOPE.where(
+    UserBudget.period_start <= bindparam("period_start"),
+    UserBudget.period_end >= bindparam("period_end"),
+).limit(1)
+
+# All budgets for several (scope, scope_id) pairs in one round-trip
+_BUDGETS_FOR_SCOPES = select(UserBudget).where(
+    tuple_(UserBudget.scope, UserBudget.scope_id).in_(
+        bindparam("scopes", expanding=True)
+    )
+)
+
+# Warning reported when projected spend crosses a budget's warning threshold
+_BUDGET_WARNING = "{label} budget at {utilization:.1f}% (${projected_spend:.2f} / ${budget_amount:.2f})"
+
 
 class BudgetExceededError(Exception):
     """Raised when budget limit is exceeded."""
@@ -43,6 +72,9 @@ class BudgetTracker:
             db: Database session
         """
         self.db = db
+        self._lookup_budget_id = functools.lru_cache(
+            maxsize=BUDGET_LOOKUP_CACHE_SIZE
+        )(self._query_budget_id)
     
     def get_budget(
         self,
@@ -64,33 +96,81 @@ class BudgetTracker:
         Returns:
             UserBudget if found, None otherwise
         """
-        query = self.db.query(UserBudget).filter(
-            and_(
-                UserBudget.scope == scope,
-                UserBudget.scope_id == scope_id
-            )
-        )
-        
         # Filter by period if provided
         if period_start and period_end:
-            query = query.filter(
-                and_(
-                    UserBudget.period_start <= period_start,
-                    UserBudget.period_end >= period_end
-                )
-            )
+            budget_id = self._lookup_budget_id(scope, scope_id, period_start, period_end)
         elif use_current_period:
-            # Get current period budget
+            # Get current period budget; "now" changes per call so it is not cached
             now = datetime.now()
-            query = query.filter(
-                and_(
-                    UserBudget.period_start <= now,
-                    UserBudget.period_end >= now
-                )
-            )
-        # If use_current_period is False and no period specified, return first match
+            budget_id = self._query_budget_id(scope, scope_id, now, now)
+        else:
+            # If use_current_period is False and no period specified, return first match
+            budget_id = self._lookup_budget_id(scope, scope_id, None, None)
+        
+        if budget_id is None:
+            return None
         
-        return query.first()
+        # Primary key lookups are served from the session identity map
+        return self.db.get(UserBudget, budget_id)
+    
+    def _query_budget_id(
+        self,
+        scope: BudgetScope,
+        scope_id: str,
+        period_start: Optional[datetime],
+        period_end: Optional[datetime]
+    ) -> Optional[int]:
+        """Query the id of the budget for a scope and period.
+        
+        Args:
+            scope: Budget scope
+            scope_id: Scope identifier
+            period_start: Period start date, or None to match any period
+            period_end: Period end date, or None to match any period
+            
+        Returns:
+            Budget id if found, None otherwise
+        """
+        params = {"scope": scope, "scope_id": scope_id}
+        
+        if period_start and period_end:
+            statement = _BUDGET_COVERING_PERIOD
+            params["period_start"] = period_start
+            params["period_end"] = period_end
+        else:
+            statement = _BUDGET_ANY_PERIOD
+        
+        budget = self.db.execute(statement, params).scalars().first()
+        return budget.id if budget else None
+    
+    def clear_budget_cache(self) -> None:
+        """Clear cached budget lookups.
+        
+        Called whenever budgets are created or updated so later lookups
+        see the change.
+        """
+        self._lookup_budget_id.cache_clear()
+    
+    def get_budgets_for_scopes(
+        self,
+        scopes: List[Tuple[BudgetScope, str]]
+    ) -> Dict[Tuple[BudgetScope, str], UserBudget]:
+        """Get budgets for several scopes with a single query.
+        
+        Like get_budget with use_current_period=False, the first budget
+        found for each scope is returned regardless of period.
+        
+        Args:
+            scopes: (scope, scope_id) pairs to look up
+            
+        Returns:
+            Dict mapping (scope, scope_id) to its budget; scopes without a
+            budget are omitted
+        """
+        budgets: Dict[Tuple[BudgetScope, str], UserBudget] = {}
+        for budget in self.db.execute(_BUDGETS_FOR_SCOPES, {"scopes": scopes}).scalars():
+            budgets.setdefault((budget.scope, budget.scope_id), budget)
+        return budgets
     
     def update_budget_spend(
         self,
@@ -142,6 +222,7 @@ class BudgetTracker:
         
         self.db.commit()
         self.db.refresh(budget)
+        self.clear_budget_cache()
         
         return budget
     
@@ -171,54 +252,50 @@ class BudgetTracker:
             - warning_message: Warning message if at 80% threshold, None otherwise
             - budget_info: Budget information dict if blocked, None otherwise
         """
+        scopes = [(BudgetScope.USER, user_id), (BudgetScope.TEAM, team_id)]
+        if project_id:
+            scopes.append((BudgetScope.PROJECT, project_id))
+        budgets = self.get_budgets_for_scopes(scopes)
+        
+        # Nothing to enforce or warn about when no budget is configured
+        if not budgets:
+            return True, None, None
+        
         # Check user budget
-        user_budget = self.get_budget(BudgetScope.USER, user_id, use_current_period=False)
+        user_budget = budgets.get((BudgetScope.USER, user_id))
         if user_budget:
             result = self._check_single_budget(user_budget, estimated_cost, "user")
             if not result[0]:  # Blocked
                 return result
         
         # Check team budget
-        team_budget = self.get_budget(BudgetScope.TEAM, team_id, use_current_period=False)
+        team_budget = budgets.get((BudgetScope.TEAM, team_id))
         if team_budget:
             result = self._check_single_budget(team_budget, estimated_cost, "team")
             if not result[0]:  # Blocked
                 return result
         
         # Check project budget if provided
-        if project_id:
-            project_budget = self.get_budget(BudgetScope.PROJECT, project_id, use_current_period=False)
-            if project_budget:
-                result = self._check_single_budget(project_budget, estimated_cost, "project")
-                if not result[0]:  # Blocked
-                    return result
+        project_budget = budgets.get((BudgetScope.PROJECT, project_id)) if project_id else None
+        if project_budget:
+            result = self._check_single_budget(project_budget, estimated_cost, "project")
+            if not result[0]:  # Blocked
+                return result
         
         # Collect warnings from all budgets (check projected spend)
         warnings = []
         
-        if user_budget:
-            projected_user_spend = user_budget.current_spend + estimated_cost
-            if projected_user_spend >= (user_budget.budget_amount * user_budget.warning_threshold):
-                warnings.append(
-                    f"User budget at {(projected_user_spend / user_budget.budget_amount) * 100:.1f}% "
-                    f"(${projected_user_spend:.2f} / ${user_budget.budget_amount:.2f})"
-                )
-        
-        if team_budget:
-            projected_team_spend = team_budget.current_spend + estimated_cost
-            if projected_team_spend >= (team_budget.budget_amount * team_budget.warning_threshold):
-                warnings.append(
-                    f"Team budget at {(projected_team_spend / team_budget.budget_amount) * 100:.1f}% "
-                    f"(${projected_team_spend:.2f} / ${team_budget.budget_amount:.2f})"
-                )
-        
-        if project_id and project_budget:
-            projected_project_spend = project_budget.current_spend + estimated_cost
-            if projected_project_spend >= (project_budget.budget_amount * project_budget.warning_threshold):
-                warnings.append(
-                    f"Project budget at {(projected_project_spend / project_budget.budget_amount) * 100:.1f}% "
-                    f"(${projected_project_spend:.2f} / ${project_budget.budget_amount:.2f})"
-                )
+        for label, budget in (("User", user_budget), ("Team", team_budget), ("Project", project_budget)):
+            if not budget:
+                continue
+            projected_spend = budget.current_spend + estimated_cost
+            if projected_spend >= (budget.budget_amount * budget.warning_threshold):
+                warnings.append(_BUDGET_WARNING.format(
+                    label=label,
+                    utilization=(projected_spend / budget.budget_amount) * 100,
+                    projected_spend=projected_spend,
+                    budget_amount=budget.budget_amount,
+                ))
         
         warning_message = "; ".join(warnings) if warnings else None
         
@@ -340,6 +417,7 @@ class BudgetTracker:
         self.db.add(budget)
         self.db.commit()
         self.db.refresh(budget)
+        self.clear_budget_cache()
         
         logger.info(
             f"budget_created scope={scope.value} scope_id={scope_id} "
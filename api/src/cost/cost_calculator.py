@@ -7,9 +7,10 @@ Requirements:
 """
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional
 from datetime import datetime, timedelta
 from enum import Enum
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
@@ -74,14 +75,11 @@ class CostCalculator:
             ValueError: If bundle type is invalid
         """
         try:
-            bundle_enum = BundleType(bundle_type)
-        except ValueError:
+            compute_cost = _BUNDLE_RATES[getattr(bundle_type, "value", bundle_type)] * running_hours
+        except KeyError:
             logger.error(f"invalid_bundle_type bundle_type={bundle_type}")
             raise ValueError(f"Invalid bundle type: {bundle_type}")
         
-        hourly_rate = self.BUNDLE_RATES[bundle_enum]
-        compute_cost = hourly_rate * running_hours
-        
         logger.debug(
             f"compute_cost_calculated bundle_type={bundle_type} "
             f"running_hours={running_hours} cost={compute_cost:.2f}"
@@ -262,11 +260,9 @@ class CostCalculator:
             ValueError: If bundle type is invalid
         """
         try:
-            bundle_enum = BundleType(bundle_type)
-        except ValueError:
+            return _BUNDLE_RATES[getattr(bundle_type, "value", bundle_type)]
+        except KeyError:
             raise ValueError(f"Invalid bundle type: {bundle_type}")
-        
-        return self.BUNDLE_RATES[bundle_enum]
     
     def compare_bundle_costs(
         self,
@@ -301,3 +297,11 @@ class CostCalculator:
             "monthly_savings": round(savings, 2),
             "savings_percent": round(savings_percent, 1)
         }
+
+
+# Hourly rates keyed by bundle type value, so rate lookups are a single hashed
+# get instead of an enum construction followed by a second dict lookup.
+# BundleType members are looked up by their value.
+_BUNDLE_RATES: Mapping[str, float] = MappingProxyType({
+    bundle.value: rate for bundle, rate in CostCalculator.BUNDLE_RATES.items()
+})
@@ -14,41 +14,96 @@ Requirements:
 - 6.5: Security constraints
 """
 
-from .claude_client import ClaudeClient
-from .context_manager import (
-    ConversationContext,
-    ConversationContextManager,
-    Message
-)
-from .tool_executor import (
-    Tool,
-    ToolResult,
-    ToolCategory,
-    ToolExecutor,
-    RateLimiter,
-    ConfirmationRequired
-)
-from .workspace_tools import (
-    ProvisionWorkspaceTool,
-    ListWorkspacesTool,
-    StartWorkspaceTool,
-    StopWorkspaceTool,
-    TerminateWorkspaceTool
-)
-from .cost_tools import (
-    GetCostSummaryTool,
-    GetCostRecommendationsTool,
-    CheckBudgetTool,
-    RunDiagnosticsTool
-)
-from .support_tools import (
-    CreateSupportTicketTool,
-    FallbackRouter
-)
-from .system_prompt import (
-    LucySystemPrompt,
-    PROMPT_TEMPLATES
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .claude_client import ClaudeClient
+    from .context_manager import (
+        ConversationContext,
+        ConversationContextManager,
+        Message
+    )
+    from .tool_executor import (
+        Tool,
+        ToolResult,
+        ToolCategory,
+        ToolExecutor,
+        RateLimiter,
+        ConfirmationRequired
+    )
+    from .workspace_tools import (
+        ProvisionWorkspaceTool,
+        ListWorkspacesTool,
+        StartWorkspaceTool,
+        StopWorkspaceTool,
+        TerminateWorkspaceTool
+    )
+    from .cost_tools import (
+        GetCostSummaryTool,
+        GetCostRecommendationsTool,
+        CheckBudgetTool,
+        RunDiagnosticsTool
+    )
+    from .support_tools import (
+        CreateSupportTicketTool,
+        FallbackRouter
+    )
+    from .system_prompt import (
+        LucySystemPrompt,
+        PROMPT_TEMPLATES
+    )
+
+# Exported name -> defining submodule. Submodules pull in the Anthropic,
+# HTTP and Redis clients, so they are imported on first attribute access
+# rather than whenever any src.lucy submodule (e.g. intent_recognizer) loads.
+_EXPORTS = {
+    'ClaudeClient': 'claude_client',
+    'ConversationContext': 'context_manager',
+    'ConversationContextManager': 'context_manager',
+    'Message': 'context_manager',
+    'Tool': 'tool_executor',
+    'ToolResult': 'tool_executor',
+    'ToolCategory': 'tool_executor',
+    'ToolExecutor': 'tool_executor',
+    'RateLimiter': 'tool_executor',
+    'ConfirmationRequired': 'tool_executor',
+    'ProvisionWorkspaceTool': 'workspace_tools',
+    'ListWorkspacesTool': 'workspace_tools',
+    'StartWorkspaceTool': 'workspace_tools',
+    'StopWorkspaceTool': 'workspace_tools',
+    'TerminateWorkspaceTool': 'workspace_tools',
+    'GetCostSummaryTool': 'cost_tools',
+    'GetCostRecommendationsTool': 'cost_tools',
+    'CheckBudgetTool': 'cost_tools',
+    'RunDiagnosticsTool': 'cost_tools',
+    'CreateSupportTicketTool': 'support_tools',
+    'FallbackRouter': 'support_tools',
+    'LucySystemPrompt': 'system_prompt',
+    'PROMPT_TEMPLATES': 'system_prompt',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name from its submodule on first access.
+    
+    Args:
+        name: Attribute being looked up on the package
+        
+    Returns:
+        The exported object
+        
+    Raises:
+        AttributeError: If name is not exported by the package
+    """
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'ClaudeClient',
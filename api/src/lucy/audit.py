@@ -4,16 +4,156 @@ Logs every tool execution with user identity, action, and timestamp.
 Requirements: 6.7
 """
 
-from typing import Dict, Any, Optional
+from typing import Deque, Dict, Any, List, Mapping, Optional
+from collections import deque
 from datetime import datetime
+from types import MappingProxyType
+import atexit
 import logging
+import threading
 
-from ..audit.audit_logger import audit_log
+from prometheus_client import Counter
+from ..audit.audit_logger import audit_log, audit_log_bulk
 from ..models.audit_log import ActionType, ActionResult
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
+# Maximum audit events held in memory awaiting a flush
+AUDIT_BUFFER_SIZE = 10000
+
+# Maximum audit events written per bulk insert
+AUDIT_BATCH_SIZE = 256
+
+# Longest time a buffered audit event waits before being written
+AUDIT_FLUSH_INTERVAL_SECONDS = 1.0
+
+# Audit events evicted from a full buffer before they could be written
+AUDIT_EVENTS_DROPPED = Counter(
+    "lucy_audit_dropped",
+    "Lucy audit events dropped because the audit buffer was full or a write failed",
+)
+
+
+# Audit action type of each Lucy tool (unlisted tools are LUCY_ACTION)
+_TOOL_ACTION_TYPES: Mapping[str, ActionType] = MappingProxyType({
+    "provision_workspace": ActionType.LUCY_PROVISION,
+    "start_workspace": ActionType.LUCY_ACTION,
+    "stop_workspace": ActionType.LUCY_ACTION,
+    "terminate_workspace": ActionType.LUCY_ACTION,
+    "list_workspaces": ActionType.LUCY_QUERY,
+    "get_cost_summary": ActionType.LUCY_QUERY,
+    "get_cost_recommendations": ActionType.LUCY_QUERY,
+    "check_budget": ActionType.LUCY_QUERY,
+    "run_diagnostics": ActionType.LUCY_ACTION,
+    "create_support_ticket": ActionType.LUCY_ACTION,
+})
+
+
+class AuditEventBuffer:
+    """In-memory buffer that writes Lucy audit events in batches.
+    
+    Validates: Requirements 6.7
+    
+    Events are appended without touching the database. A background
+    flusher thread drains the buffer with one bulk insert per batch,
+    either when a full batch is waiting or every flush interval.
+    
+    Appending never blocks. If writes fall behind and the buffer fills,
+    the oldest unwritten event is dropped and counted instead. A batch
+    whose write fails is dropped and counted the same way.
+    """
+    
+    def __init__(
+        self,
+        max_size: int = AUDIT_BUFFER_SIZE,
+        batch_size: int = AUDIT_BATCH_SIZE,
+        flush_interval: float = AUDIT_FLUSH_INTERVAL_SECONDS,
+        start_flusher: bool = True,
+    ):
+        """Initialize audit event buffer.
+        
+        Args:
+            max_size: Maximum events held before the oldest are dropped
+            batch_size: Maximum events written per bulk insert
+            flush_interval: Seconds between periodic flushes
+            start_flusher: Start the background flusher on the first append
+                (when False, events are only written by explicit flushes)
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._flusher_enabled = start_flusher
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=max_size)
+        self.dropped_count = 0
+        self._wake = threading.Event()
+        
+        # Serializes flushes so batches are written (and hash-chained) in order
+        self._flush_lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+    
+    def append(self, event: Dict[str, Any]) -> None:
+        """Queue an audit event for the next flush.
+        
+        Args:
+            event: Keyword arguments for audit_log
+        """
+        if len(self._events) == self._events.maxlen:
+            # The deque evicts the oldest event on append
+            self.dropped_count += 1
+            AUDIT_EVENTS_DROPPED.inc()
+            logger.warning(f"lucy_audit_buffer_full dropped_count={self.dropped_count}")
+        self._events.append(event)
+        
+        if self._flusher is None and self._flusher_enabled:
+            self._start_flusher()
+        if len(self._events) >= self.batch_size:
+            self._wake.set()
+    
+    def flush(self) -> None:
+        """Write every buffered event, one bulk insert per batch."""
+        with self._flush_lock:
+            while self._events:
+                batch: List[Dict[str, Any]] = []
+                while self._events and len(batch) < self.batch_size:
+                    batch.append(self._events.popleft())
+                
+                try:
+                    audit_log_bulk(batch)
+                except Exception as e:
+                    # Log error but keep draining; callers never see audit failures
+                    self.dropped_count += len(batch)
+                    AUDIT_EVENTS_DROPPED.inc(len(batch))
+                    logger.error(
+                        f"Failed to write {len(batch)} Lucy audit events: {e} "
+                        f"dropped_count={self.dropped_count}",
+                        exc_info=True,
+                    )
+    
+    def _start_flusher(self) -> None:
+        """Start the background flusher thread once."""
+        with self._start_lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(
+                target=self._run_flusher,
+                name="lucy-audit-flusher",
+                daemon=True,
+            )
+            self._flusher.start()
+    
+    def _run_flusher(self) -> None:
+        """Flush the buffer whenever a batch fills or the interval elapses."""
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+
+# Global Lucy audit event buffer, drained on interpreter exit
+_audit_buffer = AuditEventBuffer()
+atexit.register(_audit_buffer.flush)
+
 
 class LucyAuditLogger:
     """Audit logger specifically for Lucy AI actions.
@@ -78,7 +218,7 @@ class LucyAuditLogger:
             }
             
             # Create audit log entry
-            audit_log(
+            self._record(
                 user_id=user_id,
                 action=f"lucy.tool.{tool_name}",
                 resource_type="lucy_tool",
@@ -89,6 +229,7 @@ class LucyAuditLogger:
                 user_agent=user_agent,
                 interface="LUCY",
                 metadata=metadata,
+                action_type=action_type,
                 db=db,
             )
             
@@ -125,7 +266,7 @@ class LucyAuditLogger:
                 "interface": "LUCY",
             }
             
-            audit_log(
+            self._record(
                 user_id=user_id,
                 action="lucy.conversation.start",
                 resource_type="lucy_conversation",
@@ -174,7 +315,7 @@ class LucyAuditLogger:
                 "interface": "LUCY",
             }
             
-            audit_log(
+            self._record(
                 user_id=user_id,
                 action="lucy.conversation.end",
                 resource_type="lucy_conversation",
@@ -226,7 +367,7 @@ class LucyAuditLogger:
                 "interface": "LUCY",
             }
             
-            audit_log(
+            self._record(
                 user_id=user_id,
                 action="lucy.query",
                 resource_type="lucy_query",
@@ -236,6 +377,7 @@ class LucyAuditLogger:
                 user_agent=user_agent,
                 interface="LUCY",
                 metadata=metadata,
+                action_type=ActionType.LUCY_QUERY,
                 db=db,
             )
             
@@ -278,7 +420,7 @@ class LucyAuditLogger:
                 "interface": "LUCY",
             }
             
-            audit_log(
+            self._record(
                 user_id=user_id,
                 action="lucy.rate_limit_exceeded",
                 resource_type="lucy_tool",
@@ -338,7 +480,7 @@ class LucyAuditLogger:
                 "interface": "LUCY",
             }
             
-            audit_log(
+            self._record(
                 user_id=user_id,
                 action="lucy.budget_denial",
                 resource_type="lucy_tool",
@@ -394,7 +536,7 @@ class LucyAuditLogger:
                 "interface": "LUCY",
             }
             
-            audit_log(
+            self._record(
                 user_id=user_id,
                 action="lucy.rbac_denial",
                 resource_type="lucy_tool",
@@ -416,6 +558,29 @@ class LucyAuditLogger:
         except Exception as e:
             logger.error(f"Failed to log Lucy RBAC denial: {e}", exc_info=True)
     
+    def _record(self, db: Optional[Session] = None, **event: Any) -> None:
+        """Record an audit event.
+        
+        Events are buffered and written in batches. An explicit database
+        session belongs to the caller's request, so events that carry one
+        are written immediately in that session instead.
+        
+        A buffered entry is timestamped when it is written, so the time the
+        event happened is kept in its context as occurred_at.
+        
+        Args:
+            db: Database session
+            **event: Keyword arguments for audit_log
+        """
+        event["metadata"] = {
+            **(event.get("metadata") or {}),
+            "occurred_at": datetime.utcnow().isoformat(),
+        }
+        if db is not None:
+            audit_log(db=db, **event)
+        else:
+            _audit_buffer.append(event)
+    
     def _map_tool_to_action_type(self, tool_name: str) -> ActionType:
         """Map tool name to action type.
         
@@ -425,20 +590,7 @@ class LucyAuditLogger:
         Returns:
             Corresponding ActionType
         """
-        tool_action_map = {
-            "provision_workspace": ActionType.LUCY_PROVISION,
-            "start_workspace": ActionType.LUCY_ACTION,
-            "stop_workspace": ActionType.LUCY_ACTION,
-            "terminate_workspace": ActionType.LUCY_ACTION,
-            "list_workspaces": ActionType.LUCY_QUERY,
-            "get_cost_summary": ActionType.LUCY_QUERY,
-            "get_cost_recommendations": ActionType.LUCY_QUERY,
-            "check_budget": ActionType.LUCY_QUERY,
-            "run_diagnostics": ActionType.LUCY_ACTION,
-            "create_support_ticket": ActionType.LUCY_ACTION,
-        }
-        
-        return tool_action_map.get(tool_name, ActionType.LUCY_ACTION)
+        return _TOOL_ACTION_TYPES.get(tool_name, ActionType.LUCY_ACTION)
 
 
 # Global Lucy audit logger instance
@@ -571,3 +723,8 @@ def log_lucy_rbac_denial(
         user_role=user_role,
         **kwargs
     )
+
+
+def flush_lucy_audit_log() -> None:
+    """Write all buffered Lucy audit events now."""
+    _audit_buffer.flush()
@@ -6,7 +6,6 @@ Requirements: 6.1, 6.2
 
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
-import json
 import redis
 from pydantic import BaseModel
 
@@ -70,6 +69,29 @@ class ConversationContextManager:
     ) -> ConversationContext:
         """Create a new conversation context.
         
+        Args:
+            user_id: User identifier
+            session_id: Session identifier
+            workspace_context: Optional workspace ID being discussed
+            
+        Returns:
+            New ConversationContext instance
+        """
+        context = self._new_context(user_id, session_id, workspace_context)
+        
+        # Store in Redis with TTL
+        self._save_context(context)
+        
+        return context
+    
+    def _new_context(
+        self,
+        user_id: str,
+        session_id: str,
+        workspace_context: Optional[str] = None
+    ) -> ConversationContext:
+        """Build a new conversation context without storing it.
+        
         Args:
             user_id: User identifier
             session_id: Session identifier
@@ -79,18 +101,13 @@ class ConversationContextManager:
             New ConversationContext instance
         """
         now = datetime.utcnow()
-        context = ConversationContext(
+        return ConversationContext(
             user_id=user_id,
             session_id=session_id,
             workspace_context=workspace_context,
             created_at=now,
             last_activity=now
         )
-        
-        # Store in Redis with TTL
-        self._save_context(context)
-        
-        return context
     
     def get_context(
         self,
@@ -112,18 +129,8 @@ class ConversationContextManager:
         if not data:
             return None
         
-        # Deserialize from JSON
-        context_dict = json.loads(data)
-        
-        # Convert ISO format strings back to datetime
-        context_dict['created_at'] = datetime.fromisoformat(context_dict['created_at'])
-        context_dict['last_activity'] = datetime.fromisoformat(context_dict['last_activity'])
-        
-        # Convert message timestamps
-        for msg in context_dict.get('messages', []):
-            msg['timestamp'] = datetime.fromisoformat(msg['timestamp'])
-        
-        context = ConversationContext(**context_dict)
+        # Validate straight from JSON, parsing datetimes in the same pass
+        context = ConversationContext.model_validate_json(data)
         
         # Check if expired
         if context.is_expired():
@@ -155,8 +162,8 @@ class ConversationContextManager:
         context = self.get_context(user_id, session_id)
         
         if not context:
-            # Create new context if none exists
-            context = self.create_context(user_id, session_id)
+            # Create new context if none exists; it is stored once below
+            context = self._new_context(user_id, session_id)
         
         # Add message
         message = Message(
@@ -193,7 +200,7 @@ class ConversationContextManager:
         context = self.get_context(user_id, session_id)
         
         if not context:
-            context = self.create_context(user_id, session_id)
+            context = self._new_context(user_id, session_id)
         
         context.intent_history.append(intent)
         context.last_activity = datetime.utcnow()
@@ -4,10 +4,31 @@ Parses user requests to identify intent and map to appropriate tools.
 Requirements: 5.3, 5.4, 5.5
 """
 
-from typing import Dict, Any, Optional, List, Tuple
+from collections.abc import Iterable, Iterator
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List, Tuple
 from enum import Enum
+import functools
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+
+
+# Bundle types in extraction priority order
+BUNDLE_TYPES = ("STANDARD", "PERFORMANCE", "POWER", "POWERPRO", "GRAPHICS_G4DN", "GRAPHICSPRO_G4DN")
+
+# Lowercase spelling (with "_" or " ") -> (priority, bundle type)
+_BUNDLE_SPELLINGS = {}
+for _priority, _bundle in enumerate(BUNDLE_TYPES):
+    for _spelling in (_bundle.lower(), _bundle.replace("_", " ").lower()):
+        _BUNDLE_SPELLINGS.setdefault(_spelling, (_priority, _bundle))
+
+# Entity patterns compiled once and matched in a single pass each
+_BUNDLE_PATTERN = re.compile("|".join(re.escape(spelling) for spelling in _BUNDLE_SPELLINGS))
+# Possessive id run (Python 3.11+): backing off inside an alphanumeric run can
+# never satisfy the trailing \b, so there is nothing worth backtracking into
+_WORKSPACE_ID_PATTERN = re.compile(r'\b(ws-|workspace-)([a-zA-Z0-9]++)\b', re.IGNORECASE)
+_TEAM_PATTERN = re.compile(r'\bteam[:\s]+([a-zA-Z0-9-]+)\b')
+_PROJECT_PATTERN = re.compile(r'\bproject[:\s]+([a-zA-Z0-9-]+)\b')
 
 
 class Intent(str, Enum):
@@ -45,10 +66,245 @@ class Intent(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Recommended bundles (ordered by preference) for each recommendation rule
+_BUNDLE_RECOMMENDATIONS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "gpu_high": ("GRAPHICSPRO_G4DN", "GRAPHICS_G4DN"),
+    "gpu": ("GRAPHICS_G4DN",),
+    "high_compute": ("POWERPRO", "POWER", "GRAPHICS_G4DN"),  # GPU can help with ML
+    "high": ("POWER", "POWERPRO"),
+    "low": ("STANDARD", "PERFORMANCE"),
+    "medium": ("PERFORMANCE", "POWER"),
+})
+
+
+# Intents that act on a single workspace and so need its ID
+_WORKSPACE_INTENTS = frozenset({
+    Intent.START_WORKSPACE,
+    Intent.STOP_WORKSPACE,
+    Intent.TERMINATE_WORKSPACE,
+    Intent.RUN_DIAGNOSTICS,
+})
+
+# Intents whose queries can be scoped to a time period
+_PERIOD_INTENTS = frozenset({Intent.GET_COST_SUMMARY, Intent.CHECK_BUDGET})
+
+
+# Human-readable description of each bundle type
+_BUNDLE_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
+    "STANDARD": "Standard (2 vCPU, 8 GB RAM) - Good for light development and general tasks",
+    "PERFORMANCE": "Performance (8 vCPU, 32 GB RAM) - Good for most development workloads",
+    "POWER": "Power (16 vCPU, 64 GB RAM) - Good for intensive workloads and data processing",
+    "POWERPRO": "PowerPro (32 vCPU, 128 GB RAM) - Best for very demanding workloads",
+    "GRAPHICS_G4DN": "Graphics (16 vCPU, 64 GB RAM, NVIDIA T4 GPU) - Good for GPU workloads, ML, and graphics",
+    "GRAPHICSPRO_G4DN": "GraphicsPro (64 vCPU, 256 GB RAM, NVIDIA T4 GPU) - Best for intensive GPU workloads",
+})
+
+
+# Bundle type keywords for recommendations
+_BUNDLE_KEYWORDS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "gpu": ("GRAPHICS_G4DN", "GRAPHICSPRO_G4DN"),
+    "graphics": ("GRAPHICS_G4DN", "GRAPHICSPRO_G4DN"),
+    "simulation": ("GRAPHICS_G4DN", "GRAPHICSPRO_G4DN"),
+    "ml": ("GRAPHICS_G4DN", "POWER", "POWERPRO"),
+    "machine learning": ("GRAPHICS_G4DN", "POWER", "POWERPRO"),
+    "ai": ("GRAPHICS_G4DN", "POWER", "POWERPRO"),
+    "heavy": ("POWER", "POWERPRO"),
+    "intensive": ("POWER", "POWERPRO"),
+    "light": ("STANDARD",),
+    "basic": ("STANDARD",),
+    "standard": ("STANDARD",),
+    "medium": ("PERFORMANCE",),
+    "moderate": ("PERFORMANCE",),
+})
+
+
+# Intent patterns in match priority order: (intent, patterns, tool_name)
+_PATTERN_DEFINITIONS: List[Tuple[Intent, List[str], Optional[str]]] = [
+    # Greeting patterns (check first - very specific)
+    (Intent.GREETING, [
+        r"^(hi|hello|hey|greetings)(\s|$)",
+    ], None),
+    
+    # Help patterns (check early)
+    (Intent.HELP, [
+        r"^(help|what can you do|capabilities|commands)(\s|$)",
+        r"^how\s+(do i|can i|to)(?!.*(workspace|workstation|desktop))",
+    ], None),
+    
+    # Start workspace patterns (more specific than provision)
+    (Intent.START_WORKSPACE, [
+        r"\b(start|boot|power on|turn on|wake)\s*(workspace|workstation|desktop|ws-|workspace-)",
+        r"\b(start|resume)\s+(ws-|workspace-)[a-zA-Z0-9]+\b",
+    ], "start_workspace"),
+    
+    # Stop workspace patterns (more specific than provision)
+    (Intent.STOP_WORKSPACE, [
+        r"\b(stop|shutdown|power off|turn off|pause)\s*(workspace|workstation|desktop|ws-|workspace-)",
+        r"\b(stop|halt)\s+(ws-|workspace-)[a-zA-Z0-9]+\b",
+    ], "stop_workspace"),
+    
+    # Terminate workspace patterns
+    (Intent.TERMINATE_WORKSPACE, [
+        r"\b(terminate|delete|destroy|remove)\s*(workspace|workstation|desktop|ws-|workspace-)",
+        r"\b(terminate|delete)\s+(ws-|workspace-)[a-zA-Z0-9]+\b",
+    ], "terminate_workspace"),
+    
+    # Get workspace status patterns
+    (Intent.GET_WORKSPACE_STATUS, [
+        r"\b(status|state|info|details|describe)\s+(of\s+)?(my\s+)?(workspace|workstation|desktop)\b",
+        r"\bwhat.*(status|state).*(workspace|workstation|desktop)\b",
+        r"\b(check|show)\s+(ws-|workspace-)[a-zA-Z0-9]+\s+(status|state|info)\b",
+    ], "list_workspaces"),
+    
+    # Provision workspace patterns (check after start/stop/terminate)
+    (Intent.PROVISION_WORKSPACE, [
+        r"\b(provision|create|launch|spin up)\s*(a\s+|an\s+)?(workspace|workstation|desktop|machine|environment)\b",
+        r"\b(get me|give me|set up)\s*(a\s+|an\s+)?(workspace|workstation|desktop)\b",
+        r"\bi need\s+(a|an)\s+(workspace|workstation|desktop)\b",
+    ], "provision_workspace"),
+    
+    # Recommend bundle patterns (Req 5.3)
+    (Intent.RECOMMEND_BUNDLE, [
+        r"\b(recommend|suggest|which|what)\s*(bundle|configuration|spec|hardware)\b",
+        r"\bwhat\s+(bundle|configuration|spec).*(should|do|need)\b",
+        r"\b(best|right|appropriate)\s*(bundle|configuration)\b",
+        r"\bhelp me\s+(choose|pick|select)\s*(bundle|configuration)\b",
+    ], None),
+    
+    # List workspaces patterns (Req 5.5)
+    (Intent.LIST_WORKSPACES, [
+        r"\b(list|show|display|get|view)\s*(my\s+)?(workspace|workstation|desktop)s?\b",
+        r"\bwhat\s+(workspace|workstation|desktop)s?\s+(do i have|are running)\b",
+        r"\b(my|all)\s+(workspace|workstation|desktop)s?\b",
+    ], "list_workspaces"),
+    
+    # Cost summary patterns (Req 5.6) - more specific
+    (Intent.GET_COST_SUMMARY, [
+        r"\b(cost|spend|spending|expense|bill|billing)s?\b",
+        r"\bhow much.*(cost|spend|spent|pay|paying)\b",
+        r"\b(show|get|view)\s*(my\s+)?(cost|spend|spending|expense)s?\b",
+        r"\bwhat.*(cost|spend|spending)\b",
+    ], "get_cost_summary"),
+    
+    # Cost recommendations patterns (Req 5.6)
+    (Intent.GET_COST_RECOMMENDATIONS, [
+        r"\b(cost\s+)?(optimization|optimize|save|saving|reduce|reducing)\b",
+        r"\b(recommend|suggest).*(cost|save|saving)\b",
+        r"\bhow\s+(can i|to)\s+(save|reduce).*(cost|money)\b",
+    ], "get_cost_recommendations"),
+    
+    # Budget check patterns (Req 5.6)
+    (Intent.CHECK_BUDGET, [
+        r"\b(budget|quota|limit|allowance)\b",
+        r"\bhow much.*(budget|quota|left|remaining)\b",
+        r"\b(check|show|view).*(budget|quota)\b",
+    ], "check_budget"),
+    
+    # Diagnostics patterns (Req 5.7)
+    (Intent.RUN_DIAGNOSTICS, [
+        r"\b(diagnose|diagnostic)\s*(workspace|workstation|desktop)\b",
+        r"\b(run|perform).*(diagnostic|check|test)\b",
+        r"\bwhat.*(wrong|problem|issue).*(workspace|workstation|desktop)\b",
+        r"\b(check|test)\s+(workspace|workstation|desktop)\b",
+    ], "run_diagnostics"),
+    
+    # Troubleshoot patterns (Req 5.7)
+    (Intent.TROUBLESHOOT, [
+        r"\b(not working|broken|issue|problem|error|fail)\b",
+        r"\bcan'?t\s+(connect|access|start|use)\b",
+        r"\b(slow|laggy|unresponsive)\b",
+    ], "run_diagnostics"),
+    
+    # Support ticket patterns (Req 5.8) - check after help
+    (Intent.CREATE_SUPPORT_TICKET, [
+        r"\b(support|ticket|escalate)\b",
+        r"\b(talk to|speak to|reach)\s+(human|person|support|admin)\b",
+        r"\bneed\s+(help|assistance)\s+(from|with)\b",
+        r"\bcreate\s+(a\s+)?support\s+ticket\b",
+    ], "create_support_ticket"),
+]
+
+# Patterns compiled once at import time; recognizers share them by reference
+_PATTERNS: Tuple[Tuple[Intent, Tuple["re.Pattern[str]", ...]], ...] = tuple(
+    (intent, tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns))
+    for intent, patterns, _ in _PATTERN_DEFINITIONS
+)
+
+# Tool executed for each intent; intents without a tool are absent
+_INTENT_TO_TOOL: Mapping[Intent, str] = MappingProxyType({
+    intent: tool_name
+    for intent, _, tool_name in _PATTERN_DEFINITIONS
+    if tool_name is not None
+})
+
+
+def _build_fused_regex() -> "re.Pattern[str]":
+    """Fuse every intent pattern into one alternation with a named group per intent.
+    
+    Returns:
+        Compiled pattern that matches wherever any intent pattern matches
+    """
+    groups = (
+        f"(?P<{intent.name}>{'|'.join(f'(?:{pattern})' for pattern in patterns)})"
+        for intent, patterns, _ in _PATTERN_DEFINITIONS
+    )
+    return re.compile("|".join(groups), re.IGNORECASE)
+
+
+# Single-scan check for whether a message matches any intent at all
+_FUSED = _build_fused_regex()
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Entities(Mapping):
+    """Entities extracted from a request.
+    
+    A fixed set of optional fields that reads like a dict of the entities
+    that were found: entities.get("bundle_type"), "workspace_id" in entities
+    and entities["period"] all work, and fields left as None are absent.
+    
+    Attributes:
+        workspace_id: Workspace ID mentioned in the request
+        bundle_type: Bundle type mentioned in the request
+        requirements: Bundle requirements (read-only) for recommendations
+        period: Time period for cost and budget queries
+        team_id: Team identifier
+        project_id: Project identifier
+    """
+    workspace_id: Optional[str] = None
+    bundle_type: Optional[str] = None
+    requirements: Optional[Mapping[str, Any]] = None
+    period: Optional[str] = None
+    team_id: Optional[str] = None
+    project_id: Optional[str] = None
+    
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, key, None) if key in _ENTITY_NAMES else None
+        if value is None:
+            raise KeyError(key)
+        return value
+    
+    def __iter__(self) -> Iterator[str]:
+        return (name for name in _ENTITY_NAMES if getattr(self, name) is not None)
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+# Entity field names in extraction order
+_ENTITY_NAMES: Tuple[str, ...] = tuple(field.name for field in fields(Entities))
+
+# Shared instance for results without entities
+_NO_ENTITIES = Entities()
+
+
+@dataclass(frozen=True, slots=True)
 class RecognizedIntent:
     """Result of intent recognition.
     
+    Immutable all the way down (entities included), so cached results are
+    handed out as-is.
+    
     Attributes:
         intent: The recognized intent
         confidence: Confidence score (0.0 to 1.0)
@@ -59,12 +315,22 @@ class RecognizedIntent:
     """
     intent: Intent
     confidence: float
-    entities: Dict[str, Any]
+    entities: Entities
     tool_name: Optional[str] = None
     ambiguous: bool = False
     clarification_needed: Optional[str] = None
 
 
+# Shared result for messages that match no intent
+_UNKNOWN_RESULT = RecognizedIntent(
+    intent=Intent.UNKNOWN,
+    confidence=0.0,
+    entities=_NO_ENTITIES,
+    ambiguous=True,
+    clarification_needed="I'm not sure what you're asking for. Could you rephrase your request?"
+)
+
+
 class IntentRecognizer:
     """Recognizes user intent from natural language requests.
     
@@ -80,144 +346,68 @@ class IntentRecognizer:
     - Semantic similarity matching
     """
     
-    def __init__(self):
-        """Initialize intent recognizer with pattern definitions."""
-        # Intent patterns: (intent, patterns, tool_name)
-        self.patterns = self._build_patterns()
-        
-        # Bundle type keywords for recommendations
-        self.bundle_keywords = {
-            "gpu": ["GRAPHICS_G4DN", "GRAPHICSPRO_G4DN"],
-            "graphics": ["GRAPHICS_G4DN", "GRAPHICSPRO_G4DN"],
-            "simulation": ["GRAPHICS_G4DN", "GRAPHICSPRO_G4DN"],
-            "ml": ["GRAPHICS_G4DN", "POWER", "POWERPRO"],
-            "machine learning": ["GRAPHICS_G4DN", "POWER", "POWERPRO"],
-            "ai": ["GRAPHICS_G4DN", "POWER", "POWERPRO"],
-            "heavy": ["POWER", "POWERPRO"],
-            "intensive": ["POWER", "POWERPRO"],
-            "light": ["STANDARD"],
-            "basic": ["STANDARD"],
-            "standard": ["STANDARD"],
-            "medium": ["PERFORMANCE"],
-            "moderate": ["PERFORMANCE"]
-        }
-    
-    def _build_patterns(self) -> List[Tuple[Intent, List[str], Optional[str]]]:
-        """Build intent recognition patterns.
+    __slots__ = ("patterns", "max_scan_length", "bundle_keywords", "_recognize_cached")
+    
+    # Maximum distinct messages kept in the recognition cache
+    RECOGNITION_CACHE_SIZE = 256
+    
+    # Default number of leading characters scanned for intent patterns
+    MAX_SCAN_LENGTH = 512
+    
+    def __init__(self, max_scan_length: int = MAX_SCAN_LENGTH):
+        """Initialize intent recognizer with pattern definitions.
         
-        Returns:
-            List of (intent, patterns, tool_name) tuples
+        Args:
+            max_scan_length: Number of leading characters of a message that
+                are scanned for intent patterns. Intent cues sit at the start
+                of a request, and bounding the scan keeps the cost of the
+                .*-style patterns independent of message length.
         """
-        return [
-            # Greeting patterns (check first - very specific)
-            (Intent.GREETING, [
-                r"^(hi|hello|hey|greetings)(\s|$)",
-            ], None),
-            
-            # Help patterns (check early)
-            (Intent.HELP, [
-                r"^(help|what can you do|capabilities|commands)(\s|$)",
-                r"^how\s+(do i|can i|to)(?!.*(workspace|workstation|desktop))",
-            ], None),
-            
-            # Start workspace patterns (more specific than provision)
-            (Intent.START_WORKSPACE, [
-                r"\b(start|boot|power on|turn on|wake)\s*(workspace|workstation|desktop|ws-|workspace-)",
-                r"\b(start|resume)\s+(ws-|workspace-)[a-zA-Z0-9]+\b",
-            ], "start_workspace"),
-            
-            # Stop workspace patterns (more specific than provision)
-            (Intent.STOP_WORKSPACE, [
-                r"\b(stop|shutdown|power off|turn off|pause)\s*(workspace|workstation|desktop|ws-|workspace-)",
-                r"\b(stop|halt)\s+(ws-|workspace-)[a-zA-Z0-9]+\b",
-            ], "stop_workspace"),
-            
-            # Terminate workspace patterns
-            (Intent.TERMINATE_WORKSPACE, [
-                r"\b(terminate|delete|destroy|remove)\s*(workspace|workstation|desktop|ws-|workspace-)",
-                r"\b(terminate|delete)\s+(ws-|workspace-)[a-zA-Z0-9]+\b",
-            ], "terminate_workspace"),
-            
-            # Get workspace status patterns
-            (Intent.GET_WORKSPACE_STATUS, [
-                r"\b(status|state|info|details|describe)\s+(of\s+)?(my\s+)?(workspace|workstation|desktop)\b",
-                r"\bwhat.*(status|state).*(workspace|workstation|desktop)\b",
-                r"\b(check|show)\s+(ws-|workspace-)[a-zA-Z0-9]+\s+(status|state|info)\b",
-            ], "list_workspaces"),
-            
-            # Provision workspace patterns (check after start/stop/terminate)
-            (Intent.PROVISION_WORKSPACE, [
-                r"\b(provision|create|launch|spin up)\s*(a\s+|an\s+)?(workspace|workstation|desktop|machine|environment)\b",
-                r"\b(get me|give me|set up)\s*(a\s+|an\s+)?(workspace|workstation|desktop)\b",
-                r"\bi need\s+(a|an)\s+(workspace|workstation|desktop)\b",
-            ], "provision_workspace"),
-            
-            # Recommend bundle patterns (Req 5.3)
-            (Intent.RECOMMEND_BUNDLE, [
-                r"\b(recommend|suggest|which|what)\s*(bundle|configuration|spec|hardware)\b",
-                r"\bwhat\s+(bundle|configuration|spec).*(should|do|need)\b",
-                r"\b(best|right|appropriate)\s*(bundle|configuration)\b",
-                r"\bhelp me\s+(choose|pick|select)\s*(bundle|configuration)\b",
-            ], None),
-            
-            # List workspaces patterns (Req 5.5)
-            (Intent.LIST_WORKSPACES, [
-                r"\b(list|show|display|get|view)\s*(my\s+)?(workspace|workstation|desktop)s?\b",
-                r"\bwhat\s+(workspace|workstation|desktop)s?\s+(do i have|are running)\b",
-                r"\b(my|all)\s+(workspace|workstation|desktop)s?\b",
-            ], "list_workspaces"),
-            
-            # Cost summary patterns (Req 5.6) - more specific
-            (Intent.GET_COST_SUMMARY, [
-                r"\b(cost|spend|spending|expense|bill|billing)s?\b",
-                r"\bhow much.*(cost|spend|spent|pay|paying)\b",
-                r"\b(show|get|view)\s*(my\s+)?(cost|spend|spending|expense)s?\b",
-                r"\bwhat.*(cost|spend|spending)\b",
-            ], "get_cost_summary"),
-            
-            # Cost recommendations patterns (Req 5.6)
-            (Intent.GET_COST_RECOMMENDATIONS, [
-                r"\b(cost\s+)?(optimization|optimize|save|saving|reduce|reducing)\b",
-                r"\b(recommend|suggest).*(cost|save|saving)\b",
-                r"\bhow\s+(can i|to)\s+(save|reduce).*(cost|money)\b",
-            ], "get_cost_recommendations"),
-            
-            # Budget check patterns (Req 5.6)
-            (Intent.CHECK_BUDGET, [
-                r"\b(budget|quota|limit|allowance)\b",
-                r"\bhow much.*(budget|quota|left|remaining)\b",
-                r"\b(check|show|view).*(budget|quota)\b",
-            ], "check_budget"),
-            
-            # Diagnostics patterns (Req 5.7)
-            (Intent.RUN_DIAGNOSTICS, [
-                r"\b(diagnose|diagnostic)\s*(workspace|workstation|desktop)\b",
-                r"\b(run|perform).*(diagnostic|check|test)\b",
-                r"\bwhat.*(wrong|problem|issue).*(workspace|workstation|desktop)\b",
-                r"\b(check|test)\s+(workspace|workstation|desktop)\b",
-            ], "run_diagnostics"),
-            
-            # Troubleshoot patterns (Req 5.7)
-            (Intent.TROUBLESHOOT, [
-                r"\b(not working|broken|issue|problem|error|fail)\b",
-                r"\bcan'?t\s+(connect|access|start|use)\b",
-                r"\b(slow|laggy|unresponsive)\b",
-            ], "run_diagnostics"),
-            
-            # Support ticket patterns (Req 5.8) - check after help
-            (Intent.CREATE_SUPPORT_TICKET, [
-                r"\b(support|ticket|escalate)\b",
-                r"\b(talk to|speak to|reach)\s+(human|person|support|admin)\b",
-                r"\bneed\s+(help|assistance)\s+(from|with)\b",
-                r"\bcreate\s+(a\s+)?support\s+ticket\b",
-            ], "create_support_ticket"),
-        ]
+        # Intent patterns: (intent, compiled patterns)
+        self.patterns = _PATTERNS
+        self.max_scan_length = max_scan_length
+        
+        # Recognition is a pure function of the message, so repeated
+        # messages are served from a per-instance cache
+        self._recognize_cached = functools.lru_cache(
+            maxsize=self.RECOGNITION_CACHE_SIZE
+        )(self._recognize_message)
+        
+        # Bundle type keywords for recommendations
+        self.bundle_keywords = _BUNDLE_KEYWORDS
     
     def recognize(self, user_message: str) -> RecognizedIntent:
         """Recognize intent from user message.
         
         Validates: Requirements 5.3, 5.4, 5.5
         
+        Args:
+            user_message: User's natural language request
+            
+        Returns:
+            RecognizedIntent with identified intent and extracted entities
+        """
+        # Empty and whitespace-only messages cannot match any intent
+        if not user_message or user_message.isspace():
+            return _UNKNOWN_RESULT
+        
+        return self._recognize_cached(user_message)
+    
+    def recognize_many(self, user_messages: Iterable[str]) -> List[RecognizedIntent]:
+        """Recognize intent for a batch of user messages.
+        
+        Args:
+            user_messages: User natural language requests
+            
+        Returns:
+            RecognizedIntent for each message, in input order
+        """
+        recognize = self.recognize
+        return [recognize(user_message) for user_message in user_messages]
+    
+    def _recognize_message(self, user_message: str) -> RecognizedIntent:
+        """Recognize intent from user message without caching.
+        
         Args:
             user_message: User's natural language request
             
@@ -225,35 +415,34 @@ class IntentRecognizer:
             RecognizedIntent with identified intent and extracted entities
         """
         message_lower = user_message.lower()
+        scan_text = message_lower[:self.max_scan_length]
+        
+        # One fused scan rules out messages that match no intent at all
+        if _FUSED.search(scan_text) is None:
+            return _UNKNOWN_RESULT
         
         # Try to match patterns
         matches = []
-        for intent, patterns, tool_name in self.patterns:
+        for intent, patterns in self.patterns:
             for pattern in patterns:
-                if re.search(pattern, message_lower, re.IGNORECASE):
-                    matches.append((intent, tool_name, self._calculate_confidence(pattern, message_lower)))
+                if pattern.search(scan_text):
+                    matches.append((intent, self._calculate_confidence(pattern, message_lower)))
                     break
         
         # If no matches, return unknown intent
         if not matches:
-            return RecognizedIntent(
-                intent=Intent.UNKNOWN,
-                confidence=0.0,
-                entities={},
-                ambiguous=True,
-                clarification_needed="I'm not sure what you're asking for. Could you rephrase your request?"
-            )
+            return _UNKNOWN_RESULT
         
         # Sort by confidence and get best match
-        matches.sort(key=lambda x: x[2], reverse=True)
-        best_intent, tool_name, confidence = matches[0]
+        matches.sort(key=lambda x: x[1], reverse=True)
+        best_intent, confidence = matches[0]
         
         # Check for ambiguity (multiple high-confidence matches)
-        if len(matches) > 1 and matches[1][2] > 0.7:
+        if len(matches) > 1 and matches[1][1] > 0.7:
             return self._handle_ambiguous_intent(matches, user_message)
         
         # Extract entities based on intent
-        entities = self._extract_entities(best_intent, user_message)
+        entities = self._extract_entities(best_intent, user_message, message_lower)
         
         # Check if we need clarification
         clarification = self._check_clarification_needed(best_intent, entities)
@@ -262,16 +451,16 @@ class IntentRecognizer:
             intent=best_intent,
             confidence=confidence,
             entities=entities,
-            tool_name=tool_name,
+            tool_name=_INTENT_TO_TOOL.get(best_intent),
             ambiguous=clarification is not None,
             clarification_needed=clarification
         )
     
-    def _calculate_confidence(self, pattern: str, message: str) -> float:
+    def _calculate_confidence(self, pattern: "re.Pattern[str]", message: str) -> float:
         """Calculate confidence score for a pattern match.
         
         Args:
-            pattern: Regex pattern that matched
+            pattern: Compiled regex pattern that matched
             message: User message
             
         Returns:
@@ -281,32 +470,32 @@ class IntentRecognizer:
         confidence = 0.8
         
         # Increase confidence for exact matches
-        if re.fullmatch(pattern, message, re.IGNORECASE):
+        if pattern.fullmatch(message):
             confidence = 1.0
         
         # Increase confidence for longer patterns (more specific)
-        if len(pattern) > 50:
+        if len(pattern.pattern) > 50:
             confidence = min(1.0, confidence + 0.1)
         
         return confidence
     
     def _handle_ambiguous_intent(
         self,
-        matches: List[Tuple[Intent, Optional[str], float]],
+        matches: List[Tuple[Intent, float]],
         user_message: str
     ) -> RecognizedIntent:
         """Handle ambiguous intent with multiple high-confidence matches.
         
         Args:
-            matches: List of (intent, tool_name, confidence) tuples
+            matches: List of (intent, confidence) tuples
             user_message: Original user message
             
         Returns:
             RecognizedIntent with ambiguity information
         """
         # Get top 2 intents
-        intent1, tool1, conf1 = matches[0]
-        intent2, tool2, conf2 = matches[1]
+        intent1, conf1 = matches[0]
+        intent2, conf2 = matches[1]
         
         # Build clarification message
         clarification = (
@@ -317,57 +506,61 @@ class IntentRecognizer:
         return RecognizedIntent(
             intent=intent1,  # Use best match as default
             confidence=conf1,
-            entities={},
-            tool_name=tool1,
+            entities=_NO_ENTITIES,
+            tool_name=_INTENT_TO_TOOL.get(intent1),
             ambiguous=True,
             clarification_needed=clarification
         )
     
-    def _extract_entities(self, intent: Intent, message: str) -> Dict[str, Any]:
+    def _extract_entities(
+        self,
+        intent: Intent,
+        message: str,
+        message_lower: str
+    ) -> Entities:
         """Extract entities from message based on intent.
         
         Args:
             intent: Recognized intent
-            message: User message
+            message: User message (original case, for case-preserving entities)
+            message_lower: User message lowercased once by recognize()
             
         Returns:
-            Dictionary of extracted entities
+            Extracted entities
         """
-        entities = {}
-        message_lower = message.lower()
-        
         # Extract workspace ID if present - improved regex
-        workspace_id_match = re.search(r'\b(ws-|workspace-)([a-zA-Z0-9]+)\b', message, re.IGNORECASE)
-        if workspace_id_match:
-            entities["workspace_id"] = workspace_id_match.group(0)
+        workspace_id_match = _WORKSPACE_ID_PATTERN.search(message)
+        workspace_id = workspace_id_match.group(0) if workspace_id_match else None
         
-        # Extract bundle type if mentioned
-        bundle_types = ["STANDARD", "PERFORMANCE", "POWER", "POWERPRO", "GRAPHICS_G4DN", "GRAPHICSPRO_G4DN"]
-        for bundle in bundle_types:
-            if bundle.lower() in message_lower or bundle.replace("_", " ").lower() in message_lower:
-                entities["bundle_type"] = bundle
-                break
+        # Extract bundle type if mentioned (highest-priority bundle wins)
+        bundle_matches = [
+            _BUNDLE_SPELLINGS[match.group(0)]
+            for match in _BUNDLE_PATTERN.finditer(message_lower)
+        ]
+        bundle_type = min(bundle_matches)[1] if bundle_matches else None
         
         # Extract bundle requirements for recommendations
+        requirements = None
         if intent == Intent.RECOMMEND_BUNDLE:
-            entities["requirements"] = self._extract_bundle_requirements(message_lower)
+            requirements = MappingProxyType(self._extract_bundle_requirements(message_lower))
         
         # Extract time period for cost queries
-        if intent in [Intent.GET_COST_SUMMARY, Intent.CHECK_BUDGET]:
+        period = None
+        if intent in _PERIOD_INTENTS:
             period = self._extract_time_period(message_lower)
-            if period:
-                entities["period"] = period
         
         # Extract team/project identifiers
-        team_match = re.search(r'\bteam[:\s]+([a-zA-Z0-9-]+)\b', message_lower)
-        if team_match:
-            entities["team_id"] = team_match.group(1)
-        
-        project_match = re.search(r'\bproject[:\s]+([a-zA-Z0-9-]+)\b', message_lower)
-        if project_match:
-            entities["project_id"] = project_match.group(1)
-        
-        return entities
+        team_match = _TEAM_PATTERN.search(message_lower)
+        project_match = _PROJECT_PATTERN.search(message_lower)
+        
+        return Entities(
+            workspace_id=workspace_id,
+            bundle_type=bundle_type,
+            requirements=requirements,
+            period=period,
+            team_id=team_match.group(1) if team_match else None,
+            project_id=project_match.group(1) if project_match else None,
+        )
     
     def _extract_bundle_requirements(self, message: str) -> Dict[str, Any]:
         """Extract bundle requirements from message for recommendations.
@@ -436,7 +629,7 @@ class IntentRecognizer:
     def _check_clarification_needed(
         self,
         intent: Intent,
-        entities: Dict[str, Any]
+        entities: Entities
     ) -> Optional[str]:
         """Check if clarification is needed for the intent.
         
@@ -448,14 +641,7 @@ class IntentRecognizer:
             Clarification message or None
         """
         # Check if workspace-specific intents have workspace ID
-        workspace_intents = [
-            Intent.START_WORKSPACE,
-            Intent.STOP_WORKSPACE,
-            Intent.TERMINATE_WORKSPACE,
-            Intent.RUN_DIAGNOSTICS
-        ]
-        
-        if intent in workspace_intents and "workspace_id" not in entities:
+        if intent in _WORKSPACE_INTENTS and "workspace_id" not in entities:
             return "Which workspace would you like me to work with? Please provide the workspace ID."
         
         # Check if provision intent has bundle type
@@ -464,7 +650,7 @@ class IntentRecognizer:
         
         return None
     
-    def recommend_bundle(self, requirements: Dict[str, Any]) -> List[str]:
+    def recommend_bundle(self, requirements: Mapping[str, Any]) -> List[str]:
         """Recommend bundle types based on requirements.
         
         Validates: Requirements 5.3 (Bundle recommendations)
@@ -475,59 +661,23 @@ class IntentRecognizer:
         Returns:
             List of recommended bundle types (ordered by preference)
         """
-        recommendations = []
+        intensity = requirements.get("intensity")
         
         # GPU workloads
         if requirements.get("needs_gpu"):
-            if requirements.get("intensity") == "high":
-                recommendations.append("GRAPHICSPRO_G4DN")
-                recommendations.append("GRAPHICS_G4DN")
-            else:
-                recommendations.append("GRAPHICS_G4DN")
+            rule = "gpu_high" if intensity == "high" else "gpu"
         
         # High compute workloads (ML/AI)
         elif requirements.get("needs_high_compute"):
-            recommendations.append("POWERPRO")
-            recommendations.append("POWER")
-            recommendations.append("GRAPHICS_G4DN")  # GPU can help with ML
+            rule = "high_compute"
         
         # Intensity-based recommendations
-        elif requirements.get("intensity") == "high":
-            recommendations.append("POWER")
-            recommendations.append("POWERPRO")
-        elif requirements.get("intensity") == "low":
-            recommendations.append("STANDARD")
-            recommendations.append("PERFORMANCE")
+        elif intensity in ("high", "low"):
+            rule = intensity
         else:  # medium intensity
-            recommendations.append("PERFORMANCE")
-            recommendations.append("POWER")
-        
-        # Use case specific recommendations
-        use_case = requirements.get("use_case")
-        if use_case == "development" and not recommendations:
-            recommendations.append("PERFORMANCE")
-            recommendations.append("STANDARD")
-        elif use_case == "data_analysis" and not recommendations:
-            recommendations.append("POWER")
-            recommendations.append("PERFORMANCE")
-        elif use_case == "creative" and not recommendations:
-            recommendations.append("GRAPHICS_G4DN")
-            recommendations.append("POWER")
-        
-        # Default recommendation if nothing matched
-        if not recommendations:
-            recommendations.append("PERFORMANCE")
-            recommendations.append("STANDARD")
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_recommendations = []
-        for bundle in recommendations:
-            if bundle not in seen:
-                seen.add(bundle)
-                unique_recommendations.append(bundle)
-        
-        return unique_recommendations[:3]  # Return top 3 recommendations
+            rule = "medium"
+        
+        return list(_BUNDLE_RECOMMENDATIONS[rule])
     
     def get_bundle_description(self, bundle_type: str) -> str:
         """Get human-readable description of a bundle type.
@@ -538,13 +688,4 @@ class IntentRecognizer:
         Returns:
             Description string
         """
-        descriptions = {
-            "STANDARD": "Standard (2 vCPU, 8 GB RAM) - Good for light development and general tasks",
-            "PERFORMANCE": "Performance (8 vCPU, 32 GB RAM) - Good for most development workloads",
-            "POWER": "Power (16 vCPU, 64 GB RAM) - Good for intensive workloads and data processing",
-            "POWERPRO": "PowerPro (32 vCPU, 128 GB RAM) - Best for very demanding workloads",
-            "GRAPHICS_G4DN": "Graphics (16 vCPU, 64 GB RAM, NVIDIA T4 GPU) - Good for GPU workloads, ML, and graphics",
-            "GRAPHICSPRO_G4DN": "GraphicsPro (64 vCPU, 256 GB RAM, NVIDIA T4 GPU) - Best for intensive GPU workloads"
-        }
-        
-        return descriptions.get(bundle_type, bundle_type)
+        return _BUNDLE_DESCRIPTIONS.get(bundle_type, bundle_type)
@@ -6,7 +6,7 @@ Requirements: 5.4
 
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, Iterable
 from enum import Enum
 import redis
 from pydantic import BaseModel
@@ -51,6 +51,7 @@ class Tool(ABC):
         self.name = name
         self.category = category
         self.description = description
+        self._schema: Optional[Dict[str, Any]] = None
     
     @abstractmethod
     async def execute(
@@ -72,14 +73,19 @@ class Tool(ABC):
     def get_schema(self) -> Dict[str, Any]:
         """Get tool schema for Claude function calling.
         
+        The schema is built on first call and reused; it is shared, so
+        callers must not modify it.
+        
         Returns:
             JSON schema describing tool parameters
         """
-        return {
-            "name": self.name,
-            "description": self.description,
-            "input_schema": self._get_input_schema()
-        }
+        if self._schema is None:
+            self._schema = {
+                "name": self.name,
+                "description": self.description,
+                "input_schema": self._get_input_schema()
+            }
+        return self._schema
     
     @abstractmethod
     def _get_input_schema(self) -> Dict[str, Any]:
@@ -106,10 +112,16 @@ class RateLimiter:
         """
         self.redis = redis_client
         self.key_prefix = "lucy:ratelimit:"
+        
+        # ":<category>" key suffixes, built once; Enum.value is a
+        # comparatively slow descriptor lookup on every key build
+        self._category_suffixes = {
+            category: f":{category.value}" for category in ToolCategory
+        }
     
     def _get_key(self, user_id: str, category: ToolCategory) -> str:
         """Generate Redis key for rate limit tracking."""
-        return f"{self.key_prefix}{user_id}:{category.value}"
+        return f"{self.key_prefix}{user_id}{self._category_suffixes[category]}"
     
     async def check_rate_limit(
         self,
@@ -133,15 +145,16 @@ class RateLimiter:
         now = datetime.utcnow().timestamp()
         window_start = now - window_seconds
         
-        # Remove old entries outside the window
-        self.redis.zremrangebyscore(key, 0, window_start)
-        
-        # Count entries in current window
-        current_count = self.redis.zcard(key)
+        # One round trip: drop entries outside the window, count the rest,
+        # and fetch the oldest in case the limit has been reached
+        pipe = self.redis.pipeline()
+        pipe.zremrangebyscore(key, 0, window_start)
+        pipe.zcard(key)
+        pipe.zrange(key, 0, 0, withscores=True)
+        _, current_count, oldest = pipe.execute()
         
         if current_count >= limit:
             # Calculate when the oldest entry will expire
-            oldest = self.redis.zrange(key, 0, 0, withscores=True)
             if oldest:
                 oldest_timestamp = oldest[0][1]
                 retry_after = int(oldest_timestamp + window_seconds - now)
@@ -170,11 +183,12 @@ class RateLimiter:
         key = self._get_key(user_id, category)
         now = datetime.utcnow().timestamp()
         
-        # Add current execution with timestamp as score
-        self.redis.zadd(key, {str(now): now})
-        
-        # Set expiration on the key
-        self.redis.expire(key, window_seconds)
+        # Add current execution with timestamp as score and set
+        # expiration on the key in a single round trip
+        pipe = self.redis.pipeline()
+        pipe.zadd(key, {str(now): now})
+        pipe.expire(key, window_seconds)
+        pipe.execute()
 
 
 class ToolExecutor:
@@ -192,6 +206,9 @@ class ToolExecutor:
         self.tools: Dict[str, Tool] = {}
         self.rate_limiter = RateLimiter(redis_client)
         
+        # Schemas of the registered tools, rebuilt after registration changes
+        self._schemas: Optional[List[Dict[str, Any]]] = None
+        
         # Rate limit configuration
         self.rate_limits = {
             ToolCategory.PROVISIONING: {
@@ -223,14 +240,30 @@ class ToolExecutor:
             tool: Tool instance to register
         """
         self.tools[tool.name] = tool
+        self._schemas = None
+    
+    def register_tools(self, tools: Iterable[Tool]) -> None:
+        """Register several tools for execution.
+        
+        Args:
+            tools: Tool instances to register; a later tool replaces an
+                earlier one with the same name
+        """
+        self.tools.update((tool.name, tool) for tool in tools)
+        self._schemas = None
     
     def get_tool_schemas(self) -> List[Dict[str, Any]]:
         """Get schemas for all registered tools.
         
+        The list is reused until another tool is registered; it is shared,
+        so callers must not modify it.
+        
         Returns:
             List of tool schemas for Claude function calling
         """
-        return [tool.get_schema() for tool in self.tools.values()]
+        if self._schemas is None:
+            self._schemas = [tool.get_schema() for tool in self.tools.values()]
+        return self._schemas
     
     async def execute_tool(
         self,
@@ -0,0 +1,40 @@
+"""Shared AWS service clients for the provisioning services.
+
+boto3 clients are thread-safe and expensive to build (botocore session
+setup, endpoint resolution, and a fresh connection pool that must redo
+TCP/TLS handshakes), so each (service, region) pair gets one client that
+every service instance reuses.
+"""
+
+import functools
+
+from botocore.config import Config
+
+# Connection settings for all provisioning clients: a pool large enough for
+# concurrent bulk operations, with TCP keepalive on idle connections.
+# Timeouts are well below botocore's 60s defaults so a stalled endpoint
+# fails fast instead of pinning a worker thread.
+# Retries are left to botocore's defaults and WorkSpacesClient's own backoff
+# and circuit breaker.
+_BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=10
+)
+
+
+@functools.lru_cache(maxsize=32)
+def get_aws_client(service_name: str, region: str):
+    """Get the shared boto3 client for a service and region.
+    
+    Args:
+        service_name: AWS service name (e.g. "workspaces", "ssm")
+        region: AWS region
+        
+    Returns:
+        boto3 client, built on first use
+    """
+    import boto3  # deferred: boto3 adds ~75ms to import beyond botocore
+    
+    return boto3.client(service_name, region_name=region, config=_BOTO_CONFIG)
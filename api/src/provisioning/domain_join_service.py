@@ -10,12 +10,18 @@ Requirements:
 
 import logging
 import time
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any
 from enum import Enum
 from datetime import datetime
 
+from .retry_guard import TokenBucket
+
 logger = logging.getLogger(__name__)
 
+# Retry quota shared by all domain joins in this process: during a regional
+# AD outage at most 10 retries burst, then one per second
+_DOMAIN_JOIN_RETRY_BUCKET = TokenBucket(capacity=10, refill_per_second=1.0)
+
 
 class DomainJoinStatus(Enum):
     """Domain join status values."""
@@ -32,12 +38,15 @@ class DomainJoinService:
     # Retry configuration
     MAX_RETRIES = 3
     RETRY_DELAY_SECONDS = 30
+    RETRY_BUDGET_SECONDS = 120  # wall-clock cap on one join including waits
     
     def __init__(
         self,
         workspaces_client,
         domain_name: str = "robco.local",
-        domain_ou: str = "OU=WorkSpaces,OU=Computers,DC=robco,DC=local"
+        domain_ou: str = "OU=WorkSpaces,OU=Computers,DC=robco,DC=local",
+        retry_bucket: Optional[TokenBucket] = None,
+        sleep: Callable[[float], None] = time.sleep,
     ):
         """Initialize domain join service.
         
@@ -45,10 +54,14 @@ class DomainJoinService:
             workspaces_client: WorkSpacesClient instance
             domain_name: Active Directory domain name
             domain_ou: Organizational Unit for WorkSpaces
+            retry_bucket: Retry quota; defaults to the process-wide bucket
+            sleep: Function used to wait between retries
         """
         self.client = workspaces_client
         self.domain_name = domain_name
         self.domain_ou = domain_ou
+        self._retry_bucket = retry_bucket or _DOMAIN_JOIN_RETRY_BUCKET
+        self._sleep = sleep
         
         logger.info(
             "domain_join_service_initialized",
@@ -70,6 +83,9 @@ class DomainJoinService:
         - Validates: Requirements 4A.1 (Join to AD domain)
         - Validates: Requirements 4A.5 (Retry up to 3 times)
         
+        Retries are also bounded by RETRY_BUDGET_SECONDS and by the shared
+        retry bucket, so a widespread AD outage cannot cause a retry storm.
+        
         Args:
             workspace_id: WorkSpace ID
             user_name: User name for the WorkSpace
@@ -80,8 +96,13 @@ class DomainJoinService:
         """
         attempt = 0
         last_error = None
+        deadline = time.monotonic() + self.RETRY_BUDGET_SECONDS
         
         while attempt < self.MAX_RETRIES:
+            if attempt:
+                if not self._may_retry(workspace_id, deadline):
+                    break
+                self._sleep(self.RETRY_DELAY_SECONDS)
             attempt += 1
             
             try:
@@ -131,7 +152,6 @@ class DomainJoinService:
                                 "retry_delay": self.RETRY_DELAY_SECONDS
                             }
                         )
-                        time.sleep(self.RETRY_DELAY_SECONDS)
                     else:
                         logger.error(
                             "domain_join_failed_max_retries",
@@ -153,19 +173,42 @@ class DomainJoinService:
                     },
                     exc_info=True
                 )
-                
-                if attempt < self.MAX_RETRIES:
-                    time.sleep(self.RETRY_DELAY_SECONDS)
         
         # All retries exhausted
         return {
             "status": DomainJoinStatus.FAILED.value,
             "workspace_id": workspace_id,
             "error": last_error,
-            "attempts": self.MAX_RETRIES,
+            "attempts": attempt,
             "failed_at": datetime.utcnow().isoformat()
         }
     
+    def _may_retry(self, workspace_id: str, deadline: float) -> bool:
+        """Check whether another domain join attempt is allowed.
+        
+        Args:
+            workspace_id: WorkSpace ID being joined
+            deadline: Monotonic time after which no attempt may start
+            
+        Returns:
+            True if the retry fits the time budget and a retry token was taken
+        """
+        if time.monotonic() + self.RETRY_DELAY_SECONDS >= deadline:
+            reason = "budget_exhausted"
+        elif not self._retry_bucket.try_acquire():
+            reason = "retry_quota_exhausted"
+        else:
+            return True
+        
+        logger.warning(
+            "domain_join_retry_suppressed",
+            extra={
+                "workspace_id": workspace_id,
+                "reason": reason
+            }
+        )
+        return False
+    
     def _perform_domain_join(
         self,
         workspace_id: str,
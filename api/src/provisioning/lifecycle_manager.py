@@ -10,8 +10,9 @@ Requirements:
 - 14.5: Respect keep-alive flag
 """
 
+import heapq
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Collection, Dict, Any, List, Mapping, Optional, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 
@@ -51,6 +52,14 @@ class LifecycleManager:
         self.workspaces_client = workspaces_client
         self.default_idle_timeout_minutes = default_idle_timeout_minutes
         self.default_max_lifetime_days = default_max_lifetime_days
+        # Last formatted timestamp; a sweep stamps every result with one time
+        self._timestamp_cache: Tuple[Optional[datetime], str] = (None, "")
+        
+        # Flagged stale WorkSpaces: flag time per ID, plus a min-heap of
+        # (grace period expiry, ID) so a sweep only visits expired entries.
+        # Heap entries whose flag time no longer matches are skipped.
+        self._flagged: Dict[str, datetime] = {}
+        self._stale_expiry_heap: List[Tuple[datetime, str]] = []
         
         logger.info(
             "lifecycle_manager_initialized",
@@ -60,11 +69,28 @@ class LifecycleManager:
             }
         )
     
+    def _now_iso(self, now: Optional[datetime] = None) -> str:
+        """Format the current time, reusing the previous string if unchanged.
+        
+        Args:
+            now: Current time (reads the clock if None)
+            
+        Returns:
+            ISO 8601 timestamp
+        """
+        current_time = now or datetime.utcnow()
+        cached_time, formatted = self._timestamp_cache
+        if cached_time != current_time:
+            formatted = current_time.isoformat()
+            self._timestamp_cache = (current_time, formatted)
+        return formatted
+    
     def check_idle_timeout(
         self,
         workspace_id: str,
         last_activity_time: datetime,
-        idle_timeout_minutes: Optional[int] = None
+        idle_timeout_minutes: Optional[int] = None,
+        now: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """Check if WorkSpace has exceeded idle timeout.
         
@@ -75,6 +101,7 @@ class LifecycleManager:
             workspace_id: WorkSpace ID
             last_activity_time: Last activity timestamp
             idle_timeout_minutes: Idle timeout in minutes (uses default if None)
+            now: Current time (reads the clock if None)
             
         Returns:
             Dictionary with timeout check results
@@ -82,7 +109,7 @@ class LifecycleManager:
         try:
             timeout_minutes = idle_timeout_minutes or self.default_idle_timeout_minutes
             
-            current_time = datetime.utcnow()
+            current_time = now or datetime.utcnow()
             idle_duration = current_time - last_activity_time
             idle_minutes = idle_duration.total_seconds() / 60
             
@@ -104,7 +131,7 @@ class LifecycleManager:
                 "timeout_minutes": timeout_minutes,
                 "exceeded": exceeded,
                 "last_activity_time": last_activity_time.isoformat(),
-                "checked_at": current_time.isoformat()
+                "checked_at": self._now_iso(current_time)
             }
             
         except Exception as e:
@@ -118,11 +145,39 @@ class LifecycleManager:
             )
             raise
     
+    def batch_check_idle_timeout(
+        self,
+        last_activity_times: Mapping[str, datetime],
+        idle_timeout_minutes: Optional[int] = None,
+        now: Optional[datetime] = None
+    ) -> Dict[str, bool]:
+        """Check many WorkSpaces against the idle timeout at once.
+        
+        The timeout is turned into a single cutoff time, so each WorkSpace
+        costs one datetime comparison.
+        
+        Args:
+            last_activity_times: WorkSpace ID -> last activity timestamp
+            idle_timeout_minutes: Idle timeout in minutes (uses default if None)
+            now: Current time (reads the clock if None)
+            
+        Returns:
+            WorkSpace ID -> True if the idle timeout is exceeded
+        """
+        timeout_minutes = idle_timeout_minutes or self.default_idle_timeout_minutes
+        cutoff = (now or datetime.utcnow()) - timedelta(minutes=timeout_minutes)
+        
+        return {
+            workspace_id: last_activity <= cutoff
+            for workspace_id, last_activity in last_activity_times.items()
+        }
+    
     def auto_stop_idle_workspace(
         self,
         workspace_id: str,
         last_activity_time: datetime,
-        idle_timeout_minutes: Optional[int] = None
+        idle_timeout_minutes: Optional[int] = None,
+        now: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """Auto-stop WorkSpace if idle timeout exceeded.
         
@@ -133,6 +188,7 @@ class LifecycleManager:
             workspace_id: WorkSpace ID
             last_activity_time: Last activity timestamp
             idle_timeout_minutes: Idle timeout in minutes
+            now: Current time (reads the clock if None)
             
         Returns:
             Dictionary with auto-stop results
@@ -142,7 +198,8 @@ class LifecycleManager:
             check_result = self.check_idle_timeout(
                 workspace_id=workspace_id,
                 last_activity_time=last_activity_time,
-                idle_timeout_minutes=idle_timeout_minutes
+                idle_timeout_minutes=idle_timeout_minutes,
+                now=now
             )
             
             if not check_result["exceeded"]:
@@ -183,7 +240,7 @@ class LifecycleManager:
                 "reason": "idle_timeout",
                 "idle_minutes": check_result["idle_minutes"],
                 "timeout_minutes": check_result["timeout_minutes"],
-                "stopped_at": datetime.utcnow().isoformat()
+                "stopped_at": self._now_iso(now)
             }
             
         except Exception as e:
@@ -201,7 +258,8 @@ class LifecycleManager:
         self,
         workspace_id: str,
         created_time: datetime,
-        max_lifetime_days: Optional[int] = None
+        max_lifetime_days: Optional[int] = None,
+        now: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """Check if WorkSpace has exceeded maximum lifetime.
         
@@ -212,6 +270,7 @@ class LifecycleManager:
             workspace_id: WorkSpace ID
             created_time: WorkSpace creation timestamp
             max_lifetime_days: Maximum lifetime in days (uses default if None)
+            now: Current time (reads the clock if None)
             
         Returns:
             Dictionary with lifetime check results
@@ -219,7 +278,7 @@ class LifecycleManager:
         try:
             lifetime_days = max_lifetime_days or self.default_max_lifetime_days
             
-            current_time = datetime.utcnow()
+            current_time = now or datetime.utcnow()
             age = current_time - created_time
             age_days = age.total_seconds() / (24 * 3600)
             
@@ -241,7 +300,7 @@ class LifecycleManager:
                 "lifetime_days": lifetime_days,
                 "exceeded": exceeded,
                 "created_time": created_time.isoformat(),
-                "checked_at": current_time.isoformat()
+                "checked_at": self._now_iso(current_time)
             }
             
         except Exception as e:
@@ -255,11 +314,36 @@ class LifecycleManager:
             )
             raise
     
+    def batch_check_maximum_lifetime(
+        self,
+        created_times: Mapping[str, datetime],
+        max_lifetime_days: Optional[int] = None,
+        now: Optional[datetime] = None
+    ) -> Dict[str, bool]:
+        """Check many WorkSpaces against the maximum lifetime at once.
+        
+        Args:
+            created_times: WorkSpace ID -> creation timestamp
+            max_lifetime_days: Maximum lifetime in days (uses default if None)
+            now: Current time (reads the clock if None)
+            
+        Returns:
+            WorkSpace ID -> True if the maximum lifetime is exceeded
+        """
+        lifetime_days = max_lifetime_days or self.default_max_lifetime_days
+        cutoff = (now or datetime.utcnow()) - timedelta(days=lifetime_days)
+        
+        return {
+            workspace_id: created_time <= cutoff
+            for workspace_id, created_time in created_times.items()
+        }
+    
     def auto_terminate_expired_workspace(
         self,
         workspace_id: str,
         created_time: datetime,
-        max_lifetime_days: Optional[int] = None
+        max_lifetime_days: Optional[int] = None,
+        now: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """Auto-terminate WorkSpace if maximum lifetime exceeded.
         
@@ -270,6 +354,7 @@ class LifecycleManager:
             workspace_id: WorkSpace ID
             created_time: WorkSpace creation timestamp
             max_lifetime_days: Maximum lifetime in days
+            now: Current time (reads the clock if None)
             
         Returns:
             Dictionary with auto-terminate results
@@ -279,7 +364,8 @@ class LifecycleManager:
             check_result = self.check_maximum_lifetime(
                 workspace_id=workspace_id,
                 created_time=created_time,
-                max_lifetime_days=max_lifetime_days
+                max_lifetime_days=max_lifetime_days,
+                now=now
             )
             
             if not check_result["exceeded"]:
@@ -320,7 +406,7 @@ class LifecycleManager:
                 "reason": "max_lifetime",
                 "age_days": check_result["age_days"],
                 "lifetime_days": check_result["lifetime_days"],
-                "terminated_at": datetime.utcnow().isoformat()
+                "terminated_at": self._now_iso(now)
             }
             
         except Exception as e:
@@ -338,7 +424,8 @@ class LifecycleManager:
         self,
         workspace_id: str,
         stopped_time: datetime,
-        keep_alive: bool = False
+        keep_alive: bool = False,
+        now: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """Check if stopped WorkSpace is stale.
         
@@ -350,6 +437,7 @@ class LifecycleManager:
             workspace_id: WorkSpace ID
             stopped_time: Time when WorkSpace was stopped
             keep_alive: Whether WorkSpace has keep-alive flag
+            now: Current time (reads the clock if None)
             
         Returns:
             Dictionary with stale check results
@@ -367,7 +455,7 @@ class LifecycleManager:
                     "keep_alive": True
                 }
             
-            current_time = datetime.utcnow()
+            current_time = now or datetime.utcnow()
             stopped_duration = current_time - stopped_time
             stopped_days = stopped_duration.total_seconds() / (24 * 3600)
             
@@ -388,7 +476,7 @@ class LifecycleManager:
                 "stopped_days": stopped_days,
                 "stale_threshold_days": self.STALE_THRESHOLD_DAYS,
                 "stopped_time": stopped_time.isoformat(),
-                "checked_at": current_time.isoformat()
+                "checked_at": self._now_iso(current_time)
             }
             
         except Exception as e:
@@ -402,12 +490,38 @@ class LifecycleManager:
             )
             raise
     
+    def batch_check_stale_workspace(
+        self,
+        stopped_times: Mapping[str, datetime],
+        keep_alive_ids: Collection[str] = (),
+        now: Optional[datetime] = None
+    ) -> Dict[str, bool]:
+        """Check many stopped WorkSpaces for staleness at once.
+        
+        Args:
+            stopped_times: WorkSpace ID -> time the WorkSpace was stopped
+            keep_alive_ids: WorkSpace IDs with the keep-alive flag, which
+                are never stale
+            now: Current time (reads the clock if None)
+            
+        Returns:
+            WorkSpace ID -> True if the WorkSpace is stale
+        """
+        keep_alive_ids = frozenset(keep_alive_ids)
+        cutoff = (now or datetime.utcnow()) - timedelta(days=self.STALE_THRESHOLD_DAYS)
+        
+        return {
+            workspace_id: stopped_time <= cutoff and workspace_id not in keep_alive_ids
+            for workspace_id, stopped_time in stopped_times.items()
+        }
+    
     def flag_stale_workspace(
         self,
         workspace_id: str,
         owner_id: str,
         stopped_time: datetime,
-        keep_alive: bool = False
+        keep_alive: bool = False,
+        now: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """Flag WorkSpace as stale and notify owner.
         
@@ -420,6 +534,7 @@ class LifecycleManager:
             owner_id: Owner user ID
             stopped_time: Time when WorkSpace was stopped
             keep_alive: Whether WorkSpace has keep-alive flag
+            now: Current time (reads the clock if None)
             
         Returns:
             Dictionary with flagging results
@@ -429,7 +544,8 @@ class LifecycleManager:
             check_result = self.check_stale_workspace(
                 workspace_id=workspace_id,
                 stopped_time=stopped_time,
-                keep_alive=keep_alive
+                keep_alive=keep_alive,
+                now=now
             )
             
             if not check_result["is_stale"]:
@@ -452,6 +568,16 @@ class LifecycleManager:
             # TODO: Update database to mark as stale
             # TODO: Send notification to owner
             
+            # A WorkSpace already flagged keeps its original grace period
+            flagged_time = self._flagged.get(workspace_id)
+            if flagged_time is None:
+                flagged_time = now or datetime.utcnow()
+                self._flagged[workspace_id] = flagged_time
+                heapq.heappush(
+                    self._stale_expiry_heap,
+                    (flagged_time + timedelta(days=self.STALE_TERMINATION_DAYS), workspace_id)
+                )
+            
             logger.info(
                 "stale_workspace_flagged",
                 extra={
@@ -466,7 +592,7 @@ class LifecycleManager:
                 "owner_id": owner_id,
                 "stopped_days": check_result["stopped_days"],
                 "notification_sent": True,
-                "flagged_at": datetime.utcnow().isoformat()
+                "flagged_at": self._now_iso(flagged_time)
             }
             
         except Exception as e:
@@ -484,7 +610,8 @@ class LifecycleManager:
         self,
         workspace_id: str,
         flagged_time: datetime,
-        keep_alive: bool = False
+        keep_alive: bool = False,
+        now: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """Terminate stale WorkSpace after grace period.
         
@@ -496,6 +623,7 @@ class LifecycleManager:
             workspace_id: WorkSpace ID
             flagged_time: Time when WorkSpace was flagged as stale
             keep_alive: Whether WorkSpace has keep-alive flag
+            now: Current time (reads the clock if None)
             
         Returns:
             Dictionary with termination results
@@ -512,7 +640,7 @@ class LifecycleManager:
                     "reason": "keep_alive_enabled"
                 }
             
-            current_time = datetime.utcnow()
+            current_time = now or datetime.utcnow()
             grace_period = current_time - flagged_time
             grace_days = grace_period.total_seconds() / (24 * 3600)
             
@@ -554,7 +682,7 @@ class LifecycleManager:
                 "terminated": True,
                 "reason": "stale_grace_period_expired",
                 "grace_days": grace_days,
-                "terminated_at": current_time.isoformat()
+                "terminated_at": self._now_iso(current_time)
             }
             
         except Exception as e:
@@ -568,19 +696,74 @@ class LifecycleManager:
             )
             raise
     
+    def clear_stale_flag(self, workspace_id: str) -> None:
+        """Forget a stale flag, e.g. after the owner starts the WorkSpace again.
+        
+        Args:
+            workspace_id: WorkSpace ID
+        """
+        self._flagged.pop(workspace_id, None)
+    
+    def sweep_expired_stale(
+        self,
+        now: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """Terminate flagged WorkSpaces whose grace period has expired.
+        
+        Only expired entries are visited, so the cost of a sweep grows with
+        the number of terminations rather than the number of flagged
+        WorkSpaces.
+        
+        Args:
+            now: Current time (reads the clock if None)
+            
+        Returns:
+            Termination results for the expired WorkSpaces
+        """
+        now = now or datetime.utcnow()
+        grace = timedelta(days=self.STALE_TERMINATION_DAYS)
+        heap = self._stale_expiry_heap
+        results = []
+        
+        while heap and heap[0][0] <= now:
+            expiry, workspace_id = heapq.heappop(heap)
+            flagged_time = self._flagged.get(workspace_id)
+            
+            # Cleared, or re-flagged with a later expiry still in the heap
+            if flagged_time is None or flagged_time + grace != expiry:
+                continue
+            
+            del self._flagged[workspace_id]
+            results.append(
+                self.terminate_stale_workspace(
+                    workspace_id=workspace_id,
+                    flagged_time=flagged_time,
+                    now=now
+                )
+            )
+        
+        return results
+    
     def scan_and_cleanup_workspaces(
         self,
-        workspaces: List[Dict[str, Any]]
+        workspaces: List[Dict[str, Any]],
+        now: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """Scan all WorkSpaces and perform lifecycle actions.
         
+        The clock is read once and the same time is used for every
+        WorkSpace, so one sweep makes consistent decisions.
+        
         Args:
             workspaces: List of WorkSpace info dictionaries
+            now: Current time (reads the clock if None)
             
         Returns:
             Dictionary with cleanup results
         """
         try:
+            now = now or datetime.utcnow()
+            
             logger.info(
                 "scanning_workspaces_for_cleanup",
                 extra={"workspace_count": len(workspaces)}
@@ -590,17 +773,36 @@ class LifecycleManager:
             terminated_count = 0
             flagged_count = 0
             
+            # Deciding whether a WorkSpace is due for an action is a single
+            # datetime comparison against a cutoff (one per distinct timeout);
+            # the action methods, with their logging and result building,
+            # only run for WorkSpaces that are due
+            idle_cutoffs: Dict[int, datetime] = {}
+            lifetime_cutoffs: Dict[int, datetime] = {}
+            stale_cutoff = now - timedelta(days=self.STALE_THRESHOLD_DAYS)
+            grace_cutoff = now - timedelta(days=self.STALE_TERMINATION_DAYS)
+            
             for workspace in workspaces:
                 workspace_id = workspace["workspace_id"]
+                state = workspace.get("state")
                 
                 # Check idle timeout
-                if workspace.get("state") == WorkSpaceState.AVAILABLE.value:
-                    last_activity = workspace.get("last_activity_time")
-                    if last_activity:
+                last_activity = workspace.get("last_activity_time")
+                if state == WorkSpaceState.AVAILABLE.value and last_activity:
+                    timeout_minutes = (
+                        workspace.get("idle_timeout_minutes")
+                        or self.default_idle_timeout_minutes
+                    )
+                    cutoff = idle_cutoffs.get(timeout_minutes)
+                    if cutoff is None:
+                        cutoff = idle_cutoffs[timeout_minutes] = now - timedelta(minutes=timeout_minutes)
+                    
+                    if last_activity <= cutoff:
                         result = self.auto_stop_idle_workspace(
                             workspace_id=workspace_id,
                             last_activity_time=last_activity,
-                            idle_timeout_minutes=workspace.get("idle_timeout_minutes")
+                            idle_timeout_minutes=timeout_minutes,
+                            now=now
                         )
                         if result.get("stopped"):
                             stopped_count += 1
@@ -608,40 +810,51 @@ class LifecycleManager:
                 # Check maximum lifetime
                 created_time = workspace.get("created_time")
                 if created_time:
-                    result = self.auto_terminate_expired_workspace(
-                        workspace_id=workspace_id,
-                        created_time=created_time,
-                        max_lifetime_days=workspace.get("max_lifetime_days")
+                    lifetime_days = (
+                        workspace.get("max_lifetime_days")
+                        or self.default_max_lifetime_days
                     )
-                    if result.get("terminated"):
-                        terminated_count += 1
+                    cutoff = lifetime_cutoffs.get(lifetime_days)
+                    if cutoff is None:
+                        cutoff = lifetime_cutoffs[lifetime_days] = now - timedelta(days=lifetime_days)
+                    
+                    if created_time <= cutoff:
+                        result = self.auto_terminate_expired_workspace(
+                            workspace_id=workspace_id,
+                            created_time=created_time,
+                            max_lifetime_days=lifetime_days,
+                            now=now
+                        )
+                        if result.get("terminated"):
+                            terminated_count += 1
+                
+                # Check stale WorkSpaces; keep-alive WorkSpaces are never
+                # flagged or terminated
+                if state != WorkSpaceState.STOPPED.value or workspace.get("keep_alive", False):
+                    continue
                 
-                # Check stale WorkSpaces
-                if workspace.get("state") == WorkSpaceState.STOPPED.value:
+                if workspace.get("is_stale"):
+                    # Terminate stale WorkSpaces
+                    flagged_time = workspace.get("flagged_time")
+                    if flagged_time and flagged_time <= grace_cutoff:
+                        result = self.terminate_stale_workspace(
+                            workspace_id=workspace_id,
+                            flagged_time=flagged_time,
+                            now=now
+                        )
+                        if result.get("terminated"):
+                            terminated_count += 1
+                else:
                     stopped_time = workspace.get("stopped_time")
-                    keep_alive = workspace.get("keep_alive", False)
-                    
-                    if stopped_time and not workspace.get("is_stale"):
+                    if stopped_time and stopped_time <= stale_cutoff:
                         result = self.flag_stale_workspace(
                             workspace_id=workspace_id,
                             owner_id=workspace.get("owner_id"),
                             stopped_time=stopped_time,
-                            keep_alive=keep_alive
+                            now=now
                         )
                         if result.get("flagged"):
                             flagged_count += 1
-                    
-                    # Terminate stale WorkSpaces
-                    if workspace.get("is_stale"):
-                        flagged_time = workspace.get("flagged_time")
-                        if flagged_time:
-                            result = self.terminate_stale_workspace(
-                                workspace_id=workspace_id,
-                                flagged_time=flagged_time,
-                                keep_alive=keep_alive
-                            )
-                            if result.get("terminated"):
-                                terminated_count += 1
             
             logger.info(
                 "workspace_cleanup_completed",
@@ -657,7 +870,7 @@ class LifecycleManager:
                 "stopped_count": stopped_count,
                 "terminated_count": terminated_count,
                 "flagged_count": flagged_count,
-                "scanned_at": datetime.utcnow().isoformat()
+                "scanned_at": self._now_iso(now)
             }
             
         except Exception as e:
@@ -7,7 +7,9 @@ Requirements:
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Any, List, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -22,6 +24,36 @@ class PoolWorkSpaceStatus(Enum):
     FAILED = "failed"
 
 
+@dataclass(slots=True)
+class PoolWorkSpace:
+    """A pre-provisioned WorkSpace held in a pool."""
+    workspace_id: str
+    blueprint_id: str
+    operating_system: str
+    bundle_id: str
+    directory_id: str
+    status: str
+    created_at: str
+    assigned_at: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary form returned by PoolManager.
+        
+        Returns:
+            WorkSpace info dictionary
+        """
+        return {
+            "workspace_id": self.workspace_id,
+            "blueprint_id": self.blueprint_id,
+            "operating_system": self.operating_system,
+            "bundle_id": self.bundle_id,
+            "directory_id": self.directory_id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "assigned_at": self.assigned_at
+        }
+
+
 class PoolManager:
     """Manages pre-warmed WorkSpace pools."""
     
@@ -29,6 +61,9 @@ class PoolManager:
     DEFAULT_MIN_SIZE = 5
     DEFAULT_MAX_SIZE = 20
     
+    # Headroom kept above peak hourly demand when sizing a pool
+    DEMAND_BUFFER_PERCENT = 20
+    
     def __init__(
         self,
         workspaces_client,
@@ -47,7 +82,11 @@ class PoolManager:
         self.max_pool_size = max_pool_size
         
         # In-memory pool state (production would use database)
-        self.pools: Dict[str, List[Dict[str, Any]]] = {}
+        self.pools: Dict[str, List[PoolWorkSpace]] = {}
+        
+        # Available WorkSpaces per pool in provisioning order; the same records
+        # as in self.pools, so assignment is O(1) instead of a scan
+        self._available: Dict[str, Deque[PoolWorkSpace]] = {}
         
         logger.info(
             "pool_manager_initialized",
@@ -103,6 +142,7 @@ class PoolManager:
             
             # Initialize empty pool
             self.pools[pool_key] = []
+            self._available[pool_key] = deque()
             
             # Provision initial WorkSpaces
             provisioned = self._provision_workspaces(
@@ -170,24 +210,25 @@ class PoolManager:
                 )
                 return None
             
-            pool = self.pools[pool_key]
+            available = self._available[pool_key]
             
-            # Find first available WorkSpace
-            for workspace in pool:
-                if workspace["status"] == PoolWorkSpaceStatus.AVAILABLE.value:
-                    # Mark as assigned
-                    workspace["status"] = PoolWorkSpaceStatus.ASSIGNED.value
-                    workspace["assigned_at"] = datetime.utcnow().isoformat()
-                    
-                    logger.info(
-                        "workspace_assigned_from_pool",
-                        extra={
-                            "pool_key": pool_key,
-                            "workspace_id": workspace["workspace_id"]
-                        }
-                    )
-                    
-                    return workspace
+            # Take the longest-waiting available WorkSpace
+            if available:
+                workspace = available.popleft()
+                
+                # Mark as assigned
+                workspace.status = PoolWorkSpaceStatus.ASSIGNED.value
+                workspace.assigned_at = datetime.utcnow().isoformat()
+                
+                logger.info(
+                    "workspace_assigned_from_pool",
+                    extra={
+                        "pool_key": pool_key,
+                        "workspace_id": workspace.workspace_id
+                    }
+                )
+                
+                return workspace.to_dict()
             
             logger.info(
                 "no_available_workspace_in_pool",
@@ -242,13 +283,7 @@ class PoolManager:
                     "reason": "pool_not_found"
                 }
             
-            pool = self.pools[pool_key]
-            
-            # Count available WorkSpaces
-            available_count = sum(
-                1 for ws in pool
-                if ws["status"] == PoolWorkSpaceStatus.AVAILABLE.value
-            )
+            available_count = len(self._available[pool_key])
             
             if available_count >= self.min_pool_size:
                 logger.info(
@@ -349,7 +384,7 @@ class PoolManager:
             }
             
             for workspace in pool:
-                status = workspace["status"]
+                status = workspace.status
                 if status in status_counts:
                     status_counts[status] += 1
             
@@ -414,14 +449,11 @@ class PoolManager:
             avg_requests_per_hour = demand_pattern.get("avg_requests_per_hour", 0)
             peak_requests_per_hour = demand_pattern.get("peak_requests_per_hour", 0)
             
-            # Calculate target size (peak + 20% buffer, capped at max)
-            target_size = min(
-                int(peak_requests_per_hour * 1.2),
-                self.max_pool_size
-            )
-            
-            # Ensure at least minimum
-            target_size = max(target_size, self.min_pool_size)
+            # Target size is peak plus the buffer, rounded up, clamped to
+            # [min, max]; integer ceiling division avoids float error
+            # (25 * 1.2 == 30.000000000000004)
+            buffered = -(-peak_requests_per_hour * (100 + self.DEMAND_BUFFER_PERCENT) // 100)
+            target_size = int(max(self.min_pool_size, min(buffered, self.max_pool_size)))
             
             logger.info(
                 "pool_size_adjusted",
@@ -460,7 +492,7 @@ class PoolManager:
         bundle_id: str,
         directory_id: str,
         count: int
-    ) -> List[Dict[str, Any]]:
+    ) -> List[PoolWorkSpace]:
         """Provision WorkSpaces for the pool.
         
         Args:
@@ -472,7 +504,7 @@ class PoolManager:
             count: Number of WorkSpaces to provision
             
         Returns:
-            List of provisioned WorkSpace info
+            List of provisioned pool WorkSpaces
         """
         try:
             provisioned = []
@@ -484,18 +516,18 @@ class PoolManager:
                 # Create WorkSpace (placeholder - actual implementation would call AWS API)
                 workspace_id = f"ws-pool-{blueprint_id}-{i}"
                 
-                workspace_info = {
-                    "workspace_id": workspace_id,
-                    "blueprint_id": blueprint_id,
-                    "operating_system": operating_system,
-                    "bundle_id": bundle_id,
-                    "directory_id": directory_id,
-                    "status": PoolWorkSpaceStatus.AVAILABLE.value,
-                    "created_at": datetime.utcnow().isoformat(),
-                    "assigned_at": None
-                }
+                workspace_info = PoolWorkSpace(
+                    workspace_id=workspace_id,
+                    blueprint_id=blueprint_id,
+                    operating_system=operating_system,
+                    bundle_id=bundle_id,
+                    directory_id=directory_id,
+                    status=PoolWorkSpaceStatus.AVAILABLE.value,
+                    created_at=datetime.utcnow().isoformat()
+                )
                 
                 self.pools[pool_key].append(workspace_info)
+                self._available[pool_key].append(workspace_info)
                 provisioned.append(workspace_info)
                 
                 logger.info(
@@ -6,8 +6,10 @@ Requirements:
 - 23.4: Alert if provisioning exceeds 5 minutes
 """
 
+import bisect
 import logging
-from typing import Dict, Any, Optional
+import time
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from enum import Enum
 
@@ -28,11 +30,32 @@ class ProvisioningMonitor:
     # SLA threshold
     PROVISIONING_SLA_SECONDS = 300  # 5 minutes
     
-    def __init__(self):
-        """Initialize provisioning monitor."""
+    # Requests started longer ago than this are dropped, including ones that
+    # never completed; metrics can look back at most this far
+    REQUEST_RETENTION_HOURS = 24 * 7
+    
+    def __init__(
+        self,
+        clock: Callable[[], datetime] = datetime.utcnow,
+        timer: Callable[[], float] = time.monotonic
+    ):
+        """Initialize provisioning monitor.
+        
+        Args:
+            clock: Returns the current UTC time, for reported timestamps
+            timer: Monotonic seconds, for durations (unaffected by
+                wall-clock adjustments)
+        """
+        self._clock = clock
+        self._timer = timer
+        
         # In-memory tracking (production would use database)
         self.provisioning_requests: Dict[str, Dict[str, Any]] = {}
         
+        # (start timestamp, workspace_id) for every tracked request, sorted,
+        # so a metrics window is found by bisection instead of a full scan
+        self._start_index: List[Tuple[float, str]] = []
+        
         logger.info("provisioning_monitor_initialized")
     
     def start_provisioning(
@@ -57,7 +80,16 @@ class ProvisioningMonitor:
             Dictionary with tracking info
         """
         try:
-            start_time = datetime.utcnow()
+            start_time = self._clock()
+            
+            previous = self.provisioning_requests.get(workspace_id)
+            if previous is not None:
+                entry = (previous["start_time"].timestamp(), workspace_id)
+                i = bisect.bisect_left(self._start_index, entry)
+                if i < len(self._start_index) and self._start_index[i] == entry:
+                    del self._start_index[i]
+            bisect.insort(self._start_index, (start_time.timestamp(), workspace_id))
+            self._evict_expired_requests(start_time)
             
             self.provisioning_requests[workspace_id] = {
                 "workspace_id": workspace_id,
@@ -66,6 +98,7 @@ class ProvisioningMonitor:
                 "bundle_type": bundle_type,
                 "status": ProvisioningStatus.REQUESTED.value,
                 "start_time": start_time,
+                "start_monotonic": self._timer(),
                 "end_time": None,
                 "duration_seconds": None,
                 "exceeded_sla": None
@@ -128,11 +161,10 @@ class ProvisioningMonitor:
                 }
             
             request = self.provisioning_requests[workspace_id]
-            end_time = datetime.utcnow()
+            duration_seconds = self._timer() - request["start_monotonic"]
+            end_time = self._clock()
             start_time = request["start_time"]
             
-            duration = end_time - start_time
-            duration_seconds = duration.total_seconds()
             exceeded_sla = duration_seconds > self.PROVISIONING_SLA_SECONDS
             
             # Update request
@@ -204,9 +236,7 @@ class ProvisioningMonitor:
             
             # Calculate current duration if still in progress
             if request["end_time"] is None:
-                current_time = datetime.utcnow()
-                duration = current_time - request["start_time"]
-                current_duration_seconds = duration.total_seconds()
+                current_duration_seconds = self._timer() - request["start_monotonic"]
                 currently_exceeding_sla = current_duration_seconds > self.PROVISIONING_SLA_SECONDS
             else:
                 current_duration_seconds = request["duration_seconds"]
@@ -251,14 +281,17 @@ class ProvisioningMonitor:
             Dictionary with aggregated metrics
         """
         try:
-            current_time = datetime.utcnow()
+            current_time = self._clock()
             cutoff_time = current_time.timestamp() - (time_period_hours * 3600)
             
-            # Filter requests in time period
+            # Completed requests started within the time period
+            first = bisect.bisect_left(self._start_index, (cutoff_time,))
             recent_requests = [
-                req for req in self.provisioning_requests.values()
-                if req["start_time"].timestamp() >= cutoff_time
-                and req["end_time"] is not None
+                req for req in (
+                    self.provisioning_requests[workspace_id]
+                    for _, workspace_id in self._start_index[first:]
+                )
+                if req["end_time"] is not None
             ]
             
             if not recent_requests:
@@ -333,6 +366,26 @@ class ProvisioningMonitor:
             )
             raise
     
+    def _evict_expired_requests(self, current_time: datetime) -> None:
+        """Drop requests started more than REQUEST_RETENTION_HOURS ago.
+        
+        Args:
+            current_time: Current time
+        """
+        cutoff_time = current_time.timestamp() - self.REQUEST_RETENTION_HOURS * 3600
+        expired = bisect.bisect_left(self._start_index, (cutoff_time,))
+        if not expired:
+            return
+        
+        for _, workspace_id in self._start_index[:expired]:
+            del self.provisioning_requests[workspace_id]
+        del self._start_index[:expired]
+        
+        logger.info(
+            "expired_provisioning_requests_evicted",
+            extra={"evicted_count": expired}
+        )
+    
     def _emit_provisioning_metrics(
         self,
         request: Dict[str, Any]
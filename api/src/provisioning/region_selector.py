@@ -7,12 +7,36 @@ Requirements:
 """
 
 import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from math import radians, sin, cos, sqrt, atan2
 from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+# Earth radius in kilometers
+EARTH_RADIUS_KM = 6371.0
+
+# Maximum IP addresses whose detected location is remembered
+LOCATION_CACHE_SIZE = 4096
+
+# How long a detected location is reused before the IP is looked up again
+LOCATION_CACHE_TTL = timedelta(hours=24)
+
+# Detected locations, least recently used first: ip -> (detected_at, location)
+_location_cache: "OrderedDict[str, Tuple[datetime, Tuple[float, float]]]" = OrderedDict()
+_location_cache_lock = threading.Lock()
+
+# Pooled HTTP session for geolocation lookups, so repeat lookups reuse
+# open connections instead of reconnecting per request
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=50))
+_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50))
+
 
 @dataclass
 class RegionInfo:
@@ -26,6 +50,8 @@ class RegionInfo:
 class RegionSelector:
     """Selects optimal AWS region based on user location."""
     
+    __slots__ = ("default_region",)
+    
     # AWS WorkSpaces supported regions with approximate coordinates
     SUPPORTED_REGIONS = {
         "us-east-1": RegionInfo("us-east-1", "US East (N. Virginia)", 38.13, -78.45),
@@ -61,10 +87,15 @@ class RegionSelector:
         Returns:
             Tuple of (latitude, longitude) or None if detection fails
         """
+        # Egress IPs repeat, so reuse recent successful lookups
+        cached_location = _get_cached_location(ip_address)
+        if cached_location is not None:
+            return cached_location
+        
         try:
             # Use ip-api.com for geolocation (free tier, no API key required)
             # In production, consider using AWS's own geolocation or a paid service
-            response = requests.get(
+            response = _session.get(
                 f"http://ip-api.com/json/{ip_address}",
                 timeout=2
             )
@@ -84,6 +115,7 @@ class RegionSelector:
                         country=data.get("country")
                     )
                     
+                    _cache_location(ip_address, (lat, lon))
                     return (lat, lon)
             
             logger.warning(
@@ -117,11 +149,6 @@ class RegionSelector:
         Returns:
             Distance in kilometers
         """
-        from math import radians, sin, cos, sqrt, atan2
-        
-        # Earth radius in kilometers
-        R = 6371.0
-        
         # Convert to radians
         lat1_rad = radians(lat1)
         lon1_rad = radians(lon1)
@@ -135,7 +162,7 @@ class RegionSelector:
         a = sin(dlat / 2)**2 + cos(lat1_rad) * cos(lat2_rad) * sin(dlon / 2)**2
         c = 2 * atan2(sqrt(a), sqrt(1 - a))
         
-        distance = R * c
+        distance = EARTH_RADIUS_KM * c
         return distance
     
     def select_optimal_region(
@@ -160,36 +187,42 @@ class RegionSelector:
             available_regions = list(self.SUPPORTED_REGIONS.keys())
         
         user_lat, user_lon = user_location
+        user_lat_rad = radians(user_lat)
+        user_lon_rad = radians(user_lon)
+        cos_user_lat = cos(user_lat_rad)
         
-        # Calculate distance to each region
-        distances: Dict[str, float] = {}
-        for region_code in available_regions:
-            if region_code not in self.SUPPORTED_REGIONS:
+        # Compare regions by the haversine term alone; great circle distance
+        # grows with it, so only the closest region needs the full formula
+        region_code = None
+        nearest_haversine = 0.0
+        for candidate in available_regions:
+            coordinates = _REGION_COORDINATES.get(candidate)
+            if coordinates is None:
                 logger.warning(
                     "unsupported_region",
-                    region=region_code
+                    region=candidate
                 )
                 continue
             
-            region_info = self.SUPPORTED_REGIONS[region_code]
-            distance = self.calculate_distance(
-                user_lat,
-                user_lon,
-                region_info.latitude,
-                region_info.longitude
+            region_lat_rad, region_lon_rad, cos_region_lat = coordinates
+            haversine = (
+                sin((region_lat_rad - user_lat_rad) / 2)**2
+                + cos_user_lat * cos_region_lat * sin((region_lon_rad - user_lon_rad) / 2)**2
             )
-            distances[region_code] = distance
+            if region_code is None or haversine < nearest_haversine:
+                region_code = candidate
+                nearest_haversine = haversine
         
-        if not distances:
+        if region_code is None:
             logger.warning(
                 "no_valid_regions",
                 falling_back_to=self.default_region
             )
             return self.default_region
         
-        # Select region with minimum distance
-        optimal_region = min(distances.items(), key=lambda x: x[1])
-        region_code, distance_km = optimal_region
+        distance_km = EARTH_RADIUS_KM * 2 * atan2(
+            sqrt(nearest_haversine), sqrt(1 - nearest_haversine)
+        )
         
         logger.info(
             "optimal_region_selected",
@@ -242,3 +275,54 @@ class RegionSelector:
             RegionInfo or None if region not supported
         """
         return self.SUPPORTED_REGIONS.get(region_code)
+
+
+# Region coordinates in radians with the cosine of latitude:
+# code -> (latitude, longitude, cos(latitude))
+_REGION_COORDINATES: Dict[str, Tuple[float, float, float]] = {
+    code: (radians(info.latitude), radians(info.longitude), cos(radians(info.latitude)))
+    for code, info in RegionSelector.SUPPORTED_REGIONS.items()
+}
+
+
+def _get_cached_location(ip_address: str) -> Optional[Tuple[float, float]]:
+    """Get a recently detected location for an IP address.
+    
+    Args:
+        ip_address: User's IP address
+        
+    Returns:
+        Tuple of (latitude, longitude), or None if not cached or expired
+    """
+    with _location_cache_lock:
+        entry = _location_cache.get(ip_address)
+        if entry is None:
+            return None
+        
+        detected_at, location = entry
+        if datetime.utcnow() - detected_at > LOCATION_CACHE_TTL:
+            del _location_cache[ip_address]
+            return None
+        
+        _location_cache.move_to_end(ip_address)
+        return location
+
+
+def _cache_location(ip_address: str, location: Tuple[float, float]) -> None:
+    """Remember a detected location, evicting the least recently used.
+    
+    Args:
+        ip_address: User's IP address
+        location: Tuple of (latitude, longitude)
+    """
+    with _location_cache_lock:
+        _location_cache[ip_address] = (datetime.utcnow(), location)
+        _location_cache.move_to_end(ip_address)
+        if len(_location_cache) > LOCATION_CACHE_SIZE:
+            _location_cache.popitem(last=False)
+
+
+def clear_location_cache() -> None:
+    """Forget all cached IP geolocation results."""
+    with _location_cache_lock:
+        _location_cache.clear()
@@ -0,0 +1,55 @@
+"""Retry budget shared across provisioning operations.
+
+Bounded retries keep a regional outage from turning into a retry storm:
+each retry must take a token from a bucket that refills at a fixed rate,
+so the total retry work is capped no matter how many operations fail at
+once. First attempts never consume tokens.
+"""
+
+import threading
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """Thread-safe token bucket used as a retry quota."""
+    
+    def __init__(
+        self,
+        capacity: int = 10,
+        refill_per_second: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize token bucket.
+        
+        Args:
+            capacity: Maximum number of tokens held (burst size)
+            refill_per_second: Tokens added per second
+            clock: Monotonic clock used to measure refill
+        """
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+    
+    def try_acquire(self) -> bool:
+        """Take one token if available.
+        
+        Returns:
+            True if a token was taken, False if the bucket is empty
+        """
+        with self._lock:
+            now = self._clock()
+            elapsed = max(0.0, now - self._updated_at)
+            self._tokens = min(
+                self.capacity,
+                self._tokens + elapsed * self.refill_per_second
+            )
+            self._updated_at = now
+            
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
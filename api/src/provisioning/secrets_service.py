@@ -10,12 +10,18 @@ Requirements:
 
 import logging
 import json
-from typing import Dict, Any, List, Optional
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 
-import boto3
 from botocore.exceptions import ClientError
 
+from .aws_clients import get_aws_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,15 +31,46 @@ class SecretsService:
     # Update timeout for secret rotation propagation
     UPDATE_TIMEOUT_MINUTES = 5
     
-    def __init__(self, region: str = "us-west-2"):
+    # Concurrent secret value fetches (botocore's default connection pool size)
+    SECRET_FETCH_WORKERS = 10
+    
+    # BatchGetSecretValue accepts at most 20 secret IDs per call
+    SECRET_BATCH_SIZE = 20
+    
+    # Concurrent WorkSpace updates when propagating a rotated secret
+    ROTATION_UPDATE_WORKERS = 32
+    
+    # Secret metadata changes rarely but is read on every launch burst;
+    # values are never cached so rotations take effect immediately
+    METADATA_CACHE_TTL = 300.0  # seconds
+    METADATA_CACHE_SIZE = 1024
+    
+    # Each entry's TTL is scaled by a random factor in [1 - jitter, 1 + jitter]
+    # so metadata fetched in one burst doesn't expire (and refetch) in one
+    METADATA_CACHE_JITTER = 0.1
+    
+    # ListSecrets page size; 100 is the API maximum
+    LIST_SECRETS_PAGE_SIZE = 100
+    
+    # Name of the per-user JSON secret read in bundle mode
+    USER_SECRET_BUNDLE_NAME = "user/{user_id}/env"
+    
+    def __init__(self, region: str = "us-west-2", bundle_mode: bool = False):
         """Initialize secrets service.
         
         Args:
             region: AWS region
+            bundle_mode: Read a user's own secrets from their JSON bundle
+                secret in one call instead of listing them by tag
         """
         self.region = region
-        self.secrets_client = boto3.client("secretsmanager", region_name=region)
-        self.ssm_client = boto3.client("ssm", region_name=region)
+        self.bundle_mode = bundle_mode
+        self.secrets_client = get_aws_client("secretsmanager", region)
+        self.ssm_client = get_aws_client("ssm", region)
+        
+        # Recent describe_secret results: secret_name -> (expires_at, metadata)
+        self._metadata_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._metadata_cache_lock = threading.Lock()
         
         logger.info(
             "secrets_service_initialized",
@@ -69,30 +106,24 @@ class SecretsService:
                 }
             )
             
-            secrets = {}
-            
-            # Get user-specific secrets
-            user_secrets = self._list_secrets_by_tag("UserId", user_id)
-            for secret_name in user_secrets:
-                value = self._get_secret_value(secret_name)
-                if value:
-                    secrets[secret_name] = value
+            # Get user-specific secrets, from the user's bundle if there is one
+            bundle = self.get_user_secret_bundle(user_id) if self.bundle_mode else None
+            if bundle is None:
+                secret_names = self._list_secrets_by_tag("UserId", user_id)
+            else:
+                secret_names = []
             
             # Get team-specific secrets if team_id provided
             if team_id:
-                team_secrets = self._list_secrets_by_tag("TeamId", team_id)
-                for secret_name in team_secrets:
-                    value = self._get_secret_value(secret_name)
-                    if value:
-                        secrets[secret_name] = value
-            
-            # Get role-based secrets
-            for role in user_roles:
-                role_secrets = self._list_secrets_by_tag("Role", role)
-                for secret_name in role_secrets:
-                    value = self._get_secret_value(secret_name)
-                    if value:
-                        secrets[secret_name] = value
+                secret_names.extend(self._list_secrets_by_tag("TeamId", team_id))
+            
+            # Get role-based secrets, all roles in a single listing
+            if user_roles:
+                secret_names.extend(self._list_secrets_by_tag("Role", *user_roles))
+            
+            secrets = self._get_secret_values(secret_names)
+            if bundle:
+                secrets = {**bundle, **secrets}
             
             logger.info(
                 "secrets_fetched_for_user",
@@ -115,6 +146,59 @@ class SecretsService:
             )
             return {}
     
+    def get_user_secret_bundle(self, user_id: str) -> Optional[Dict[str, str]]:
+        """Get all of a user's own secrets from their JSON bundle secret.
+        
+        The bundle is a single secret named USER_SECRET_BUNDLE_NAME whose
+        value is a JSON object of variable names to values, so one API call
+        replaces a listing plus a fetch of every user-scoped secret.
+        
+        Args:
+            user_id: User identifier
+            
+        Returns:
+            Dictionary of variable names to values, or None if the user has
+            no bundle or it could not be read
+        """
+        secret_name = self.USER_SECRET_BUNDLE_NAME.format(user_id=user_id)
+        
+        try:
+            response = self.secrets_client.get_secret_value(SecretId=secret_name)
+            bundle = json.loads(self._decode_secret(response))
+            
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "ResourceNotFoundException":
+                logger.error(
+                    "failed_to_get_secret_bundle",
+                    extra={
+                        "user_id": user_id,
+                        "error": str(e)
+                    }
+                )
+            return None
+        
+        except ValueError as e:
+            logger.error(
+                "invalid_secret_bundle",
+                extra={
+                    "user_id": user_id,
+                    "error": str(e)
+                }
+            )
+            return None
+        
+        if not isinstance(bundle, dict):
+            logger.error(
+                "invalid_secret_bundle",
+                extra={
+                    "user_id": user_id,
+                    "error": "bundle is not a JSON object"
+                }
+            )
+            return None
+        
+        return {str(key): str(value) for key, value in bundle.items()}
+    
     def inject_secrets_at_launch(
         self,
         workspace_id: str,
@@ -212,7 +296,8 @@ class SecretsService:
             Dictionary with rotation results
         """
         try:
-            start_time = datetime.utcnow()
+            # Monotonic clock: the duration is immune to wall-clock jumps
+            start = time.monotonic()
             
             logger.info(
                 "handling_secret_rotation",
@@ -222,41 +307,36 @@ class SecretsService:
                 }
             )
             
+            self._invalidate_metadata(secret_name)
+            
             # Get new secret value
             new_value = self._get_secret_value(secret_name)
             if not new_value:
                 raise ValueError(f"Failed to get new value for secret: {secret_name}")
             
             # Update environment variables in all affected WorkSpaces
-            updated_workspaces = []
-            failed_workspaces = []
-            
-            for workspace_id in affected_workspaces:
-                try:
-                    success = self._update_environment_variable(
-                        workspace_id,
-                        secret_name,
-                        new_value
-                    )
-                    
-                    if success:
-                        updated_workspaces.append(workspace_id)
-                    else:
-                        failed_workspaces.append(workspace_id)
-                        
-                except Exception as e:
-                    logger.error(
-                        "failed_to_update_workspace",
-                        extra={
-                            "workspace_id": workspace_id,
-                            "secret_name": secret_name,
-                            "error": str(e)
-                        }
-                    )
-                    failed_workspaces.append(workspace_id)
+            # concurrently, so propagation time tracks the slowest update
+            # rather than the sum of all of them
+            def _update(workspace_id: str) -> bool:
+                return self._update_workspace_secret(workspace_id, secret_name, new_value)
             
+            if len(affected_workspaces) <= 1:
+                outcomes = [_update(ws_id) for ws_id in affected_workspaces]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.ROTATION_UPDATE_WORKERS, len(affected_workspaces))
+                ) as executor:
+                    outcomes = list(executor.map(_update, affected_workspaces))
+            
+            updated_workspaces = [
+                ws_id for ws_id, ok in zip(affected_workspaces, outcomes) if ok
+            ]
+            failed_workspaces = [
+                ws_id for ws_id, ok in zip(affected_workspaces, outcomes) if not ok
+            ]
+            
+            duration_minutes = (time.monotonic() - start) / 60
             end_time = datetime.utcnow()
-            duration_minutes = (end_time - start_time).total_seconds() / 60
             
             within_timeout = duration_minutes <= self.UPDATE_TIMEOUT_MINUTES
             
@@ -301,6 +381,39 @@ class SecretsService:
             )
             raise
     
+    def _update_workspace_secret(
+        self,
+        workspace_id: str,
+        secret_name: str,
+        new_value: str
+    ) -> bool:
+        """Push a rotated secret value to one WorkSpace.
+        
+        Args:
+            workspace_id: WorkSpace ID
+            secret_name: Name of rotated secret
+            new_value: New secret value
+            
+        Returns:
+            True if the WorkSpace was updated
+        """
+        try:
+            return bool(self._update_environment_variable(
+                workspace_id,
+                secret_name,
+                new_value
+            ))
+        except Exception as e:
+            logger.error(
+                "failed_to_update_workspace",
+                extra={
+                    "workspace_id": workspace_id,
+                    "secret_name": secret_name,
+                    "error": str(e)
+                }
+            )
+            return False
+    
     def configure_secret_rotation(
         self,
         secret_name: str,
@@ -335,6 +448,8 @@ class SecretsService:
                 }
             )
             
+            self._invalidate_metadata(secret_name)
+            
             logger.info(
                 "secret_rotation_configured",
                 extra={
@@ -359,19 +474,22 @@ class SecretsService:
     def _list_secrets_by_tag(
         self,
         tag_key: str,
-        tag_value: str
+        *tag_values: str
     ) -> List[str]:
         """List secrets filtered by tag.
         
         Args:
             tag_key: Tag key to filter by
-            tag_value: Tag value to filter by
+            *tag_values: Tag values to filter by; a secret matching any
+                of them is listed
             
         Returns:
             List of secret names
         """
         try:
-            response = self.secrets_client.list_secrets(
+            # Filter server-side and follow every page of matches
+            paginator = self.secrets_client.get_paginator("list_secrets")
+            pages = paginator.paginate(
                 Filters=[
                     {
                         "Key": "tag-key",
@@ -379,24 +497,102 @@ class SecretsService:
                     },
                     {
                         "Key": "tag-value",
-                        "Values": [tag_value]
+                        "Values": list(tag_values)
                     }
-                ]
+                ],
+                PaginationConfig={"PageSize": self.LIST_SECRETS_PAGE_SIZE}
             )
             
-            return [secret["Name"] for secret in response.get("SecretList", [])]
+            return [
+                secret["Name"]
+                for page in pages
+                for secret in page.get("SecretList", [])
+            ]
             
         except ClientError as e:
             logger.error(
                 "failed_to_list_secrets",
                 extra={
                     "tag_key": tag_key,
-                    "tag_value": tag_value,
+                    "tag_values": list(tag_values),
                     "error": str(e)
                 }
             )
             return []
     
+    def _get_secret_values(self, secret_names: List[str]) -> Dict[str, str]:
+        """Get the values of several secrets in batches.
+        
+        Secrets are fetched SECRET_BATCH_SIZE at a time with
+        BatchGetSecretValue; multiple batches are fetched concurrently.
+        
+        Args:
+            secret_names: Names of secrets (duplicates are fetched once)
+            
+        Returns:
+            Dictionary of secret names to values, in first-seen order,
+            omitting secrets that could not be read
+        """
+        unique_names = list(dict.fromkeys(secret_names))
+        batches = [
+            unique_names[i:i + self.SECRET_BATCH_SIZE]
+            for i in range(0, len(unique_names), self.SECRET_BATCH_SIZE)
+        ]
+        if len(batches) <= 1:
+            results = [self._get_secret_batch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.SECRET_FETCH_WORKERS, len(batches))
+            ) as executor:
+                results = list(executor.map(self._get_secret_batch, batches))
+        
+        values: Dict[str, Optional[str]] = {}
+        for result in results:
+            values.update(result)
+        
+        return {name: values[name] for name in unique_names if values.get(name)}
+    
+    def _get_secret_batch(self, secret_names: List[str]) -> Dict[str, Optional[str]]:
+        """Get the values of up to SECRET_BATCH_SIZE secrets in one call.
+        
+        Falls back to one GetSecretValue call per secret if the batch call
+        itself is rejected (e.g. missing BatchGetSecretValue permission or
+        an endpoint that does not implement it).
+        
+        Args:
+            secret_names: Names of secrets
+            
+        Returns:
+            Dictionary of secret names to values (None if unreadable)
+        """
+        try:
+            response = self.secrets_client.batch_get_secret_value(
+                SecretIdList=secret_names
+            )
+        except ClientError as e:
+            logger.warning(
+                "batch_get_secret_value_failed_falling_back",
+                extra={
+                    "secret_count": len(secret_names),
+                    "error": str(e)
+                }
+            )
+            return {name: self._get_secret_value(name) for name in secret_names}
+        
+        for error in response.get("Errors", []):
+            logger.error(
+                "failed_to_get_secret_value",
+                extra={
+                    "secret_name": error.get("SecretId"),
+                    "error": error.get("Message", error.get("ErrorCode"))
+                }
+            )
+        
+        return {
+            entry["Name"]: self._decode_secret(entry)
+            for entry in response.get("SecretValues", [])
+        }
+    
     def _get_secret_value(self, secret_name: str) -> Optional[str]:
         """Get the value of a secret.
         
@@ -411,11 +607,7 @@ class SecretsService:
                 SecretId=secret_name
             )
             
-            # Handle both string and binary secrets
-            if "SecretString" in response:
-                return response["SecretString"]
-            else:
-                return response["SecretBinary"].decode("utf-8")
+            return self._decode_secret(response)
                 
         except ClientError as e:
             logger.error(
@@ -427,6 +619,21 @@ class SecretsService:
             )
             return None
     
+    @staticmethod
+    def _decode_secret(secret: Dict[str, Any]) -> str:
+        """Extract the value of a fetched secret.
+        
+        Args:
+            secret: GetSecretValue response or BatchGetSecretValue entry
+            
+        Returns:
+            Secret value, decoding binary secrets as UTF-8
+        """
+        # Handle both string and binary secrets
+        if "SecretString" in secret:
+            return secret["SecretString"]
+        return secret["SecretBinary"].decode("utf-8")
+    
     def _inject_environment_variables(
         self,
         workspace_id: str,
@@ -522,18 +729,30 @@ class SecretsService:
     ) -> Optional[Dict[str, Any]]:
         """Get metadata about a secret.
         
+        Results are cached for about METADATA_CACHE_TTL seconds (jittered
+        per entry); configuring or handling a rotation drops the cached entry.
+        
         Args:
             secret_name: Name of secret
             
         Returns:
             Dictionary with secret metadata or None
         """
+        with self._metadata_cache_lock:
+            cached = self._metadata_cache.get(secret_name)
+            if cached is not None:
+                expires_at, metadata = cached
+                if time.monotonic() < expires_at:
+                    self._metadata_cache.move_to_end(secret_name)
+                    return dict(metadata)
+                del self._metadata_cache[secret_name]
+        
         try:
             response = self.secrets_client.describe_secret(
                 SecretId=secret_name
             )
             
-            return {
+            metadata = {
                 "name": response["Name"],
                 "arn": response["ARN"],
                 "description": response.get("Description", ""),
@@ -553,3 +772,23 @@ class SecretsService:
                 }
             )
             return None
+        
+        jitter = random.uniform(-self.METADATA_CACHE_JITTER, self.METADATA_CACHE_JITTER)
+        expires_at = time.monotonic() + self.METADATA_CACHE_TTL * (1 + jitter)
+        
+        with self._metadata_cache_lock:
+            self._metadata_cache[secret_name] = (expires_at, metadata)
+            self._metadata_cache.move_to_end(secret_name)
+            if len(self._metadata_cache) > self.METADATA_CACHE_SIZE:
+                self._metadata_cache.popitem(last=False)
+        
+        return dict(metadata)
+    
+    def _invalidate_metadata(self, secret_name: str) -> None:
+        """Drop cached metadata for a secret whose rotation state changed.
+        
+        Args:
+            secret_name: Name of secret
+        """
+        with self._metadata_cache_lock:
+            self._metadata_cache.pop(secret_name, None)
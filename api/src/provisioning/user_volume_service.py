@@ -10,13 +10,15 @@ Requirements:
 """
 
 import logging
+import time
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from pathlib import Path
 
-import boto3
 from botocore.exceptions import ClientError
 
+from .aws_clients import get_aws_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,8 +57,8 @@ class UserVolumeService:
         self.fsx_svm_id = fsx_svm_id
         self.region = region
         
-        self.fsx_client = boto3.client("fsx", region_name=region)
-        self.ssm_client = boto3.client("ssm", region_name=region)
+        self.fsx_client = get_aws_client("fsx", region)
+        self.ssm_client = get_aws_client("ssm", region)
         
         logger.info(
             "user_volume_service_initialized",
@@ -296,7 +298,8 @@ class UserVolumeService:
             Dictionary with sync results
         """
         try:
-            start_time = datetime.utcnow()
+            # Sync duration comes from the monotonic clock, not utcnow()
+            start = time.monotonic()
             
             logger.info(
                 "syncing_dotfiles_to_workspace",
@@ -321,8 +324,8 @@ class UserVolumeService:
                 # Placeholder: mark as synced
                 synced_files.append(pattern)
             
+            duration_seconds = time.monotonic() - start
             end_time = datetime.utcnow()
-            duration_seconds = (end_time - start_time).total_seconds()
             
             if duration_seconds > self.SYNC_TIMEOUT_SECONDS:
                 logger.warning(
@@ -494,21 +497,21 @@ class UserVolumeService:
                     "Values": [user_id]
                 })
             
-            response = self.fsx_client.describe_volumes(
-                Filters=filters
-            )
+            # Follow every page; a single call returns at most one page
+            paginator = self.fsx_client.get_paginator("describe_volumes")
+            pages = paginator.paginate(Filters=filters)
             
-            volumes = []
-            for volume in response.get("Volumes", []):
-                if volume.get("VolumeType") == "ONTAP":
-                    volumes.append({
-                        "volume_id": volume["VolumeId"],
-                        "name": volume["Name"],
-                        "size_gb": volume["OntapConfiguration"]["SizeInMegabytes"] // 1024,
-                        "lifecycle": volume["Lifecycle"]
-                    })
-            
-            return volumes
+            return [
+                {
+                    "volume_id": volume["VolumeId"],
+                    "name": volume["Name"],
+                    "size_gb": volume["OntapConfiguration"]["SizeInMegabytes"] // 1024,
+                    "lifecycle": volume["Lifecycle"]
+                }
+                for page in pages
+                for volume in page.get("Volumes", [])
+                if volume.get("VolumeType") == "ONTAP"
+            ]
             
         except ClientError as e:
             logger.error(
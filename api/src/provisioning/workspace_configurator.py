@@ -7,11 +7,55 @@ Requirements:
 """
 
 import logging
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Only protocol a WorkSpace may stream over (Req 3.1)
+WSP_ONLY_PROTOCOLS = ("WSP",)
+
+# Static part of the WSP-only properties; OperatingSystemName is set per request
+_WSP_ONLY_PROPERTIES = MappingProxyType({
+    "OperatingSystemName": None,
+})
+
+# Data exfiltration vectors that are always disabled (Req 7.1-7.5)
+_DISABLED_EXFILTRATION_VECTORS = MappingProxyType({
+    "clipboard_operations": False,
+    "usb_device_redirection": False,
+    "drive_redirection": False,
+    "file_transfer": False,
+    "printing": False,
+})
+
+# Fixed watermark styling; only the text varies per user/session (Req 7.6)
+_WATERMARK_STYLE = MappingProxyType({
+    "opacity": 0.3,
+    "position": "bottom_right",
+})
+
+# WorkSpace properties shared by every creation request; ComputeTypeName and
+# Protocols are filled in per request
+_WORKSPACE_PROPERTIES = MappingProxyType({
+    "RunningMode": "AUTO_STOP",  # Auto-stop when idle
+    "RunningModeAutoStopTimeoutInMinutes": 60,
+    "RootVolumeSizeGib": 80,
+    "UserVolumeSizeGib": 100,
+})
+
+# Bundle type keyword -> compute type (simplified; production should query
+# the bundle details from AWS to get the actual compute type)
+_BUNDLE_COMPUTE_TYPES = MappingProxyType({
+    "STANDARD": "VALUE",
+    "PERFORMANCE": "PERFORMANCE",
+    "POWER": "POWER",
+    "POWERPRO": "POWERPRO",
+    "GRAPHICS_G4DN": "GRAPHICS_G4DN",
+    "GRAPHICSPRO_G4DN": "GRAPHICSPRO_G4DN",
+})
+
 
 class StreamingProtocol(Enum):
     """Streaming protocol options."""
@@ -68,8 +112,8 @@ class WorkSpaceConfigurator:
             Dictionary of WorkSpace properties
         """
         return {
-            "Protocols": ["WSP"],  # Only WSP enabled
-            "OperatingSystemName": None,  # Will be set based on request
+            "Protocols": list(WSP_ONLY_PROTOCOLS),  # Only WSP enabled
+            **_WSP_ONLY_PROPERTIES,
         }
     
     def get_security_group_policy_config(
@@ -96,16 +140,11 @@ class WorkSpaceConfigurator:
             Group Policy configuration dictionary
         """
         config = {
-            "clipboard_operations": False,
-            "usb_device_redirection": False,
-            "drive_redirection": False,
-            "file_transfer": False,
-            "printing": False,
+            **_DISABLED_EXFILTRATION_VECTORS,
             "screen_watermark": {
                 "enabled": True,
                 "text": f"User: {user_id} | Session: {session_id}",
-                "opacity": 0.3,
-                "position": "bottom_right"
+                **_WATERMARK_STYLE,
             }
         }
         
@@ -149,28 +188,19 @@ class WorkSpaceConfigurator:
             "UserName": user_name,
             "BundleId": bundle_id,
             "WorkspaceProperties": {
-                "RunningMode": "AUTO_STOP",  # Auto-stop when idle
-                "RunningModeAutoStopTimeoutInMinutes": 60,
-                "RootVolumeSizeGib": 80,
-                "UserVolumeSizeGib": 100,
+                **_WORKSPACE_PROPERTIES,
                 "ComputeTypeName": self._get_compute_type_from_bundle(bundle_id),
-                "Protocols": ["WSP"]  # WSP-only
+                "Protocols": list(WSP_ONLY_PROTOCOLS)  # WSP-only
             },
-            "Tags": tags or []
+            # Caller tags first, then the WorkSpace and user ID tags; the
+            # caller's list is not modified
+            "Tags": [
+                *(tags or ()),
+                {"Key": "WorkspaceId", "Value": workspace_id},
+                {"Key": "UserId", "Value": user_id}
+            ]
         }
         
-        # Add workspace ID tag
-        request["Tags"].append({
-            "Key": "WorkspaceId",
-            "Value": workspace_id
-        })
-        
-        # Add user ID tag
-        request["Tags"].append({
-            "Key": "UserId",
-            "Value": user_id
-        })
-        
         logger.info(
             "workspace_request_built",
             workspace_id=workspace_id,
@@ -190,19 +220,8 @@ class WorkSpaceConfigurator:
         Returns:
             Compute type name
         """
-        # This is a simplified mapping. In production, query the bundle details
-        # from AWS to get the actual compute type
-        bundle_type_map = {
-            "STANDARD": "VALUE",
-            "PERFORMANCE": "PERFORMANCE",
-            "POWER": "POWER",
-            "POWERPRO": "POWERPRO",
-            "GRAPHICS_G4DN": "GRAPHICS_G4DN",
-            "GRAPHICSPRO_G4DN": "GRAPHICSPRO_G4DN"
-        }
-        
         # Extract bundle type from bundle_id (simplified)
-        for bundle_type, compute_type in bundle_type_map.items():
+        for bundle_type, compute_type in _BUNDLE_COMPUTE_TYPES.items():
             if bundle_type in bundle_id.upper():
                 return compute_type
         
@@ -8,14 +8,18 @@ Requirements:
 """
 
 import logging
+import random
 import time
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Optional, List, Tuple
 from enum import Enum
 from datetime import datetime, timedelta
 
-import boto3
 from botocore.exceptions import ClientError, BotoCoreError
 
+from .aws_clients import get_aws_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,6 +33,16 @@ class CircuitState(Enum):
 class CircuitBreaker:
     """Circuit breaker pattern implementation for AWS API calls."""
     
+    __slots__ = (
+        "failure_threshold",
+        "timeout_seconds",
+        "success_threshold",
+        "failure_count",
+        "success_count",
+        "last_failure_time",
+        "state",
+    )
+    
     def __init__(
         self,
         failure_threshold: int = 5,
@@ -127,15 +141,44 @@ class WorkSpacesClient:
     MAX_BACKOFF = 16.0  # seconds
     BACKOFF_MULTIPLIER = 2.0
     
-    def __init__(self, region: str = "us-west-2"):
+    # Stale fallback configuration
+    STALE_MAX_AGE = timedelta(hours=24)
+    
+    # How long a per-WorkSpace describe result is reused; covers back-to-back
+    # verifications (WSP-only, domain join) within one provisioning flow
+    DESCRIBE_CACHE_TTL = 5.0  # seconds
+    DESCRIBE_CACHE_SIZE = 1024
+    
+    # Bulk creation: CreateWorkspaces accepts at most 25 WorkSpaces per call
+    CREATE_BATCH_SIZE = 25
+    CREATE_BULK_WORKERS = 8
+    
+    def __init__(
+        self,
+        region: str = "us-west-2",
+        use_stale_on_error: bool = True,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
         """Initialize WorkSpaces client.
         
         Args:
             region: AWS region for WorkSpaces operations
+            use_stale_on_error: Serve the last known bundle/directory listing
+                when the API is unavailable instead of raising
+            sleep: Function used to wait between retries
         """
         self.region = region
-        self.client = boto3.client("workspaces", region_name=region)
+        self._sleep = sleep
+        self.client = get_aws_client("workspaces", region)
         self.circuit_breaker = CircuitBreaker()
+        self.use_stale_on_error = use_stale_on_error
+        
+        # Last successful describe results: key -> (fetched_at, items)
+        self._stale_cache: Dict[Tuple, Tuple[datetime, List[Dict[str, Any]]]] = {}
+        
+        # Recent describe_workspaces records in fetch order:
+        # workspace_id -> (fetched_at, record)
+        self._describe_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
         
         logger.info("workspaces_client_initialized", region=region)
     
@@ -173,11 +216,13 @@ class WorkSpacesClient:
                     raise
                 
                 if attempt < self.MAX_RETRIES - 1:
+                    # Full jitter: spread concurrent retries across the backoff window
+                    delay = random.uniform(0, backoff)
                     logger.warning(
                         f"workspaces_api_retry attempt={attempt + 1} max_retries={self.MAX_RETRIES} "
-                        f"backoff_seconds={backoff} error_code={error_code}"
+                        f"backoff_seconds={delay:.2f} error_code={error_code}"
                     )
-                    time.sleep(backoff)
+                    self._sleep(delay)
                     backoff = min(backoff * self.BACKOFF_MULTIPLIER, self.MAX_BACKOFF)
                 else:
                     logger.error(
@@ -188,6 +233,52 @@ class WorkSpacesClient:
         
         raise last_exception
     
+    def _describe_with_stale_fallback(
+        self,
+        cache_key: Tuple,
+        func,
+        result_key: str
+    ) -> List[Dict[str, Any]]:
+        """Execute a describe call, falling back to the last known result.
+        
+        Read-only listings such as bundles and directories change rarely, so
+        during a control-plane outage (circuit open or retries exhausted) a
+        stale listing is preferable to failing the whole flow.
+        
+        Args:
+            cache_key: Key identifying the request parameters
+            func: Function performing the describe call
+            result_key: Response key holding the list of items
+            
+        Returns:
+            List of items from the API, or from the stale cache on failure
+            
+        Raises:
+            Exception: If the call fails and no usable cached result exists
+        """
+        try:
+            response = self._retry_with_backoff(func)
+        except Exception as e:
+            cached = self._stale_cache.get(cache_key)
+            if not self.use_stale_on_error or cached is None:
+                raise
+            
+            fetched_at, items = cached
+            age = datetime.utcnow() - fetched_at
+            if age > self.STALE_MAX_AGE:
+                del self._stale_cache[cache_key]
+                raise
+            
+            logger.warning(
+                f"workspaces_api_stale_fallback operation={cache_key[0]} stale=True "
+                f"age_seconds={int(age.total_seconds())} error={e}"
+            )
+            return list(items)
+        
+        items = response.get(result_key, [])
+        self._stale_cache[cache_key] = (datetime.utcnow(), list(items))
+        return items
+    
     def create_workspaces(
         self,
         workspaces: List[Dict[str, Any]]
@@ -227,6 +318,59 @@ class WorkSpacesClient:
         
         return response
     
+    def create_workspaces_bulk(
+        self,
+        workspaces: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Create any number of WorkSpaces in parallel batches.
+        
+        Splits the request into CreateWorkspaces-sized batches and submits
+        them concurrently over the shared connection pool. A batch that still
+        fails after retries is reported in FailedRequests rather than
+        aborting the other batches.
+        
+        Args:
+            workspaces: List of WorkSpace specifications
+            
+        Returns:
+            Merged response with PendingRequests and FailedRequests
+        """
+        batches = [
+            workspaces[i:i + self.CREATE_BATCH_SIZE]
+            for i in range(0, len(workspaces), self.CREATE_BATCH_SIZE)
+        ]
+        
+        def _create_batch(batch: List[Dict[str, Any]]) -> Dict[str, Any]:
+            try:
+                return self.create_workspaces(batch)
+            except Exception as e:
+                error_code = getattr(e, "response", {}).get("Error", {}).get("Code", "Unknown")
+                logger.error(
+                    f"workspaces_batch_failed count={len(batch)} error_code={error_code}"
+                )
+                return {
+                    "PendingRequests": [],
+                    "FailedRequests": [
+                        {
+                            "WorkspaceRequest": spec,
+                            "ErrorCode": error_code,
+                            "ErrorMessage": str(e)
+                        }
+                        for spec in batch
+                    ]
+                }
+        
+        pending: List[Dict[str, Any]] = []
+        failed: List[Dict[str, Any]] = []
+        if batches:
+            workers = min(self.CREATE_BULK_WORKERS, len(batches))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for response in executor.map(_create_batch, batches):
+                    pending.extend(response.get("PendingRequests", []))
+                    failed.extend(response.get("FailedRequests", []))
+        
+        return {"PendingRequests": pending, "FailedRequests": failed}
+    
     def describe_workspaces(
         self,
         workspace_ids: Optional[List[str]] = None,
@@ -235,6 +379,10 @@ class WorkSpacesClient:
     ) -> List[Dict[str, Any]]:
         """Describe WorkSpaces.
         
+        Lookups by WorkSpace ID alone are served from a short-lived cache,
+        so consecutive verifications of the same WorkSpace share a single
+        API call. Only the IDs missing from the cache are requested.
+        
         Args:
             workspace_ids: Optional list of WorkSpace IDs to describe
             directory_id: Optional directory ID filter
@@ -243,6 +391,9 @@ class WorkSpacesClient:
         Returns:
             List of WorkSpace descriptions
         """
+        if workspace_ids and not directory_id and not user_name:
+            return self._describe_workspaces_by_id(workspace_ids)
+        
         def _describe():
             params = {}
             if workspace_ids:
@@ -257,6 +408,61 @@ class WorkSpacesClient:
         response = self._retry_with_backoff(_describe)
         return response.get("Workspaces", [])
     
+    def _describe_workspaces_by_id(
+        self,
+        workspace_ids: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Describe WorkSpaces by ID through the short-lived describe cache.
+        
+        Args:
+            workspace_ids: WorkSpace IDs to describe
+            
+        Returns:
+            List of WorkSpace descriptions in request order; unknown IDs
+            are omitted
+        """
+        now = time.monotonic()
+        records: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for workspace_id in dict.fromkeys(workspace_ids):
+            cached = self._describe_cache.get(workspace_id)
+            if cached is not None and now - cached[0] < self.DESCRIBE_CACHE_TTL:
+                records[workspace_id] = cached[1]
+            else:
+                missing.append(workspace_id)
+        
+        if missing:
+            def _describe():
+                return self.client.describe_workspaces(WorkspaceIds=missing)
+            
+            response = self._retry_with_backoff(_describe)
+            fetched_at = time.monotonic()
+            for record in response.get("Workspaces", []):
+                workspace_id = record.get("WorkspaceId")
+                records[workspace_id] = record
+                self._describe_cache[workspace_id] = (fetched_at, record)
+                self._describe_cache.move_to_end(workspace_id)
+            
+            # Entries are kept in fetch order, so expired records (and the
+            # oldest, once over the size limit) sit at the front
+            cache = self._describe_cache
+            while cache and (
+                len(cache) > self.DESCRIBE_CACHE_SIZE
+                or fetched_at - next(iter(cache.values()))[0] >= self.DESCRIBE_CACHE_TTL
+            ):
+                cache.popitem(last=False)
+        
+        return [records[ws_id] for ws_id in workspace_ids if ws_id in records]
+    
+    def _invalidate_described(self, workspace_ids: List[str]) -> None:
+        """Drop cached describe records for WorkSpaces whose state changes.
+        
+        Args:
+            workspace_ids: WorkSpace IDs to drop from the describe cache
+        """
+        for workspace_id in workspace_ids:
+            self._describe_cache.pop(workspace_id, None)
+    
     def start_workspaces(self, workspace_ids: List[str]) -> Dict[str, Any]:
         """Start one or more WorkSpaces.
         
@@ -272,6 +478,7 @@ class WorkSpacesClient:
         
         logger.info("starting_workspaces", workspace_ids=workspace_ids)
         response = self._retry_with_backoff(_start)
+        self._invalidate_described(workspace_ids)
         
         logger.info(
             "workspaces_start_initiated",
@@ -295,6 +502,7 @@ class WorkSpacesClient:
         
         logger.info("stopping_workspaces", workspace_ids=workspace_ids)
         response = self._retry_with_backoff(_stop)
+        self._invalidate_described(workspace_ids)
         
         logger.info(
             "workspaces_stop_initiated",
@@ -318,6 +526,7 @@ class WorkSpacesClient:
         
         logger.info("terminating_workspaces", workspace_ids=workspace_ids)
         response = self._retry_with_backoff(_terminate)
+        self._invalidate_described(workspace_ids)
         
         logger.info(
             "workspaces_terminated",
@@ -352,7 +561,9 @@ class WorkSpacesClient:
             properties=properties
         )
         
-        return self._retry_with_backoff(_modify)
+        response = self._retry_with_backoff(_modify)
+        self._invalidate_described([workspace_id])
+        return response
     
     def describe_workspace_bundles(
         self,
@@ -366,7 +577,8 @@ class WorkSpacesClient:
             owner: Optional owner filter (AMAZON or account ID)
             
         Returns:
-            List of bundle descriptions
+            List of bundle descriptions (last known listing if the API is
+            unavailable and use_stale_on_error is set)
         """
         def _describe():
             params = {}
@@ -377,8 +589,8 @@ class WorkSpacesClient:
             
             return self.client.describe_workspace_bundles(**params)
         
-        response = self._retry_with_backoff(_describe)
-        return response.get("Bundles", [])
+        cache_key = ("describe_workspace_bundles", tuple(bundle_ids or ()), owner)
+        return self._describe_with_stale_fallback(cache_key, _describe, "Bundles")
     
     def describe_workspace_directories(
         self,
@@ -390,7 +602,8 @@ class WorkSpacesClient:
             directory_ids: Optional list of directory IDs
             
         Returns:
-            List of directory descriptions
+            List of directory descriptions (last known listing if the API is
+            unavailable and use_stale_on_error is set)
         """
         def _describe():
             params = {}
@@ -399,5 +612,5 @@ class WorkSpacesClient:
             
             return self.client.describe_workspace_directories(**params)
         
-        response = self._retry_with_backoff(_describe)
-        return response.get("Directories", [])
+        cache_key = ("describe_workspace_directories", tuple(directory_ids or ()))
+        return self._describe_with_stale_fallback(cache_key, _describe, "Directories")
@@ -0,0 +1,96 @@
+"""Shared pytest fixtures for RobCo Forge API tests.
+
+Session-scoped fixtures here are built once per test process (once per
+worker under pytest-xdist) and reused by every test that requests them.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.auth import RBACManager
+from src.auth.jwt_manager import get_cached_jwt_manager
+from src.lucy.audit import AuditEventBuffer
+
+
+@pytest.fixture(scope="session")
+def rbac():
+    """Shared RBAC manager (stateless, safe to reuse across tests)."""
+    return RBACManager()
+
+
+@pytest.fixture(scope="session")
+def jwt_manager():
+    """Shared JWT manager (holds only signing configuration)."""
+    return get_cached_jwt_manager(secret_key="test-secret")
+
+
+@pytest.fixture(autouse=True)
+def lucy_audit_buffer():
+    """Swap the global Lucy audit buffer for a per-test one without a flusher.
+    
+    Events a test buffers are discarded with it, so nothing is written to
+    the real database by the flusher thread or at interpreter exit.
+    """
+    buffer = AuditEventBuffer(start_flusher=False)
+    with patch('src.lucy.audit._audit_buffer', buffer):
+        yield buffer
+
+
+class RecordingRedis:
+    """Stand-in for the Redis commands the rate limiter uses.
+    
+    ``count`` and ``oldest`` are what ZCARD and ZRANGE return.
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self.oldest = []
+        self.commands = []
+        self.round_trips = 0
+    
+    def zremrangebyscore(self, key, min_score, max_score):
+        self.commands.append("zremrangebyscore")
+    
+    def zcard(self, key):
+        self.commands.append("zcard")
+        return self.count
+    
+    def zrange(self, key, start, end, withscores=False):
+        self.commands.append("zrange")
+        return self.oldest
+    
+    def zadd(self, key, mapping):
+        self.commands.append("zadd")
+    
+    def expire(self, key, seconds):
+        self.commands.append("expire")
+    
+    def pipeline(self):
+        return RecordingPipeline(self)
+
+
+class RecordingPipeline:
+    """Queues commands and runs them on a RecordingRedis in one round trip."""
+    
+    def __init__(self, redis):
+        self.redis = redis
+        self.queued = []
+    
+    def __getattr__(self, name):
+        command = getattr(self.redis, name)
+        
+        def queue(*args, **kwargs):
+            self.queued.append((command, args, kwargs))
+            return self
+        return queue
+    
+    def execute(self):
+        self.redis.round_trips += 1
+        queued, self.queued = self.queued, []
+        return [command(*args, **kwargs) for command, args, kwargs in queued]
+
+
+@pytest.fixture
+def recording_redis():
+    """Redis stand-in that records rate limiter commands and round trips."""
+    return RecordingRedis()
@@ -0,0 +1,65 @@
+"""Lucy conversation corpus, split by category.
+
+Each category lives in its own module and is only imported when first
+requested, so tests that exercise a single category skip building the rest.
+Use tests.lucy_conversation_corpus for the eagerly assembled full corpus.
+
+Requirements: 5.3, 5.4, 5.5, 5.6
+"""
+
+import importlib
+from typing import Iterator, Tuple
+
+from .case import ConversationTestCase, ExpectedError, NO_ENTITIES
+
+# Category name -> module name, in corpus order
+_MODULES = {
+    "provisioning": "provisioning",
+    "management": "management",
+    "cost": "cost",
+    "diagnostics": "diagnostics",
+    "error": "error",
+    "rbac": "rbac",
+    "budget": "budget",
+    "support": "support",
+    "general": "general",
+}
+
+CATEGORIES: Tuple[str, ...] = tuple(_MODULES)
+
+
+def get_test_cases_by_category(category: str) -> Tuple[ConversationTestCase, ...]:
+    """Get all test cases for a category, importing its module on demand.
+    
+    Args:
+        category: Category name (provisioning, cost, error, rbac, etc.)
+        
+    Returns:
+        Test cases in that category (empty for unknown categories)
+    """
+    module_name = _MODULES.get(category)
+    if module_name is None:
+        return ()
+    
+    module = importlib.import_module(f".{module_name}", __package__)
+    return module.CASES
+
+
+def iter_all_cases() -> Iterator[ConversationTestCase]:
+    """Iterate over every test case in corpus order.
+    
+    Yields:
+        Test cases, category by category
+    """
+    for category in _MODULES:
+        yield from get_test_cases_by_category(category)
+
+
+__all__ = [
+    "ConversationTestCase",
+    "ExpectedError",
+    "NO_ENTITIES",
+    "CATEGORIES",
+    "get_test_cases_by_category",
+    "iter_all_cases",
+]
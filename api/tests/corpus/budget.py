@@ -0,0 +1,31 @@
+"""Budget denial test cases for the Lucy conversation corpus."""
+
+from typing import Final, Tuple
+
+from .case import ConversationTestCase, ExpectedError
+
+
+CASES: Final[Tuple[ConversationTestCase, ...]] = (
+    ConversationTestCase(
+        id="budget_001",
+        category="budget",
+        user_message="Launch a Graphics workspace",
+        expected_intent="provision_workspace",
+        expected_tool="provision_workspace",
+        expected_entities=(("bundle_type", "GRAPHICS_G4DN"),),
+        description="Provisioning request exceeding budget",
+        should_succeed=False,
+        expected_error=ExpectedError.BUDGET_EXCEEDED
+    ),
+    ConversationTestCase(
+        id="budget_002",
+        category="budget",
+        user_message="Create 5 Power workspaces",
+        expected_intent="provision_workspace",
+        expected_tool="provision_workspace",
+        expected_entities=(("bundle_type", "POWER"), ("count", 5)),
+        description="Bulk provisioning exceeding budget",
+        should_succeed=False,
+        expected_error=ExpectedError.BUDGET_EXCEEDED
+    ),
+)
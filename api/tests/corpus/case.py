@@ -0,0 +1,58 @@
+"""Test case type for the Lucy conversation corpus."""
+
+import sys
+from enum import IntEnum
+from typing import Any, Optional, Tuple
+from dataclasses import dataclass
+
+
+class ExpectedError(IntEnum):
+    """Errors Lucy is expected to produce for failing requests."""
+    CLARIFICATION_NEEDED = 1
+    MISSING_WORKSPACE_ID = 2
+    INVALID_WORKSPACE_ID = 3
+    OUT_OF_SCOPE = 4
+    RBAC_DENIED = 5
+    BUDGET_EXCEEDED = 6
+    
+    @property
+    def code(self) -> str:
+        """Lowercase string code (e.g. "rbac_denied") for string matching."""
+        return self.name.lower()
+
+
+# Shared value for cases that expect no entities
+NO_ENTITIES: Tuple[Tuple[str, Any], ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class ConversationTestCase:
+    """A single test case for Lucy conversation evaluation.
+    
+    Attributes:
+        id: Unique identifier for the test case
+        category: Category of the test (provisioning, cost, error, rbac)
+        user_message: The user's input message
+        expected_intent: The intent Lucy should recognize
+        expected_tool: The tool Lucy should select (if applicable)
+        expected_entities: Entities Lucy should extract, as (key, value) pairs
+        description: Human-readable description of what's being tested
+        should_succeed: Whether the request should succeed
+        expected_error: Expected error (if should_succeed=False)
+    """
+    id: str
+    category: str
+    user_message: str
+    expected_intent: str
+    expected_tool: Optional[str]
+    expected_entities: Tuple[Tuple[str, Any], ...]
+    description: str
+    should_succeed: bool = True
+    expected_error: Optional[ExpectedError] = None
+    
+    def __post_init__(self):
+        """Intern frequently repeated string fields."""
+        object.__setattr__(self, "category", sys.intern(self.category))
+        object.__setattr__(self, "expected_intent", sys.intern(self.expected_intent))
+        if self.expected_tool is not None:
+            object.__setattr__(self, "expected_tool", sys.intern(self.expected_tool))
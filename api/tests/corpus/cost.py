@@ -0,0 +1,72 @@
+"""Cost query test cases for the Lucy conversation corpus."""
+
+from typing import Final, Tuple
+
+from .case import ConversationTestCase, NO_ENTITIES
+
+
+CASES: Final[Tuple[ConversationTestCase, ...]] = (
+    ConversationTestCase(
+        id="cost_001",
+        category="cost",
+        user_message="How much am I spending this month?",
+        expected_intent="get_cost_summary",
+        expected_tool="get_cost_summary",
+        expected_entities=(("time_period", "month"),),
+        description="Get monthly cost summary"
+    ),
+    ConversationTestCase(
+        id="cost_002",
+        category="cost",
+        user_message="Show me cost recommendations",
+        expected_intent="get_cost_recommendations",
+        expected_tool="get_cost_recommendations",
+        expected_entities=NO_ENTITIES,
+        description="Get cost optimization recommendations"
+    ),
+    ConversationTestCase(
+        id="cost_003",
+        category="cost",
+        user_message="What's my team's budget status?",
+        expected_intent="check_budget",
+        expected_tool="check_budget",
+        expected_entities=(("scope", "team"),),
+        description="Check team budget"
+    ),
+    ConversationTestCase(
+        id="cost_004",
+        category="cost",
+        user_message="How much did I spend last week?",
+        expected_intent="get_cost_summary",
+        expected_tool="get_cost_summary",
+        expected_entities=(("time_period", "week"),),
+        description="Get weekly cost summary"
+    ),
+    ConversationTestCase(
+        id="cost_005",
+        category="cost",
+        user_message="What are my workspace costs by project?",
+        expected_intent="get_cost_summary",
+        expected_tool="get_cost_summary",
+        expected_entities=(("group_by", "project"),),
+        description="Get costs grouped by project"
+    ),
+    ConversationTestCase(
+        id="cost_006",
+        category="cost",
+        user_message="Am I close to my budget limit?",
+        expected_intent="check_budget",
+        expected_tool="check_budget",
+        expected_entities=NO_ENTITIES,
+        description="Check personal budget status"
+    ),
+    ConversationTestCase(
+        id="cost_007",
+        category="cost",
+        user_message="Can I save money on my workspaces?",
+        expected_intent="get_cost_recommendations",
+        expected_tool="get_cost_recommendations",
+        expected_entities=NO_ENTITIES,
+        description="Request cost savings recommendations"
+    ),
+)
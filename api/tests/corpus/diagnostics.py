@@ -0,0 +1,36 @@
+"""Diagnostics test cases for the Lucy conversation corpus."""
+
+from typing import Final, Tuple
+
+from .case import ConversationTestCase
+
+
+CASES: Final[Tuple[ConversationTestCase, ...]] = (
+    ConversationTestCase(
+        id="diag_001",
+        category="diagnostics",
+        user_message="Run diagnostics on workspace ws-abc123",
+        expected_intent="run_diagnostics",
+        expected_tool="run_diagnostics",
+        expected_entities=(("workspace_id", "ws-abc123"),),
+        description="Run diagnostics on specific workspace"
+    ),
+    ConversationTestCase(
+        id="diag_002",
+        category="diagnostics",
+        user_message="My workspace is slow, can you check it?",
+        expected_intent="troubleshoot",
+        expected_tool="run_diagnostics",
+        expected_entities=(("issue", "slow"),),
+        description="Troubleshoot performance issue"
+    ),
+    ConversationTestCase(
+        id="diag_003",
+        category="diagnostics",
+        user_message="Why can't I connect to my workspace?",
+        expected_intent="troubleshoot",
+        expected_tool="run_diagnostics",
+        expected_entities=(("issue", "connection"),),
+        description="Troubleshoot connection issue"
+    ),
+)
@@ -0,0 +1,62 @@
+"""Error scenario test cases for the Lucy conversation corpus."""
+
+from typing import Final, Tuple
+
+from .case import ConversationTestCase, ExpectedError, NO_ENTITIES
+
+
+CASES: Final[Tuple[ConversationTestCase, ...]] = (
+    ConversationTestCase(
+        id="err_001",
+        category="error",
+        user_message="Launch a workspace",
+        expected_intent="provision_workspace",
+        expected_tool="provision_workspace",
+        expected_entities=NO_ENTITIES,
+        description="Ambiguous provisioning request - missing bundle type",
+        should_succeed=False,
+        expected_error=ExpectedError.CLARIFICATION_NEEDED
+    ),
+    ConversationTestCase(
+        id="err_002",
+        category="error",
+        user_message="Stop workspace",
+        expected_intent="stop_workspace",
+        expected_tool="stop_workspace",
+        expected_entities=NO_ENTITIES,
+        description="Missing workspace identifier",
+        should_succeed=False,
+        expected_error=ExpectedError.MISSING_WORKSPACE_ID
+    ),
+    ConversationTestCase(
+        id="err_003",
+        category="error",
+        user_message="Start workspace ws-invalid-id",
+        expected_intent="start_workspace",
+        expected_tool="start_workspace",
+        expected_entities=(("workspace_id", "ws-invalid-id"),),
+        description="Invalid workspace ID format",
+        should_succeed=False,
+        expected_error=ExpectedError.INVALID_WORKSPACE_ID
+    ),
+    ConversationTestCase(
+        id="err_004",
+        category="error",
+        user_message="Give me a super ultra mega powerful workspace",
+        expected_intent="recommend_bundle",
+        expected_tool=None,
+        expected_entities=(("requirements", ("powerful",)),),
+        description="Vague requirements needing clarification"
+    ),
+    ConversationTestCase(
+        id="err_005",
+        category="error",
+        user_message="What's the weather like?",
+        expected_intent="unknown",
+        expected_tool=None,
+        expected_entities=NO_ENTITIES,
+        description="Out of scope request",
+        should_succeed=False,
+        expected_error=ExpectedError.OUT_OF_SCOPE
+    ),
+)
@@ -0,0 +1,36 @@
+"""General conversation test cases for the Lucy conversation corpus."""
+
+from typing import Final, Tuple
+
+from .case import ConversationTestCase, NO_ENTITIES
+
+
+CASES: Final[Tuple[ConversationTestCase, ...]] = (
+    ConversationTestCase(
+        id="gen_001",
+        category="general",
+        user_message="Hello Lucy",
+        expected_intent="greeting",
+        expected_tool=None,
+        expected_entities=NO_ENTITIES,
+        description="Greeting message"
+    ),
+    ConversationTestCase(
+        id="gen_002",
+        category="general",
+        user_message="What can you help me with?",
+        expected_intent="help",
+        expected_tool=None,
+        expected_entities=NO_ENTITIES,
+        description="Help request"
+    ),
+    ConversationTestCase(
+        id="gen_003",
+        category="general",
+        user_message="Thanks for your help!",
+        expected_intent="greeting",
+        expected_tool=None,
+        expected_entities=NO_ENTITIES,
+        description="Thank you message"
+    ),
+)
@@ -0,0 +1,63 @@
+"""Workspace management test cases for the Lucy conversation corpus."""
+
+from typing import Final, Tuple
+
+from .case import ConversationTestCase, NO_ENTITIES
+
+
+CASES: Final[Tuple[ConversationTestCase, ...]] = (
+    ConversationTestCase(
+        id="mgmt_001",
+        category="management",
+        user_message="Show me my workspaces",
+        expected_intent="list_workspaces",
+        expected_tool="list_workspaces",
+        expected_entities=NO_ENTITIES,
+        description="List all user workspaces"
+    ),
+    ConversationTestCase(
+        id="mgmt_002",
+        category="management",
+        user_message="Start workspace ws-abc123",
+        expected_intent="start_workspace",
+        expected_tool="start_workspace",
+        expected_entities=(("workspace_id", "ws-abc123"),),
+        description="Start specific workspace by ID"
+    ),
+    ConversationTestCase(
+        id="mgmt_003",
+        category="management",
+        user_message="Stop my GPU workspace",
+        expected_intent="stop_workspace",
+        expected_tool="stop_workspace",
+        expected_entities=(("bundle_type", "gpu"),),
+        description="Stop workspace by bundle type description"
+    ),
+    ConversationTestCase(
+        id="mgmt_004",
+        category="management",
+        user_message="Terminate workspace ws-xyz789",
+        expected_intent="terminate_workspace",
+        expected_tool="terminate_workspace",
+        expected_entities=(("workspace_id", "ws-xyz789"),),
+        description="Terminate specific workspace"
+    ),
+    ConversationTestCase(
+        id="mgmt_005",
+        category="management",
+        user_message="What's the status of my workspaces?",
+        expected_intent="get_workspace_status",
+        expected_tool="list_workspaces",
+        expected_entities=NO_ENTITIES,
+        description="Check workspace status"
+    ),
+    ConversationTestCase(
+        id="mgmt_006",
+        category="management",
+        user_message="List all my running workspaces",
+        expected_intent="list_workspaces",
+        expected_tool="list_workspaces",
+        expected_entities=(("status", "running"),),
+        description="List workspaces filtered by status"
+    ),
+)
@@ -0,0 +1,81 @@
+"""Provisioning request test cases for the Lucy conversation corpus."""
+
+from typing import Final, Tuple
+
+from .case import ConversationTestCase
+
+
+CASES: Final[Tuple[ConversationTestCase, ...]] = (
+    ConversationTestCase(
+        id="prov_001",
+        category="provisioning",
+        user_message="I need a GPU workspace for machine learning",
+        expected_intent="recommend_bundle",
+        expected_tool=None,
+        expected_entities=(("requirements", ("gpu", "ml")),),
+        description="Request for GPU workspace with ML requirements"
+    ),
+    ConversationTestCase(
+        id="prov_002",
+        category="provisioning",
+        user_message="Launch a standard workspace with Windows",
+        expected_intent="provision_workspace",
+        expected_tool="provision_workspace",
+        expected_entities=(("bundle_type", "STANDARD"), ("os", "Windows")),
+        description="Direct provisioning request with bundle and OS"
+    ),
+    ConversationTestCase(
+        id="prov_003",
+        category="provisioning",
+        user_message="Can you provision a Performance bundle for me?",
+        expected_intent="provision_workspace",
+        expected_tool="provision_workspace",
+        expected_entities=(("bundle_type", "PERFORMANCE"),),
+        description="Provisioning request with specific bundle type"
+    ),
+    ConversationTestCase(
+        id="prov_004",
+        category="provisioning",
+        user_message="I need a workspace for running simulations",
+        expected_intent="recommend_bundle",
+        expected_tool=None,
+        expected_entities=(("requirements", ("simulation",)),),
+        description="Provisioning request requiring bundle recommendation"
+    ),
+    ConversationTestCase(
+        id="prov_005",
+        category="provisioning",
+        user_message="Create a Power workspace with the data-science blueprint",
+        expected_intent="provision_workspace",
+        expected_tool="provision_workspace",
+        expected_entities=(("bundle_type", "POWER"), ("blueprint", "data-science")),
+        description="Provisioning with bundle and blueprint specified"
+    ),
+    ConversationTestCase(
+        id="prov_006",
+        category="provisioning",
+        user_message="I need a Linux workspace for development",
+        expected_intent="provision_workspace",
+        expected_tool="provision_workspace",
+        expected_entities=(("os", "Linux"),),
+        description="Provisioning request with OS but no bundle"
+    ),
+    ConversationTestCase(
+        id="prov_007",
+        category="provisioning",
+        user_message="What workspace should I use for AI training?",
+        expected_intent="recommend_bundle",
+        expected_tool=None,
+        expected_entities=(("requirements", ("ai",)),),
+        description="Bundle recommendation for AI workload"
+    ),
+    ConversationTestCase(
+        id="prov_008",
+        category="provisioning",
+        user_message="Launch a GraphicsPro workspace in us-west-2",
+        expected_intent="provision_workspace",
+        expected_tool="provision_workspace",
+        expected_entities=(("bundle_type", "GRAPHICSPRO_G4DN"), ("region", "us-west-2")),
+        description="Provisioning with bundle and region specified"
+    ),
+)
@@ -0,0 +1,42 @@
+"""RBAC denial test cases for the Lucy conversation corpus."""
+
+from typing import Final, Tuple
+
+from .case import ConversationTestCase, ExpectedError
+
+
+CASES: Final[Tuple[ConversationTestCase, ...]] = (
+    ConversationTestCase(
+        id="rbac_001",
+        category="rbac",
+        user_message="Launch a PowerPro workspace",
+        expected_intent="provision_workspace",
+        expected_tool="provision_workspace",
+        expected_entities=(("bundle_type", "POWERPRO"),),
+        description="Contractor requesting restricted bundle",
+        should_succeed=False,
+        expected_error=ExpectedError.RBAC_DENIED
+    ),
+    ConversationTestCase(
+        id="rbac_002",
+        category="rbac",
+        user_message="Terminate workspace ws-other-user-123",
+        expected_intent="terminate_workspace",
+        expected_tool="terminate_workspace",
+        expected_entities=(("workspace_id", "ws-other-user-123"),),
+        description="User attempting to terminate another user's workspace",
+        should_succeed=False,
+        expected_error=ExpectedError.RBAC_DENIED
+    ),
+    ConversationTestCase(
+        id="rbac_003",
+        category="rbac",
+        user_message="Show me all team workspaces",
+        expected_intent="list_workspaces",
+        expected_tool="list_workspaces",
+        expected_entities=(("scope", "team"),),
+        description="Non-team-lead requesting team-wide view",
+        should_succeed=False,
+        expected_error=ExpectedError.RBAC_DENIED
+    ),
+)
@@ -0,0 +1,27 @@
+"""Support and routing test cases for the Lucy conversation corpus."""
+
+from typing import Final, Tuple
+
+from .case import ConversationTestCase
+
+
+CASES: Final[Tuple[ConversationTestCase, ...]] = (
+    ConversationTestCase(
+        id="support_001",
+        category="support",
+        user_message="I need help with my workspace configuration",
+        expected_intent="create_support_ticket",
+        expected_tool="create_support_ticket",
+        expected_entities=(("issue_type", "configuration"),),
+        description="Request for support ticket creation"
+    ),
+    ConversationTestCase(
+        id="support_002",
+        category="support",
+        user_message="Can I get access to the production blueprint?",
+        expected_intent="request_approval",
+        expected_tool="create_support_ticket",
+        expected_entities=(("request_type", "access"),),
+        description="Request requiring approval workflow"
+    ),
+)
@@ -0,0 +1 @@
+"""Performance regression tests for RobCo Forge API."""
@@ -0,0 +1,24 @@
+"""Shared configuration for performance regression tests.
+
+Perf tests are timing-sensitive, so they only run when RUN_PERF_TESTS is set.
+"""
+
+import os
+
+import pytest
+
+
+def pytest_configure(config):
+    """Register the perf marker."""
+    config.addinivalue_line("markers", "perf: timing-based performance regression test")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip perf tests unless explicitly enabled."""
+    if os.environ.get("RUN_PERF_TESTS"):
+        return
+    
+    skip_perf = pytest.mark.skip(reason="set RUN_PERF_TESTS=1 to run perf tests")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip_perf)
@@ -0,0 +1,44 @@
+"""Performance tests for conversation corpus lookups.
+
+Guards against corpus lookups regressing to linear scans as the corpus grows.
+"""
+
+import time
+
+import pytest
+
+from tests.lucy_conversation_corpus import CONVERSATION_CORPUS, get_test_case_by_id
+
+
+ITERATIONS = 10_000
+
+
+def _time_lookup(test_id: str) -> int:
+    """Time repeated lookups of a single case ID.
+    
+    Args:
+        test_id: Test case ID to look up
+        
+    Returns:
+        Elapsed time in nanoseconds
+    """
+    start = time.perf_counter_ns()
+    for _ in range(ITERATIONS):
+        get_test_case_by_id(test_id)
+    return time.perf_counter_ns() - start
+
+
+@pytest.mark.perf
+def test_lookup_is_constant_time():
+    """Test looking up the last case costs about the same as the first."""
+    first_id = CONVERSATION_CORPUS[0].id
+    last_id = CONVERSATION_CORPUS[-1].id
+    
+    # Warm up
+    _time_lookup(first_id)
+    _time_lookup(last_id)
+    
+    first_ns = _time_lookup(first_id)
+    last_ns = _time_lookup(last_id)
+    
+    assert last_ns / first_ns < 3
@@ -4,15 +4,14 @@ import pytest
 from datetime import datetime, timedelta
 
 from src.auth import JWTManager, RBACManager, Role, Permission
+from src.auth.jwt_manager import get_cached_jwt_manager
 
 
 class TestJWTManager:
     """Test JWT token generation and validation."""
     
-    def test_generate_and_validate_token(self):
+    def test_generate_and_validate_token(self, jwt_manager):
         """Test basic token generation and validation."""
-        jwt_manager = JWTManager(secret_key="test-secret")
-        
         # Generate token
         token = jwt_manager.generate_token(
             user_id="test@robco.com",
@@ -31,10 +30,8 @@ class TestJWTManager:
         assert payload["roles"] == ["engineer"]
         assert payload["type"] == "access"
     
-    def test_contractor_time_bound_credentials(self):
+    def test_contractor_time_bound_credentials(self, jwt_manager):
         """Test time-bound credentials for contractors."""
-        jwt_manager = JWTManager(secret_key="test-secret")
-        
         # Generate token with custom expiry (1 hour from now)
         custom_expiry = datetime.utcnow() + timedelta(hours=1)
         token = jwt_manager.generate_token(
@@ -54,10 +51,8 @@ class TestJWTManager:
         token_exp = datetime.utcfromtimestamp(payload["exp"])
         assert abs((token_exp - custom_expiry).total_seconds()) < 60
     
-    def test_refresh_token(self):
+    def test_refresh_token(self, jwt_manager):
         """Test refresh token generation and usage."""
-        jwt_manager = JWTManager(secret_key="test-secret")
-        
         # Generate refresh token
         refresh_token = jwt_manager.generate_token(
             user_id="test@robco.com",
@@ -74,127 +69,66 @@ class TestJWTManager:
         # Validate new access token
         payload = jwt_manager.validate_token(new_access_token)
         assert payload["type"] == "access"
+    
+    def test_cached_jwt_manager_reused(self, jwt_manager):
+        """Test the cached factory returns one manager per configuration."""
+        assert get_cached_jwt_manager(secret_key="test-secret") is jwt_manager
+        assert get_cached_jwt_manager(secret_key="other-secret") is not jwt_manager
+        assert isinstance(jwt_manager, JWTManager)
 
 
 class TestRBACManager:
     """Test RBAC permission system."""
     
-    def test_contractor_permissions(self):
-        """Test contractor has limited permissions."""
-        rbac = RBACManager()
-        
-        # Contractor should have workspace create permission
-        assert rbac.has_permission(
-            user_roles=["contractor"],
-            required_permission=Permission.WORKSPACE_CREATE,
-        )
-        
-        # Contractor should NOT have workspace delete permission
-        assert not rbac.has_permission(
-            user_roles=["contractor"],
-            required_permission=Permission.WORKSPACE_DELETE,
-        )
-        
-        # Contractor should NOT have blueprint create permission
-        assert not rbac.has_permission(
-            user_roles=["contractor"],
-            required_permission=Permission.BLUEPRINT_CREATE,
-        )
-    
-    def test_engineer_permissions(self):
-        """Test engineer has standard permissions."""
-        rbac = RBACManager()
-        
-        # Engineer should have full workspace permissions
-        assert rbac.has_permission(
-            user_roles=["engineer"],
-            required_permission=Permission.WORKSPACE_CREATE,
-        )
-        assert rbac.has_permission(
-            user_roles=["engineer"],
-            required_permission=Permission.WORKSPACE_DELETE,
-        )
-        
-        # Engineer should have blueprint create permission
-        assert rbac.has_permission(
-            user_roles=["engineer"],
-            required_permission=Permission.BLUEPRINT_CREATE,
-        )
-        
-        # Engineer should NOT have user management permissions
-        assert not rbac.has_permission(
-            user_roles=["engineer"],
-            required_permission=Permission.USER_ASSIGN_ROLE,
-        )
-    
-    def test_team_lead_permissions(self):
-        """Test team lead has elevated permissions."""
-        rbac = RBACManager()
-        
-        # Team lead should have all engineer permissions
-        assert rbac.has_permission(
-            user_roles=["team_lead"],
-            required_permission=Permission.WORKSPACE_CREATE,
-        )
-        
-        # Team lead should have budget update permission
-        assert rbac.has_permission(
-            user_roles=["team_lead"],
-            required_permission=Permission.BUDGET_UPDATE,
-        )
-        
-        # Team lead should have audit read permission
-        assert rbac.has_permission(
-            user_roles=["team_lead"],
-            required_permission=Permission.AUDIT_READ,
-        )
-    
-    def test_admin_permissions(self):
-        """Test admin has all permissions."""
-        rbac = RBACManager()
-        
-        # Admin should have all permissions
+    @pytest.mark.parametrize("role,permission,allowed", [
+        # Contractor has limited permissions
+        ("contractor", Permission.WORKSPACE_CREATE, True),
+        ("contractor", Permission.WORKSPACE_DELETE, False),
+        ("contractor", Permission.BLUEPRINT_CREATE, False),
+        # Engineer has standard permissions
+        ("engineer", Permission.WORKSPACE_CREATE, True),
+        ("engineer", Permission.WORKSPACE_DELETE, True),
+        ("engineer", Permission.BLUEPRINT_CREATE, True),
+        ("engineer", Permission.USER_ASSIGN_ROLE, False),
+        # Team lead has elevated permissions
+        ("team_lead", Permission.WORKSPACE_CREATE, True),
+        ("team_lead", Permission.BUDGET_UPDATE, True),
+        ("team_lead", Permission.AUDIT_READ, True),
+        # Admin has all permissions
+        ("admin", Permission.WORKSPACE_CREATE, True),
+        ("admin", Permission.USER_ASSIGN_ROLE, True),
+        ("admin", Permission.BUDGET_OVERRIDE, True),
+    ])
+    def test_role_permission(self, rbac, role, permission, allowed):
+        """Test each role is granted or denied the expected permission."""
         assert rbac.has_permission(
-            user_roles=["admin"],
-            required_permission=Permission.WORKSPACE_CREATE,
-        )
-        assert rbac.has_permission(
-            user_roles=["admin"],
-            required_permission=Permission.USER_ASSIGN_ROLE,
-        )
-        assert rbac.has_permission(
-            user_roles=["admin"],
-            required_permission=Permission.BUDGET_OVERRIDE,
-        )
+            user_roles=[role],
+            required_permission=permission,
+        ) is allowed
     
-    def test_bundle_type_restrictions(self):
-        """Test bundle type access restrictions."""
-        rbac = RBACManager()
-        
+    @pytest.mark.parametrize("role,bundle,allowed", [
         # Contractor can only access Standard and Performance
-        assert rbac.check_bundle_access(["contractor"], "STANDARD")
-        assert rbac.check_bundle_access(["contractor"], "PERFORMANCE")
-        assert not rbac.check_bundle_access(["contractor"], "POWER")
-        assert not rbac.check_bundle_access(["contractor"], "GRAPHICS_G4DN")
-        assert not rbac.check_bundle_access(["contractor"], "GRAPHICSPRO_G4DN")
-        
+        ("contractor", "STANDARD", True),
+        ("contractor", "PERFORMANCE", True),
+        ("contractor", "POWER", False),
+        ("contractor", "GRAPHICS_G4DN", False),
+        ("contractor", "GRAPHICSPRO_G4DN", False),
         # Engineer can access most bundles except GraphicsPro
-        assert rbac.check_bundle_access(["engineer"], "STANDARD")
-        assert rbac.check_bundle_access(["engineer"], "PERFORMANCE")
-        assert rbac.check_bundle_access(["engineer"], "POWER")
-        assert rbac.check_bundle_access(["engineer"], "GRAPHICS_G4DN")
-        assert not rbac.check_bundle_access(["engineer"], "GRAPHICSPRO_G4DN")
-        
-        # Team lead can access all bundles
-        assert rbac.check_bundle_access(["team_lead"], "GRAPHICSPRO_G4DN")
-        
-        # Admin can access all bundles
-        assert rbac.check_bundle_access(["admin"], "GRAPHICSPRO_G4DN")
+        ("engineer", "STANDARD", True),
+        ("engineer", "PERFORMANCE", True),
+        ("engineer", "POWER", True),
+        ("engineer", "GRAPHICS_G4DN", True),
+        ("engineer", "GRAPHICSPRO_G4DN", False),
+        # Team lead and admin can access all bundles
+        ("team_lead", "GRAPHICSPRO_G4DN", True),
+        ("admin", "GRAPHICSPRO_G4DN", True),
+    ])
+    def test_bundle_type_restrictions(self, rbac, role, bundle, allowed):
+        """Test bundle type access restrictions."""
+        assert rbac.check_bundle_access([role], bundle) is allowed
     
-    def test_allowed_bundle_types(self):
+    def test_allowed_bundle_types(self, rbac):
         """Test getting list of allowed bundle types."""
-        rbac = RBACManager()
-        
         # Contractor allowed bundles
         contractor_bundles = rbac.get_allowed_bundle_types(["contractor"])
         assert set(contractor_bundles) == {"STANDARD", "PERFORMANCE"}
@@ -208,34 +142,66 @@ class TestRBACManager:
         team_lead_bundles = rbac.get_allowed_bundle_types(["team_lead"])
         assert "GRAPHICSPRO_G4DN" in team_lead_bundles
     
-    def test_credential_expiry_enforcement(self):
+    def test_credential_expiry_enforcement(self, rbac):
         """Test that expired credentials are rejected."""
-        rbac = RBACManager()
+        now = datetime(2024, 1, 1, 12, 0, 0)
         
         # Expired credentials
-        expired_time = datetime.utcnow() - timedelta(hours=1)
+        expired_time = now - timedelta(hours=1)
         
         # Should deny access even if permission exists
         assert not rbac.has_permission(
             user_roles=["contractor"],
             required_permission=Permission.WORKSPACE_CREATE,
             credential_expiry=expired_time,
+            now=now,
         )
         
         # Valid credentials
-        valid_time = datetime.utcnow() + timedelta(hours=1)
+        valid_time = now + timedelta(hours=1)
         
         # Should allow access
         assert rbac.has_permission(
             user_roles=["contractor"],
             required_permission=Permission.WORKSPACE_CREATE,
             credential_expiry=valid_time,
+            now=now,
         )
     
-    def test_multiple_roles(self):
-        """Test user with multiple roles gets combined permissions."""
+    def test_credential_expiry_enforcement_epoch(self, rbac):
+        """Test expiry enforcement with Unix-timestamp credentials."""
+        now_epoch = 1_704_110_400.0
+        
+        assert not rbac.has_permission_epoch(
+            user_roles=["contractor"],
+            required_permission=Permission.WORKSPACE_CREATE,
+            credential_expiry_epoch=now_epoch - 3600,
+            now_epoch=now_epoch,
+        )
+        assert rbac.has_permission_epoch(
+            user_roles=["contractor"],
+            required_permission=Permission.WORKSPACE_CREATE,
+            credential_expiry_epoch=now_epoch + 3600,
+            now_epoch=now_epoch,
+        )
+    
+    def test_permission_checks_are_memoized(self):
+        """Test repeated permission checks hit the cache."""
         rbac = RBACManager()
         
+        for _ in range(3):
+            assert rbac.has_permission(["engineer"], Permission.WORKSPACE_CREATE)
+        
+        # Role order and duplicates share a cache entry
+        assert rbac.has_permission(["team_lead", "engineer", "engineer"], Permission.AUDIT_READ)
+        assert rbac.has_permission(["engineer", "team_lead"], Permission.AUDIT_READ)
+        
+        cache_info = rbac._has_permission_cached.cache_info()
+        assert cache_info.misses == 2
+        assert cache_info.hits == 3
+    
+    def test_multiple_roles(self, rbac):
+        """Test user with multiple roles gets combined permissions."""
         # User with both engineer and team_lead roles
         permissions = rbac.get_permissions_for_roles(["engineer", "team_lead"])
         
@@ -6,28 +6,97 @@ Requirements:
 - 12.3: Hard limit at 100% threshold
 """
 
+import os
 import pytest
 from datetime import datetime, timedelta
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from src.models.base import Base
 from src.models.user_budget import UserBudget, BudgetScope
 from src.cost.budget_tracker import BudgetTracker
 
 
+# Budget period shared by the tests
+PERIOD_START = datetime(2024, 1, 1)
+PERIOD_END = datetime(2024, 1, 31)
+
+
 # Test database setup
-@pytest.fixture
-def db_session():
-    """Create test database session."""
-    engine = create_engine("sqlite:///:memory:")
+@pytest.fixture(scope="session")
+def _engine():
+    """Create the in-memory test database and schema once per session."""
+    # Each new SQLite connection would open a fresh, empty in-memory
+    # database; StaticPool hands every checkout the same connection.
+    # Name the database per pytest-xdist worker so parallel runs never share it
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    engine = create_engine(
+        f"sqlite:///file:budget_{worker}?mode=memory&cache=shared&uri=true",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    
+    # pysqlite emits its own BEGIN lazily, which breaks SAVEPOINT handling;
+    # disable that and let SQLAlchemy issue BEGIN itself. Journaling and
+    # fsyncs buy nothing for a throwaway test database, so turn them off.
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+    
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+    
     Base.metadata.create_all(engine)
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
+    
+    yield engine
+    
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(_engine):
+    """Create test database session rolled back after each test.
+    
+    Commits made by the code under test release a SAVEPOINT inside the
+    outer transaction, so nothing persists between tests. Objects are not
+    expired on commit, so reading them back does not re-SELECT the row.
+    """
+    connection = _engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+        autoflush=False,
+    )
     
     yield session
     
     session.close()
+    transaction.rollback()
+    connection.close()
+
+
+def seed_budgets(session, rows):
+    """Insert pre-populated budget rows in a single bulk INSERT.
+    
+    The rows are only read back within the same session, so they are
+    flushed rather than committed.
+    
+    Args:
+        session: Database session
+        rows: Column mappings for UserBudget rows
+    """
+    defaults = {"warning_threshold": 0.8, "warning_sent": False, "hard_limit_reached": False}
+    session.execute(insert(UserBudget), [{**defaults, **row} for row in rows])
+    session.flush()
 
 
 class TestBudgetTracker:
@@ -37,15 +106,12 @@ class TestBudgetTracker:
         """Test creating a new budget."""
         tracker = BudgetTracker(db_session)
         
-        period_start = datetime(2024, 1, 1)
-        period_end = datetime(2024, 1, 31)
-        
         budget = tracker.create_budget(
             scope=BudgetScope.USER,
             scope_id="user-123",
             budget_amount=1000.0,
-            period_start=period_start,
-            period_end=period_end
+            period_start=PERIOD_START,
+            period_end=PERIOD_END
         )
         
         assert budget.scope == BudgetScope.USER
@@ -60,15 +126,12 @@ class TestBudgetTracker:
         """Test creating duplicate budget raises error."""
         tracker = BudgetTracker(db_session)
         
-        period_start = datetime(2024, 1, 1)
-        period_end = datetime(2024, 1, 31)
-        
         tracker.create_budget(
             scope=BudgetScope.USER,
             scope_id="user-123",
             budget_amount=1000.0,
-            period_start=period_start,
-            period_end=period_end
+            period_start=PERIOD_START,
+            period_end=PERIOD_END
         )
         
         with pytest.raises(ValueError, match="Budget already exists"):
@@ -76,36 +139,55 @@ class TestBudgetTracker:
                 scope=BudgetScope.USER,
                 scope_id="user-123",
                 budget_amount=2000.0,
-                period_start=period_start,
-                period_end=period_end
+                period_start=PERIOD_START,
+                period_end=PERIOD_END
             )
     
     def test_get_budget(self, db_session):
         """Test retrieving a budget."""
         tracker = BudgetTracker(db_session)
         
-        period_start = datetime(2024, 1, 1)
-        period_end = datetime(2024, 1, 31)
-        
         created_budget = tracker.create_budget(
             scope=BudgetScope.TEAM,
             scope_id="team-robotics",
             budget_amount=5000.0,
-            period_start=period_start,
-            period_end=period_end
+            period_start=PERIOD_START,
+            period_end=PERIOD_END
         )
         
         retrieved_budget = tracker.get_budget(
             scope=BudgetScope.TEAM,
             scope_id="team-robotics",
-            period_start=period_start,
-            period_end=period_end
+            period_start=PERIOD_START,
+            period_end=PERIOD_END
         )
         
         assert retrieved_budget is not None
         assert retrieved_budget.id == created_budget.id
         assert retrieved_budget.budget_amount == 5000.0
     
+    def test_get_budget_lookups_are_cached(self, db_session):
+        """Test repeated lookups hit the cache and writes invalidate it."""
+        tracker = BudgetTracker(db_session)
+        
+        assert tracker.get_budget(BudgetScope.USER, "user-123", use_current_period=False) is None
+        
+        created_budget = tracker.create_budget(
+            scope=BudgetScope.USER,
+            scope_id="user-123",
+            budget_amount=1000.0,
+            period_start=PERIOD_START,
+            period_end=PERIOD_END
+        )
+        
+        for _ in range(3):
+            budget = tracker.get_budget(BudgetScope.USER, "user-123", use_current_period=False)
+            assert budget.id == created_budget.id
+        
+        cache_info = tracker._lookup_budget_id.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 2
+    
     def test_get_nonexistent_budget(self, db_session):
         """Test retrieving nonexistent budget returns None."""
         tracker = BudgetTracker(db_session)
@@ -121,15 +203,12 @@ class TestBudgetTracker:
         """Test updating budget spend."""
         tracker = BudgetTracker(db_session)
         
-        period_start = datetime(2024, 1, 1)
-        period_end = datetime(2024, 1, 31)
-        
         tracker.create_budget(
             scope=BudgetScope.USER,
             scope_id="user-123",
             budget_amount=1000.0,
-            period_start=period_start,
-            period_end=period_end
+            period_start=PERIOD_START,
+            period_end=PERIOD_END
         )
         
         updated_budget = tracker.update_budget_spend(
@@ -145,15 +224,12 @@ class TestBudgetTracker:
         """Test warning threshold is triggered at 80%."""
         tracker = BudgetTracker(db_session)
         
-        period_start = datetime(2024, 1, 1)
-        period_end = datetime(2024, 1, 31)
-        
         tracker.create_budget(
             scope=BudgetScope.USER,
             scope_id="user-123",
             budget_amount=1000.0,
-            period_start=period_start,
-            period_end=period_end
+            period_start=PERIOD_START,
+            period_end=PERIOD_END
         )
         
         # Spend 850 (85% of budget)
@@ -172,15 +248,12 @@ class TestBudgetTracker:
         """Test hard limit is triggered at 100%."""
         tracker = BudgetTracker(db_session)
         
-        period_start = datetime(2024, 1, 1)
-        period_end = datetime(2024, 1, 31)
-        
         tracker.create_budget(
             scope=BudgetScope.USER,
             scope_id="user-123",
             budget_amount=1000.0,
-            period_start=period_start,
-            period_end=period_end
+            period_start=PERIOD_START,
+            period_end=PERIOD_END
         )
         
         # Spend 1000 (100% of budget)
@@ -195,155 +268,101 @@ class TestBudgetTracker:
         assert updated_budget.hard_limit_reached is True
         assert updated_budget.hard_limit_reached_at is not None
     
-    def test_check_budget_allowed(self, db_session):
-        """Test budget check when within limits."""
+    @pytest.mark.parametrize(
+        "budgets,team_id,estimated_cost,expected_allowed,expected_warning,expected_info",
+        [
+            # Within limits: spend 0, estimated 500
+            (
+                [(BudgetScope.USER, "user-123", 1000.0, 0.0)],
+                "team-default", 500.0, True, None, None,
+            ),
+            # Warning at 80%: spend 700, estimated 150 (total 850, 85%)
+            (
+                [(BudgetScope.USER, "user-123", 1000.0, 700.0)],
+                "team-default", 150.0, True, "User budget at 85.0% ($850.00 / $1000.00)", None,
+            ),
+            # Limit exceeded: spend 950, estimated 100 (total 1050, 105%)
+            (
+                [(BudgetScope.USER, "user-123", 1000.0, 950.0)],
+                "team-default", 100.0, False,
+                "Budget exceeded: user budget limit reached. Current: $950.00, "
+                "Estimated cost: $100.00, Budget: $1000.00",
+                {
+                    "scope": "user",
+                    "current_spend": 950.0,
+                    "estimated_cost": 100.0,
+                    "projected_spend": 1050.0,
+                },
+            ),
+            # Team budget nearly exhausted while user budget has room
+            (
+                [
+                    (BudgetScope.USER, "user-123", 5000.0, 0.0),
+                    (BudgetScope.TEAM, "team-robotics", 1000.0, 980.0),
+                ],
+                "team-robotics", 50.0, False,
+                "Budget exceeded: team budget limit reached. Current: $980.00, "
+                "Estimated cost: $50.00, Budget: $1000.00",
+                {"scope": "team"},
+            ),
+        ],
+        ids=["allowed", "warning", "exceeded", "team_limit"],
+    )
+    def test_check_budget(
+        self,
+        db_session,
+        budgets,
+        team_id,
+        estimated_cost,
+        expected_allowed,
+        expected_warning,
+        expected_info,
+    ):
+        """Test budget check outcomes across user and team budgets."""
         tracker = BudgetTracker(db_session)
         
-        period_start = datetime(2024, 1, 1)
-        period_end = datetime(2024, 1, 31)
-        
-        tracker.create_budget(
-            scope=BudgetScope.USER,
-            scope_id="user-123",
-            budget_amount=1000.0,
-            period_start=period_start,
-            period_end=period_end
-        )
+        seed_budgets(db_session, [
+            {
+                "scope": scope,
+                "scope_id": scope_id,
+                "budget_amount": budget_amount,
+                "current_spend": current_spend,
+                "period_start": PERIOD_START,
+                "period_end": PERIOD_END,
+            }
+            for scope, scope_id, budget_amount, current_spend in budgets
+        ])
         
-        # Current spend: 0, estimated: 500
         allowed, warning, budget_info = tracker.check_budget(
             user_id="user-123",
-            team_id="team-default",
+            team_id=team_id,
             project_id=None,
-            estimated_cost=500.0
+            estimated_cost=estimated_cost
         )
         
-        assert allowed is True
-        assert warning is None
-        assert budget_info is None
-    
-    def test_check_budget_warning(self, db_session):
-        """Test budget check with warning at 80%."""
-        tracker = BudgetTracker(db_session)
-        
-        period_start = datetime(2024, 1, 1)
-        period_end = datetime(2024, 1, 31)
-        
-        budget = tracker.create_budget(
-            scope=BudgetScope.USER,
-            scope_id="user-123",
-            budget_amount=1000.0,
-            period_start=period_start,
-            period_end=period_end
-        )
+        assert allowed is expected_allowed
         
-        # Set current spend to 700
-        budget.current_spend = 700.0
-        db_session.commit()
+        assert warning == expected_warning
         
-        # Check with estimated cost of 150 (total would be 850, 85%)
-        allowed, warning, budget_info = tracker.check_budget(
-            user_id="user-123",
-            team_id="team-default",
-            project_id=None,
-            estimated_cost=150.0
-        )
-        
-        assert allowed is True
-        assert warning is not None
-        assert "85.0%" in warning
-        assert budget_info is None
-    
-    def test_check_budget_exceeded(self, db_session):
-        """Test budget check when limit exceeded."""
-        tracker = BudgetTracker(db_session)
-        
-        period_start = datetime(2024, 1, 1)
-        period_end = datetime(2024, 1, 31)
-        
-        budget = tracker.create_budget(
-            scope=BudgetScope.USER,
-            scope_id="user-123",
-            budget_amount=1000.0,
-            period_start=period_start,
-            period_end=period_end
-        )
-        
-        # Set current spend to 950
-        budget.current_spend = 950.0
-        db_session.commit()
-        
-        # Check with estimated cost of 100 (total would be 1050, 105%)
-        allowed, warning, budget_info = tracker.check_budget(
-            user_id="user-123",
-            team_id="team-default",
-            project_id=None,
-            estimated_cost=100.0
-        )
-        
-        assert allowed is False
-        assert warning is not None
-        assert budget_info is not None
-        assert budget_info["scope"] == "user"
-        assert budget_info["current_spend"] == 950.0
-        assert budget_info["estimated_cost"] == 100.0
-        assert budget_info["projected_spend"] == 1050.0
-    
-    def test_check_budget_team_limit(self, db_session):
-        """Test budget check respects team budget."""
-        tracker = BudgetTracker(db_session)
-        
-        period_start = datetime(2024, 1, 1)
-        period_end = datetime(2024, 1, 31)
-        
-        # Create user budget with plenty of room
-        tracker.create_budget(
-            scope=BudgetScope.USER,
-            scope_id="user-123",
-            budget_amount=5000.0,
-            period_start=period_start,
-            period_end=period_end
-        )
-        
-        # Create team budget that's nearly exhausted
-        team_budget = tracker.create_budget(
-            scope=BudgetScope.TEAM,
-            scope_id="team-robotics",
-            budget_amount=1000.0,
-            period_start=period_start,
-            period_end=period_end
-        )
-        team_budget.current_spend = 980.0
-        db_session.commit()
-        
-        # Check with estimated cost of 50 (would exceed team budget)
-        allowed, warning, budget_info = tracker.check_budget(
-            user_id="user-123",
-            team_id="team-robotics",
-            project_id=None,
-            estimated_cost=50.0
-        )
-        
-        assert allowed is False
-        assert budget_info is not None
-        assert budget_info["scope"] == "team"
+        if expected_info is None:
+            assert budget_info is None
+        else:
+            assert budget_info is not None
+            for key, value in expected_info.items():
+                assert budget_info[key] == value
     
     def test_get_budget_status(self, db_session):
         """Test getting budget status."""
         tracker = BudgetTracker(db_session)
         
-        period_start = datetime(2024, 1, 1)
-        period_end = datetime(2024, 1, 31)
-        
-        budget = tracker.create_budget(
-            scope=BudgetScope.USER,
-            scope_id="user-123",
-            budget_amount=1000.0,
-            period_start=period_start,
-            period_end=period_end
-        )
-        budget.current_spend = 750.0
-        db_session.commit()
+        seed_budgets(db_session, [{
+            "scope": BudgetScope.USER,
+            "scope_id": "user-123",
+            "budget_amount": 1000.0,
+            "current_spend": 750.0,
+            "period_start": PERIOD_START,
+            "period_end": PERIOD_END,
+        }])
         
         status = tracker.get_budget_status(
             scope=BudgetScope.USER,
@@ -7,38 +7,49 @@ from src.cost.cost_calculator import CostCalculator, BundleType
 from src.cost.cost_aggregator import CostAggregator
 
 
+# Reporting periods shared by the aggregator tests
+PERIOD_START = datetime(2024, 1, 1)
+PERIOD_END = datetime(2024, 1, 31)
+WEEK_END = datetime(2024, 1, 7)
+H1_END = datetime(2024, 6, 30)
+
+
+@pytest.fixture(scope="class")
+def calculator():
+    """Shared cost calculator (read-only pricing, safe to reuse)."""
+    return CostCalculator()
+
+
+@pytest.fixture(scope="class")
+def aggregator():
+    """Shared cost aggregator (stateless, safe to reuse)."""
+    return CostAggregator()
+
+
 class TestCostCalculator:
     """Test cost calculation service."""
     
-    def test_calculate_compute_cost_standard(self):
+    def test_calculate_compute_cost_standard(self, calculator):
         """Test compute cost calculation for STANDARD bundle."""
-        calculator = CostCalculator()
-        
         cost = calculator.calculate_compute_cost("STANDARD", 10.0)
         
         # STANDARD rate is $0.35/hour
         assert cost == 3.5
     
-    def test_calculate_compute_cost_power(self):
+    def test_calculate_compute_cost_power(self, calculator):
         """Test compute cost calculation for POWER bundle."""
-        calculator = CostCalculator()
-        
         cost = calculator.calculate_compute_cost("POWER", 5.0)
         
         # POWER rate is $1.40/hour
         assert cost == 7.0
     
-    def test_calculate_compute_cost_invalid_bundle(self):
+    def test_calculate_compute_cost_invalid_bundle(self, calculator):
         """Test compute cost calculation with invalid bundle type."""
-        calculator = CostCalculator()
-        
         with pytest.raises(ValueError, match="Invalid bundle type"):
             calculator.calculate_compute_cost("INVALID", 10.0)
     
-    def test_calculate_storage_cost(self):
+    def test_calculate_storage_cost(self, calculator):
         """Test storage cost calculation."""
-        calculator = CostCalculator()
-        
         # 100 GB for 730 hours (1 month)
         cost = calculator.calculate_storage_cost(100.0, 730.0)
         
@@ -46,65 +57,65 @@ class TestCostCalculator:
         # 100 GB * $0.10 = $10/month
         assert cost == 10.0
     
-    def test_calculate_storage_cost_partial_month(self):
+    def test_calculate_storage_cost_partial_month(self, calculator):
         """Test storage cost for partial month."""
-        calculator = CostCalculator()
-        
         # 100 GB for 365 hours (half month)
         cost = calculator.calculate_storage_cost(100.0, 365.0)
         
         # Should be half of monthly cost
         assert cost == 5.0
     
-    def test_calculate_data_transfer_cost(self):
+    def test_calculate_data_transfer_cost(self, calculator):
         """Test data transfer cost calculation."""
-        calculator = CostCalculator()
-        
         cost = calculator.calculate_data_transfer_cost(50.0)
         
         # Data transfer rate is $0.09/GB
         assert cost == 4.5
     
-    def test_calculate_workspace_cost_complete(self):
-        """Test complete workspace cost calculation."""
-        calculator = CostCalculator()
-        
+    @pytest.mark.parametrize(
+        "bundle_type,running_hours,storage_gb,data_transfer_gb,expected_total",
+        [
+            ("PERFORMANCE", 100.0, 150.0, 25.0, 74.30),
+            ("STANDARD", 50.0, 80.0, 0.0, 18.05),
+            ("STANDARD", 176.0, 100.0, 10.0, 64.91),
+            ("POWER", 200.0, 200.0, 50.0, 289.98),
+        ],
+        ids=["complete", "no_data_transfer", "monthly_default", "monthly_custom"],
+    )
+    def test_calculate_workspace_cost(
+        self,
+        calculator,
+        bundle_type,
+        running_hours,
+        storage_gb,
+        data_transfer_gb,
+        expected_total
+    ):
+        """Test workspace cost breakdown against the pricing formula."""
         result = calculator.calculate_workspace_cost(
-            bundle_type="PERFORMANCE",
-            running_hours=100.0,
-            storage_gb=150.0,
-            data_transfer_gb=25.0
+            bundle_type=bundle_type,
+            running_hours=running_hours,
+            storage_gb=storage_gb,
+            data_transfer_gb=data_transfer_gb
         )
         
-        # PERFORMANCE rate: $0.70/hour * 100 hours = $70
-        # Storage: 150 GB * $0.10/month / 730 hours * 100 hours = $2.05
-        # Data transfer: 25 GB * $0.09/GB = $2.25
-        # Total: $74.30
-        
-        assert result["compute_cost"] == 70.0
-        assert result["storage_cost"] == 2.05
-        assert result["data_transfer_cost"] == 2.25
-        assert result["total_cost"] == 74.30
-    
-    def test_calculate_workspace_cost_no_data_transfer(self):
-        """Test workspace cost without data transfer."""
-        calculator = CostCalculator()
-        
-        result = calculator.calculate_workspace_cost(
-            bundle_type="STANDARD",
-            running_hours=50.0,
-            storage_gb=80.0
+        # Compute: hourly rate * hours
+        # Storage: GB * monthly rate / hours per month * hours
+        # Data transfer: GB * per-GB rate
+        compute = calculator.get_bundle_hourly_rate(bundle_type) * running_hours
+        storage = (
+            storage_gb * CostCalculator.STORAGE_RATE_PER_GB_MONTH
+            / CostCalculator.HOURS_PER_MONTH * running_hours
         )
+        transfer = data_transfer_gb * CostCalculator.DATA_TRANSFER_RATE_PER_GB
         
-        assert result["compute_cost"] == 17.5  # $0.35 * 50
-        assert result["storage_cost"] == 0.55  # 80 * 0.10 / 730 * 50
-        assert result["data_transfer_cost"] == 0.0
-        assert result["total_cost"] == 18.05
+        assert result["compute_cost"] == pytest.approx(round(compute, 2))
+        assert result["storage_cost"] == pytest.approx(round(storage, 2))
+        assert result["data_transfer_cost"] == pytest.approx(round(transfer, 2))
+        assert result["total_cost"] == pytest.approx(expected_total)
     
-    def test_calculate_workspace_cost_negative_hours(self):
+    def test_calculate_workspace_cost_negative_hours(self, calculator):
         """Test workspace cost with negative hours."""
-        calculator = CostCalculator()
-        
         with pytest.raises(ValueError, match="running_hours must be non-negative"):
             calculator.calculate_workspace_cost(
                 bundle_type="STANDARD",
@@ -112,10 +123,8 @@ class TestCostCalculator:
                 storage_gb=100.0
             )
     
-    def test_calculate_workspace_cost_negative_storage(self):
+    def test_calculate_workspace_cost_negative_storage(self, calculator):
         """Test workspace cost with negative storage."""
-        calculator = CostCalculator()
-        
         with pytest.raises(ValueError, match="storage_gb must be non-negative"):
             calculator.calculate_workspace_cost(
                 bundle_type="STANDARD",
@@ -123,10 +132,8 @@ class TestCostCalculator:
                 storage_gb=-100.0
             )
     
-    def test_estimate_monthly_cost_default(self):
+    def test_estimate_monthly_cost_default(self, calculator):
         """Test monthly cost estimation with defaults."""
-        calculator = CostCalculator()
-        
         result = calculator.estimate_monthly_cost(
             bundle_type="STANDARD",
             storage_gb=100.0
@@ -143,10 +150,8 @@ class TestCostCalculator:
         assert result["data_transfer_cost"] == 0.90
         assert result["total_cost"] == 64.91
     
-    def test_estimate_monthly_cost_custom(self):
+    def test_estimate_monthly_cost_custom(self, calculator):
         """Test monthly cost estimation with custom values."""
-        calculator = CostCalculator()
-        
         result = calculator.estimate_monthly_cost(
             bundle_type="POWER",
             storage_gb=200.0,
@@ -166,28 +171,27 @@ class TestCostCalculator:
         assert result["data_transfer_cost"] == 4.50
         assert result["total_cost"] == 289.98
     
-    def test_get_bundle_hourly_rate(self):
+    @pytest.mark.parametrize("bundle,rate", [
+        ("STANDARD", 0.35),
+        ("PERFORMANCE", 0.70),
+        ("POWER", 1.40),
+        ("POWERPRO", 2.80),
+        ("GRAPHICS_G4DN", 1.75),
+        ("GRAPHICSPRO_G4DN", 3.50),
+        (BundleType.STANDARD, 0.35),
+        (BundleType.GRAPHICSPRO_G4DN, 3.50),
+    ])
+    def test_get_bundle_hourly_rate(self, calculator, bundle, rate):
         """Test getting hourly rate for bundle type."""
-        calculator = CostCalculator()
-        
-        assert calculator.get_bundle_hourly_rate("STANDARD") == 0.35
-        assert calculator.get_bundle_hourly_rate("PERFORMANCE") == 0.70
-        assert calculator.get_bundle_hourly_rate("POWER") == 1.40
-        assert calculator.get_bundle_hourly_rate("POWERPRO") == 2.80
-        assert calculator.get_bundle_hourly_rate("GRAPHICS_G4DN") == 1.75
-        assert calculator.get_bundle_hourly_rate("GRAPHICSPRO_G4DN") == 3.50
+        assert calculator.get_bundle_hourly_rate(bundle) == rate
     
-    def test_get_bundle_hourly_rate_invalid(self):
+    def test_get_bundle_hourly_rate_invalid(self, calculator):
         """Test getting hourly rate for invalid bundle."""
-        calculator = CostCalculator()
-        
         with pytest.raises(ValueError, match="Invalid bundle type"):
             calculator.get_bundle_hourly_rate("INVALID")
     
-    def test_compare_bundle_costs_downgrade(self):
+    def test_compare_bundle_costs_downgrade(self, calculator):
         """Test comparing costs for downgrade."""
-        calculator = CostCalculator()
-        
         result = calculator.compare_bundle_costs(
             current_bundle="POWER",
             target_bundle="PERFORMANCE",
@@ -205,10 +209,8 @@ class TestCostCalculator:
         assert result["monthly_savings"] == 123.20
         assert result["savings_percent"] == 50.0
     
-    def test_compare_bundle_costs_upgrade(self):
+    def test_compare_bundle_costs_upgrade(self, calculator):
         """Test comparing costs for upgrade."""
-        calculator = CostCalculator()
-        
         result = calculator.compare_bundle_costs(
             current_bundle="STANDARD",
             target_bundle="POWER",
@@ -228,122 +230,51 @@ class TestCostCalculator:
 class TestCostAggregator:
     """Test cost aggregation service."""
     
-    def test_aggregate_by_workspace(self):
-        """Test cost aggregation by workspace."""
-        aggregator = CostAggregator()
-        
-        workspace_ids = ["ws-1", "ws-2", "ws-3"]
-        start_date = datetime(2024, 1, 1)
-        end_date = datetime(2024, 1, 31)
-        
-        result = aggregator.aggregate_by_workspace(workspace_ids, start_date, end_date)
-        
-        assert isinstance(result, dict)
-        assert len(result) == 3
-        assert "ws-1" in result
-        assert "ws-2" in result
-        assert "ws-3" in result
-    
-    def test_aggregate_by_user(self):
-        """Test cost aggregation by user."""
-        aggregator = CostAggregator()
-        
-        user_ids = ["user-1", "user-2"]
-        start_date = datetime(2024, 1, 1)
-        end_date = datetime(2024, 1, 31)
-        
-        result = aggregator.aggregate_by_user(user_ids, start_date, end_date)
+    @pytest.mark.parametrize("method,entity_ids", [
+        ("aggregate_by_workspace", ["ws-1", "ws-2", "ws-3"]),
+        ("aggregate_by_user", ["user-1", "user-2"]),
+        ("aggregate_by_team", ["team-robotics", "team-ai"]),
+        ("aggregate_by_project", ["proj-sim", "proj-ml"]),
+    ])
+    def test_aggregate(self, aggregator, method, entity_ids):
+        """Test cost aggregation by workspace, user, team and project."""
+        result = getattr(aggregator, method)(entity_ids, PERIOD_START, PERIOD_END)
         
         assert isinstance(result, dict)
-        assert len(result) == 2
-        assert "user-1" in result
-        assert "user-2" in result
+        assert result.keys() == set(entity_ids)
     
-    def test_aggregate_by_team(self):
-        """Test cost aggregation by team."""
-        aggregator = CostAggregator()
-        
-        team_ids = ["team-robotics", "team-ai"]
-        start_date = datetime(2024, 1, 1)
-        end_date = datetime(2024, 1, 31)
-        
-        result = aggregator.aggregate_by_team(team_ids, start_date, end_date)
-        
-        assert isinstance(result, dict)
-        assert len(result) == 2
-        assert "team-robotics" in result
-        assert "team-ai" in result
-    
-    def test_aggregate_by_project(self):
-        """Test cost aggregation by project."""
-        aggregator = CostAggregator()
-        
-        project_ids = ["proj-sim", "proj-ml"]
-        start_date = datetime(2024, 1, 1)
-        end_date = datetime(2024, 1, 31)
-        
-        result = aggregator.aggregate_by_project(project_ids, start_date, end_date)
-        
-        assert isinstance(result, dict)
-        assert len(result) == 2
-        assert "proj-sim" in result
-        assert "proj-ml" in result
-    
-    def test_get_daily_costs(self):
+    def test_get_daily_costs(self, aggregator):
         """Test daily cost breakdown."""
-        aggregator = CostAggregator()
-        
-        start_date = datetime(2024, 1, 1)
-        end_date = datetime(2024, 1, 7)
         
-        result = aggregator.get_daily_costs("user-1", "user", start_date, end_date)
+        result = aggregator.get_daily_costs("user-1", "user", PERIOD_START, WEEK_END)
         
         assert isinstance(result, list)
-        assert len(result) == 7  # 7 days
-        assert result[0]["date"] == "2024-01-01"
-        assert result[6]["date"] == "2024-01-07"
+        assert [day["date"] for day in result] == [f"2024-01-0{i}" for i in range(1, 8)]
     
-    def test_get_weekly_costs(self):
+    def test_get_weekly_costs(self, aggregator):
         """Test weekly cost breakdown."""
-        aggregator = CostAggregator()
-        
-        start_date = datetime(2024, 1, 1)
-        end_date = datetime(2024, 1, 31)
         
-        result = aggregator.get_weekly_costs("team-1", "team", start_date, end_date)
+        result = aggregator.get_weekly_costs("team-1", "team", PERIOD_START, PERIOD_END)
         
         assert isinstance(result, list)
         assert len(result) >= 4  # At least 4 weeks in January
-        assert "week_start" in result[0]
-        assert "week_end" in result[0]
-        assert "cost" in result[0]
+        assert result[0].keys() >= {"week_start", "week_end", "cost"}
     
-    def test_get_monthly_costs(self):
+    def test_get_monthly_costs(self, aggregator):
         """Test monthly cost breakdown."""
-        aggregator = CostAggregator()
         
-        start_date = datetime(2024, 1, 1)
-        end_date = datetime(2024, 6, 30)
-        
-        result = aggregator.get_monthly_costs("proj-1", "project", start_date, end_date)
+        result = aggregator.get_monthly_costs("proj-1", "project", PERIOD_START, H1_END)
         
         assert isinstance(result, list)
-        assert len(result) == 6  # 6 months
-        assert result[0]["month"] == "2024-01"
-        assert result[5]["month"] == "2024-06"
+        assert [month["month"] for month in result] == [f"2024-0{i}" for i in range(1, 7)]
     
-    def test_get_cost_breakdown(self):
+    def test_get_cost_breakdown(self, aggregator):
         """Test detailed cost breakdown."""
-        aggregator = CostAggregator()
-        
-        start_date = datetime(2024, 1, 1)
-        end_date = datetime(2024, 1, 31)
         
-        result = aggregator.get_cost_breakdown("ws-1", "workspace", start_date, end_date)
+        result = aggregator.get_cost_breakdown("ws-1", "workspace", PERIOD_START, PERIOD_END)
         
         assert result["entity_id"] == "ws-1"
         assert result["entity_type"] == "workspace"
-        assert "compute_cost" in result
-        assert "storage_cost" in result
-        assert "data_transfer_cost" in result
-        assert "total_cost" in result
+        assert result.keys() >= {
+            "compute_cost", "storage_cost", "data_transfer_cost", "total_cost"
+        }
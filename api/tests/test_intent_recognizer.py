@@ -11,51 +11,46 @@ from src.lucy.intent_recognizer import IntentRecognizer, Intent, RecognizedInten
 class TestIntentRecognition:
     """Test intent recognition from user messages."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.recognizer = IntentRecognizer()
+    @classmethod
+    def setup_class(cls):
+        """Set up a recognizer shared by the class (it holds no per-call state)."""
+        cls.recognizer = IntentRecognizer()
     
     # Greeting intents
-    def test_recognize_greeting(self):
+    @pytest.mark.parametrize("message", ["hi", "hello", "hey Lucy", "greetings"])
+    def test_recognize_greeting(self, message):
         """Test greeting intent recognition."""
-        messages = ["hi", "hello", "hey Lucy", "greetings"]
-        
-        for message in messages:
-            result = self.recognizer.recognize(message)
-            assert result.intent == Intent.GREETING
-            assert result.confidence > 0.7
+        result = self.recognizer.recognize(message)
+        assert result.intent == Intent.GREETING
+        assert result.confidence > 0.7
     
     # Help intents
-    def test_recognize_help(self):
+    @pytest.mark.parametrize("message", [
+        "help",
+        "what can you do",
+        "show me your capabilities",
+        "how do I provision a workspace"
+    ])
+    def test_recognize_help(self, message):
         """Test help intent recognition."""
-        messages = [
-            "help",
-            "what can you do",
-            "show me your capabilities",
-            "how do I provision a workspace"
-        ]
-        
-        for message in messages:
-            result = self.recognizer.recognize(message)
-            assert result.intent == Intent.HELP
+        result = self.recognizer.recognize(message)
+        assert result.intent == Intent.HELP
     
     # Provision workspace intents (Req 5.4)
-    def test_recognize_provision_workspace(self):
+    @pytest.mark.parametrize("message", [
+        "provision a workspace",
+        "create a new workstation",
+        "I need a workspace",
+        "launch a desktop",
+        "spin up a machine",
+        "get me a workspace"
+    ])
+    def test_recognize_provision_workspace(self, message):
         """Test workspace provisioning intent recognition."""
-        messages = [
-            "provision a workspace",
-            "create a new workstation",
-            "I need a workspace",
-            "launch a desktop",
-            "spin up a machine",
-            "get me a workspace"
-        ]
-        
-        for message in messages:
-            result = self.recognizer.recognize(message)
-            assert result.intent == Intent.PROVISION_WORKSPACE
-            assert result.tool_name == "provision_workspace"
-            assert result.confidence > 0.7
+        result = self.recognizer.recognize(message)
+        assert result.intent == Intent.PROVISION_WORKSPACE
+        assert result.tool_name == "provision_workspace"
+        assert result.confidence > 0.7
     
     def test_provision_with_bundle_type(self):
         """Test provisioning intent with bundle type extraction."""
@@ -65,19 +60,17 @@ class TestIntentRecognition:
         assert result.entities.get("bundle_type") == "POWER"
     
     # Bundle recommendation intents (Req 5.3)
-    def test_recognize_bundle_recommendation(self):
+    @pytest.mark.parametrize("message", [
+        "recommend a bundle",
+        "which bundle should I use",
+        "what configuration do I need",
+        "suggest a bundle for ML",
+        "help me choose a bundle"
+    ])
+    def test_recognize_bundle_recommendation(self, message):
         """Test bundle recommendation intent recognition."""
-        messages = [
-            "recommend a bundle",
-            "which bundle should I use",
-            "what configuration do I need",
-            "suggest a bundle for ML",
-            "help me choose a bundle"
-        ]
-        
-        for message in messages:
-            result = self.recognizer.recognize(message)
-            assert result.intent == Intent.RECOMMEND_BUNDLE
+        result = self.recognizer.recognize(message)
+        assert result.intent == Intent.RECOMMEND_BUNDLE
     
     def test_recommend_bundle_gpu_workload(self):
         """Test bundle recommendation for GPU workloads."""
@@ -122,35 +115,31 @@ class TestIntentRecognition:
         assert len(recommendations) <= 3
     
     # List workspaces intents (Req 5.5)
-    def test_recognize_list_workspaces(self):
+    @pytest.mark.parametrize("message", [
+        "list my workspaces",
+        "show me my workstations",
+        "what workspaces do I have",
+        "display all my desktops",
+        "my workspaces"
+    ])
+    def test_recognize_list_workspaces(self, message):
         """Test list workspaces intent recognition."""
-        messages = [
-            "list my workspaces",
-            "show me my workstations",
-            "what workspaces do I have",
-            "display all my desktops",
-            "my workspaces"
-        ]
-        
-        for message in messages:
-            result = self.recognizer.recognize(message)
-            assert result.intent == Intent.LIST_WORKSPACES
-            assert result.tool_name == "list_workspaces"
+        result = self.recognizer.recognize(message)
+        assert result.intent == Intent.LIST_WORKSPACES
+        assert result.tool_name == "list_workspaces"
     
     # Start workspace intents (Req 5.5)
-    def test_recognize_start_workspace(self):
+    @pytest.mark.parametrize("message", [
+        "start my workspace",
+        "boot workspace ws-1234",
+        "power on my workstation",
+        "turn on workspace-abcd"
+    ])
+    def test_recognize_start_workspace(self, message):
         """Test start workspace intent recognition."""
-        messages = [
-            "start my workspace",
-            "boot workspace ws-1234",
-            "power on my workstation",
-            "turn on workspace-abcd"
-        ]
-        
-        for message in messages:
-            result = self.recognizer.recognize(message)
-            assert result.intent == Intent.START_WORKSPACE
-            assert result.tool_name == "start_workspace"
+        result = self.recognizer.recognize(message)
+        assert result.intent == Intent.START_WORKSPACE
+        assert result.tool_name == "start_workspace"
     
     def test_start_workspace_with_id(self):
         """Test start workspace with ID extraction."""
@@ -161,64 +150,56 @@ class TestIntentRecognition:
         assert "1234" in result.entities["workspace_id"]
     
     # Stop workspace intents (Req 5.5)
-    def test_recognize_stop_workspace(self):
+    @pytest.mark.parametrize("message", [
+        "stop my workspace",
+        "shutdown workspace ws-5678",
+        "power off my workstation",
+        "turn off workspace-xyz"
+    ])
+    def test_recognize_stop_workspace(self, message):
         """Test stop workspace intent recognition."""
-        messages = [
-            "stop my workspace",
-            "shutdown workspace ws-5678",
-            "power off my workstation",
-            "turn off workspace-xyz"
-        ]
-        
-        for message in messages:
-            result = self.recognizer.recognize(message)
-            assert result.intent == Intent.STOP_WORKSPACE
-            assert result.tool_name == "stop_workspace"
+        result = self.recognizer.recognize(message)
+        assert result.intent == Intent.STOP_WORKSPACE
+        assert result.tool_name == "stop_workspace"
     
     # Terminate workspace intents (Req 5.5)
-    def test_recognize_terminate_workspace(self):
+    @pytest.mark.parametrize("message", [
+        "terminate my workspace",
+        "delete workspace ws-9999",
+        "destroy my workstation",
+        "remove workspace-test"
+    ])
+    def test_recognize_terminate_workspace(self, message):
         """Test terminate workspace intent recognition."""
-        messages = [
-            "terminate my workspace",
-            "delete workspace ws-9999",
-            "destroy my workstation",
-            "remove workspace-test"
-        ]
-        
-        for message in messages:
-            result = self.recognizer.recognize(message)
-            assert result.intent == Intent.TERMINATE_WORKSPACE
-            assert result.tool_name == "terminate_workspace"
+        result = self.recognizer.recognize(message)
+        assert result.intent == Intent.TERMINATE_WORKSPACE
+        assert result.tool_name == "terminate_workspace"
     
     # Get workspace status intents (Req 5.5)
-    def test_recognize_workspace_status(self):
+    @pytest.mark.parametrize("message", [
+        "status of my workspace",
+        "what's the state of workspace ws-1111",
+        "show me workspace info",
+        "describe workspace-test"
+    ])
+    def test_recognize_workspace_status(self, message):
         """Test workspace status intent recognition."""
-        messages = [
-            "status of my workspace",
-            "what's the state of workspace ws-1111",
-            "show me workspace info",
-            "describe workspace-test"
-        ]
-        
-        for message in messages:
-            result = self.recognizer.recognize(message)
-            assert result.intent == Intent.GET_WORKSPACE_STATUS
+        result = self.recognizer.recognize(message)
+        assert result.intent == Intent.GET_WORKSPACE_STATUS
     
     # Cost summary intents (Req 5.6)
-    def test_recognize_cost_summary(self):
+    @pytest.mark.parametrize("message", [
+        "what are my costs",
+        "how much am I spending",
+        "show me my expenses",
+        "what's my bill",
+        "cost summary"
+    ])
+    def test_recognize_cost_summary(self, message):
         """Test cost summary intent recognition."""
-        messages = [
-            "what are my costs",
-            "how much am I spending",
-            "show me my expenses",
-            "what's my bill",
-            "cost summary"
-        ]
-        
-        for message in messages:
-            result = self.recognizer.recognize(message)
-            assert result.intent == Intent.GET_COST_SUMMARY
-            assert result.tool_name == "get_cost_summary"
+        result = self.recognizer.recognize(message)
+        assert result.intent == Intent.GET_COST_SUMMARY
+        assert result.tool_name == "get_cost_summary"
     
     def test_cost_summary_with_period(self):
         """Test cost summary with time period extraction."""
@@ -235,106 +216,92 @@ class TestIntentRecognition:
         assert result.entities.get("team_id") == "robotics"
     
     # Cost recommendations intents (Req 5.6)
-    def test_recognize_cost_recommendations(self):
+    @pytest.mark.parametrize("message", [
+        "cost optimization recommendations",
+        "how can I save money",
+        "suggest ways to reduce costs",
+        "optimize my spending"
+    ])
+    def test_recognize_cost_recommendations(self, message):
         """Test cost recommendations intent recognition."""
-        messages = [
-            "cost optimization recommendations",
-            "how can I save money",
-            "suggest ways to reduce costs",
-            "optimize my spending"
-        ]
-        
-        for message in messages:
-            result = self.recognizer.recognize(message)
-            assert result.intent == Intent.GET_COST_RECOMMENDATIONS
-            assert result.tool_name == "get_cost_recommendations"
+        result = self.recognizer.recognize(message)
+        assert result.intent == Intent.GET_COST_RECOMMENDATIONS
+        assert result.tool_name == "get_cost_recommendations"
     
     # Budget check intents (Req 5.6)
-    def test_recognize_budget_check(self):
+    @pytest.mark.parametrize("message", [
+        "check my budget",
+        "how much budget do I have left",
+        "show me my quota",
+        "what's my budget status"
+    ])
+    def test_recognize_budget_check(self, message):
         """Test budget check intent recognition."""
-        messages = [
-            "check my budget",
-            "how much budget do I have left",
-            "show me my quota",
-            "what's my budget status"
-        ]
-        
-        for message in messages:
-            result = self.recognizer.recognize(message)
-            assert result.intent == Intent.CHECK_BUDGET
-            assert result.tool_name == "check_budget"
+        result = self.recognizer.recognize(message)
+        assert result.intent == Intent.CHECK_BUDGET
+        assert result.tool_name == "check_budget"
     
     # Diagnostics intents (Req 5.7)
-    def test_recognize_diagnostics(self):
+    @pytest.mark.parametrize("message", [
+        "run diagnostics on my workspace",
+        "check workspace ws-1234",
+        "diagnose my workstation",
+        "test workspace health"
+    ])
+    def test_recognize_diagnostics(self, message):
         """Test diagnostics intent recognition."""
-        messages = [
-            "run diagnostics on my workspace",
-            "check workspace ws-1234",
-            "diagnose my workstation",
-            "test workspace health"
-        ]
-        
-        for message in messages:
-            result = self.recognizer.recognize(message)
-            assert result.intent == Intent.RUN_DIAGNOSTICS
-            assert result.tool_name == "run_diagnostics"
-    
-    def test_recognize_troubleshoot(self):
+        result = self.recognizer.recognize(message)
+        assert result.intent == Intent.RUN_DIAGNOSTICS
+        assert result.tool_name == "run_diagnostics"
+    
+    @pytest.mark.parametrize("message", [
+        "my workspace is not working",
+        "workspace is broken",
+        "can't connect to my workstation",
+        "workspace is slow"
+    ])
+    def test_recognize_troubleshoot(self, message):
         """Test troubleshooting intent recognition."""
-        messages = [
-            "my workspace is not working",
-            "workspace is broken",
-            "can't connect to my workstation",
-            "workspace is slow"
-        ]
-        
-        for message in messages:
-            result = self.recognizer.recognize(message)
-            assert result.intent == Intent.TROUBLESHOOT
-            assert result.tool_name == "run_diagnostics"
+        result = self.recognizer.recognize(message)
+        assert result.intent == Intent.TROUBLESHOOT
+        assert result.tool_name == "run_diagnostics"
     
     # Support ticket intents (Req 5.8)
-    def test_recognize_support_ticket(self):
+    @pytest.mark.parametrize("message", [
+        "create a support ticket",
+        "I need help from support",
+        "talk to a human",
+        "escalate this issue"
+    ])
+    def test_recognize_support_ticket(self, message):
         """Test support ticket intent recognition."""
-        messages = [
-            "create a support ticket",
-            "I need help from support",
-            "talk to a human",
-            "escalate this issue"
-        ]
-        
-        for message in messages:
-            result = self.recognizer.recognize(message)
-            assert result.intent == Intent.CREATE_SUPPORT_TICKET
-            assert result.tool_name == "create_support_ticket"
+        result = self.recognizer.recognize(message)
+        assert result.intent == Intent.CREATE_SUPPORT_TICKET
+        assert result.tool_name == "create_support_ticket"
     
     # Entity extraction tests
-    def test_extract_workspace_id(self):
+    @pytest.mark.parametrize("message,expected_id", [
+        ("start ws-1234", "ws-1234"),
+        ("stop workspace-abcd", "workspace-abcd"),
+        ("terminate WS-XYZ9", "WS-XYZ9")
+    ])
+    def test_extract_workspace_id(self, message, expected_id):
         """Test workspace ID extraction."""
-        messages = [
-            ("start ws-1234", "ws-1234"),
-            ("stop workspace-abcd", "workspace-abcd"),
-            ("terminate WS-XYZ9", "WS-XYZ9")
-        ]
-        
-        for message, expected_id in messages:
-            result = self.recognizer.recognize(message)
-            assert "workspace_id" in result.entities
-            assert expected_id.lower() in result.entities["workspace_id"].lower()
-    
-    def test_extract_time_period(self):
+        result = self.recognizer.recognize(message)
+        assert "workspace_id" in result.entities
+        assert expected_id.lower() in result.entities["workspace_id"].lower()
+    
+    @pytest.mark.parametrize("message,expected_period", [
+        ("costs this month", "current_month"),
+        ("spending last month", "last_month"),
+        ("costs last 7 days", "last_7_days"),
+        ("expenses last 30 days", "last_30_days")
+    ])
+    def test_extract_time_period(self, message, expected_period):
         """Test time period extraction."""
-        test_cases = [
-            ("costs this month", "current_month"),
-            ("spending last month", "last_month"),
-            ("costs last 7 days", "last_7_days"),
-            ("expenses last 30 days", "last_30_days")
-        ]
-        
-        for message, expected_period in test_cases:
-            result = self.recognizer.recognize(message)
-            if result.intent == Intent.GET_COST_SUMMARY:
-                assert result.entities.get("period") == expected_period
+        result = self.recognizer.recognize(message)
+        if result.intent == Intent.GET_COST_SUMMARY:
+            assert result.entities.get("period") == expected_period
     
     # Ambiguity handling tests
     def test_unknown_intent(self):
@@ -344,6 +311,10 @@ class TestIntentRecognition:
         assert result.intent == Intent.UNKNOWN
         assert result.ambiguous is True
         assert result.clarification_needed is not None
+        
+        # Unknown results are one shared instance, however they are reached
+        assert result is self.recognizer.recognize("")
+        assert result is IntentRecognizer().recognize("qwerty asdf")
     
     def test_clarification_needed_no_workspace_id(self):
         """Test clarification request when workspace ID is missing."""
@@ -406,10 +377,59 @@ class TestIntentRecognition:
         assert "workspace_id" in result.entities
         assert "abc123" in result.entities["workspace_id"].lower()
     
+    def test_recognize_many(self):
+        """Test batch recognition matches recognizing each message."""
+        messages = [
+            "list my workspaces",
+            "what are my costs this month",
+            "",
+            "xyzabc random gibberish",
+        ]
+        
+        results = self.recognizer.recognize_many(messages)
+        
+        assert results == [self.recognizer.recognize(message) for message in messages]
+        assert [result.intent for result in results] == [
+            Intent.LIST_WORKSPACES,
+            Intent.GET_COST_SUMMARY,
+            Intent.UNKNOWN,
+            Intent.UNKNOWN,
+        ]
+    
     # Edge cases
-    def test_empty_message(self):
-        """Test handling of empty message."""
-        result = self.recognizer.recognize("")
+    def test_repeated_message_is_cached(self):
+        """Test repeated messages are served from the cache."""
+        recognizer = IntentRecognizer()
+        
+        first = recognizer.recognize("what are my costs this month")
+        second = recognizer.recognize("what are my costs this month")
+        
+        assert recognizer._recognize_cached.cache_info().hits == 1
+        assert second is first
+    
+    def test_entities_behave_as_read_only_mapping(self):
+        """Test extracted entities read like a dict of the entities found."""
+        result = self.recognizer.recognize("what are my costs this month for team: robotics")
+        
+        assert result.entities == {"period": "current_month", "team_id": "robotics"}
+        assert result.entities["period"] == "current_month"
+        assert "workspace_id" not in result.entities
+        assert result.entities.get("workspace_id", "none") == "none"
+        
+        with pytest.raises(TypeError):
+            result.entities["period"] = "last_month"
+    
+    def test_recognized_intent_is_immutable(self):
+        """Test recognition results cannot be modified in place."""
+        result = self.recognizer.recognize("what are my costs")
+        
+        with pytest.raises(AttributeError):
+            result.intent = Intent.UNKNOWN
+    
+    @pytest.mark.parametrize("message", ["", "   ", "\t\n"])
+    def test_empty_message(self, message):
+        """Test handling of empty and whitespace-only messages."""
+        result = self.recognizer.recognize(message)
         
         assert result.intent == Intent.UNKNOWN
         assert result.ambiguous is True
@@ -422,6 +442,14 @@ class TestIntentRecognition:
         # Should still recognize the intent
         assert result.intent == Intent.PROVISION_WORKSPACE
     
+    def test_intent_beyond_scan_length_is_ignored(self):
+        """Test only the leading characters of a message are scanned for intent."""
+        recognizer = IntentRecognizer(max_scan_length=20)
+        
+        result = recognizer.recognize("xyzabc random gibberish, what are my costs")
+        
+        assert result.intent == Intent.UNKNOWN
+    
     def test_mixed_case_message(self):
         """Test handling of mixed case message."""
         result = self.recognizer.recognize("PrOvIsIoN a WoRkSpAcE")
@@ -13,23 +13,51 @@ sys.modules['src.database'] = MagicMock()
 sys.modules['src.audit.audit_logger'] = MagicMock()
 
 from src.lucy.audit import (
+    AuditEventBuffer,
     LucyAuditLogger,
+    flush_lucy_audit_log,
+    log_lucy_budget_denial,
+    log_lucy_query,
+    log_lucy_rate_limit_exceeded,
+    log_lucy_rbac_denial,
+    log_lucy_tool_execution,
 )
 
 
+@pytest.fixture(scope="module")
+def mock_audit_log_bulk():
+    """Patch the bulk audit writer once for the whole module."""
+    with patch('src.lucy.audit.audit_log_bulk') as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def reset_audit_log_bulk(mock_audit_log_bulk):
+    """Reset the shared bulk writer mock before each test."""
+    flush_lucy_audit_log()
+    mock_audit_log_bulk.reset_mock(return_value=True, side_effect=True)
+
+
 class TestLucyAuditLogger:
     """Test Lucy audit logging functionality."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.logger = LucyAuditLogger()
-        self.user_id = "user-123"
-        self.source_ip = "192.168.1.1"
-        self.user_agent = "Mozilla/5.0"
-        self.conversation_id = "conv-abc"
+    @classmethod
+    def setup_class(cls):
+        """Set up test fixtures shared by every test (the logger is stateless)."""
+        cls.logger = LucyAuditLogger()
+        cls.user_id = "user-123"
+        cls.source_ip = "192.168.1.1"
+        cls.user_agent = "Mozilla/5.0"
+        cls.conversation_id = "conv-abc"
     
-    @patch('src.lucy.audit.audit_log')
-    def test_log_tool_execution_success(self, mock_audit_log):
+    def _flush_event(self, mock_audit_log_bulk):
+        """Flush buffered audit events and return the last one written."""
+        flush_lucy_audit_log()
+        
+        assert mock_audit_log_bulk.called
+        return mock_audit_log_bulk.call_args.args[0][-1]
+    
+    def test_log_tool_execution_success(self, mock_audit_log_bulk):
         """Test logging successful tool execution."""
         tool_name = "provision_workspace"
         tool_parameters = {"bundle_type": "POWER", "blueprint_id": "bp-123"}
@@ -46,28 +74,26 @@ class TestLucyAuditLogger:
             conversation_id=self.conversation_id,
         )
         
-        # Verify audit_log was called
-        assert mock_audit_log.called
-        call_args = mock_audit_log.call_args
+        # Verify the event was written on flush
+        event = self._flush_event(mock_audit_log_bulk)
         
         # Check required fields
-        assert call_args.kwargs["user_id"] == self.user_id
-        assert call_args.kwargs["action"] == f"lucy.tool.{tool_name}"
-        assert call_args.kwargs["resource_type"] == "lucy_tool"
-        assert call_args.kwargs["resource_id"] == tool_name
-        assert call_args.kwargs["result"] == "SUCCESS"
-        assert call_args.kwargs["interface"] == "LUCY"
-        assert call_args.kwargs["source_ip"] == self.source_ip
+        assert event["user_id"] == self.user_id
+        assert event["action"] == f"lucy.tool.{tool_name}"
+        assert event["resource_type"] == "lucy_tool"
+        assert event["resource_id"] == tool_name
+        assert event["result"] == "SUCCESS"
+        assert event["interface"] == "LUCY"
+        assert event["source_ip"] == self.source_ip
         
         # Check metadata
-        metadata = call_args.kwargs["metadata"]
+        metadata = event["metadata"]
         assert metadata["tool_name"] == tool_name
         assert metadata["tool_parameters"] == tool_parameters
         assert metadata["tool_result"] == result
         assert metadata["conversation_id"] == self.conversation_id
     
-    @patch('src.lucy.audit.audit_log')
-    def test_log_tool_execution_failure(self, mock_audit_log):
+    def test_log_tool_execution_failure(self, mock_audit_log_bulk):
         """Test logging failed tool execution."""
         tool_name = "provision_workspace"
         tool_parameters = {"bundle_type": "POWER"}
@@ -83,16 +109,14 @@ class TestLucyAuditLogger:
             source_ip=self.source_ip,
         )
         
-        # Verify audit_log was called
-        assert mock_audit_log.called
-        call_args = mock_audit_log.call_args
+        # Verify the event was written on flush
+        event = self._flush_event(mock_audit_log_bulk)
         
         # Check result is FAILURE
-        assert call_args.kwargs["result"] == "FAILURE"
-        assert call_args.kwargs["error_message"] == error_message
+        assert event["result"] == "FAILURE"
+        assert event["error_message"] == error_message
     
-    @patch('src.lucy.audit.audit_log')
-    def test_log_conversation_start(self, mock_audit_log):
+    def test_log_conversation_start(self, mock_audit_log_bulk):
         """Test logging conversation start."""
         self.logger.log_conversation_start(
             user_id=self.user_id,
@@ -101,17 +125,15 @@ class TestLucyAuditLogger:
             user_agent=self.user_agent,
         )
         
-        # Verify audit_log was called
-        assert mock_audit_log.called
-        call_args = mock_audit_log.call_args
+        # Verify the event was written on flush
+        event = self._flush_event(mock_audit_log_bulk)
         
-        assert call_args.kwargs["action"] == "lucy.conversation.start"
-        assert call_args.kwargs["resource_type"] == "lucy_conversation"
-        assert call_args.kwargs["resource_id"] == self.conversation_id
-        assert call_args.kwargs["result"] == "SUCCESS"
+        assert event["action"] == "lucy.conversation.start"
+        assert event["resource_type"] == "lucy_conversation"
+        assert event["resource_id"] == self.conversation_id
+        assert event["result"] == "SUCCESS"
     
-    @patch('src.lucy.audit.audit_log')
-    def test_log_conversation_end(self, mock_audit_log):
+    def test_log_conversation_end(self, mock_audit_log_bulk):
         """Test logging conversation end."""
         message_count = 5
         tool_executions = 2
@@ -124,17 +146,15 @@ class TestLucyAuditLogger:
             source_ip=self.source_ip,
         )
         
-        # Verify audit_log was called
-        assert mock_audit_log.called
-        call_args = mock_audit_log.call_args
+        # Verify the event was written on flush
+        event = self._flush_event(mock_audit_log_bulk)
         
-        assert call_args.kwargs["action"] == "lucy.conversation.end"
-        metadata = call_args.kwargs["metadata"]
+        assert event["action"] == "lucy.conversation.end"
+        metadata = event["metadata"]
         assert metadata["message_count"] == message_count
         assert metadata["tool_executions"] == tool_executions
     
-    @patch('src.lucy.audit.audit_log')
-    def test_log_query(self, mock_audit_log):
+    def test_log_query(self, mock_audit_log_bulk):
         """Test logging Lucy query."""
         query = "I need a GPU workspace"
         intent = "provision_workspace"
@@ -147,18 +167,16 @@ class TestLucyAuditLogger:
             conversation_id=self.conversation_id,
         )
         
-        # Verify audit_log was called
-        assert mock_audit_log.called
-        call_args = mock_audit_log.call_args
+        # Verify the event was written on flush
+        event = self._flush_event(mock_audit_log_bulk)
         
-        assert call_args.kwargs["action"] == "lucy.query"
-        assert call_args.kwargs["resource_type"] == "lucy_query"
-        metadata = call_args.kwargs["metadata"]
+        assert event["action"] == "lucy.query"
+        assert event["resource_type"] == "lucy_query"
+        metadata = event["metadata"]
         assert metadata["query_length"] == len(query)
         assert metadata["intent"] == intent
     
-    @patch('src.lucy.audit.audit_log')
-    def test_log_rate_limit_exceeded(self, mock_audit_log):
+    def test_log_rate_limit_exceeded(self, mock_audit_log_bulk):
         """Test logging rate limit exceeded."""
         tool_name = "provision_workspace"
         limit = 5
@@ -172,19 +190,17 @@ class TestLucyAuditLogger:
             source_ip=self.source_ip,
         )
         
-        # Verify audit_log was called
-        assert mock_audit_log.called
-        call_args = mock_audit_log.call_args
+        # Verify the event was written on flush
+        event = self._flush_event(mock_audit_log_bulk)
         
-        assert call_args.kwargs["action"] == "lucy.rate_limit_exceeded"
-        assert call_args.kwargs["result"] == "DENIED"
-        metadata = call_args.kwargs["metadata"]
+        assert event["action"] == "lucy.rate_limit_exceeded"
+        assert event["result"] == "DENIED"
+        metadata = event["metadata"]
         assert metadata["tool_name"] == tool_name
         assert metadata["limit"] == limit
         assert metadata["window_seconds"] == window_seconds
     
-    @patch('src.lucy.audit.audit_log')
-    def test_log_budget_denial(self, mock_audit_log):
+    def test_log_budget_denial(self, mock_audit_log_bulk):
         """Test logging budget denial."""
         tool_name = "provision_workspace"
         estimated_cost = 50.0
@@ -200,20 +216,18 @@ class TestLucyAuditLogger:
             source_ip=self.source_ip,
         )
         
-        # Verify audit_log was called
-        assert mock_audit_log.called
-        call_args = mock_audit_log.call_args
+        # Verify the event was written on flush
+        event = self._flush_event(mock_audit_log_bulk)
         
-        assert call_args.kwargs["action"] == "lucy.budget_denial"
-        assert call_args.kwargs["result"] == "DENIED"
-        metadata = call_args.kwargs["metadata"]
+        assert event["action"] == "lucy.budget_denial"
+        assert event["result"] == "DENIED"
+        metadata = event["metadata"]
         assert metadata["estimated_cost"] == estimated_cost
         assert metadata["budget_limit"] == budget_limit
         assert metadata["current_spend"] == current_spend
         assert metadata["budget_percentage"] == 98.0
     
-    @patch('src.lucy.audit.audit_log')
-    def test_log_rbac_denial(self, mock_audit_log):
+    def test_log_rbac_denial(self, mock_audit_log_bulk):
         """Test logging RBAC denial."""
         tool_name = "provision_workspace"
         required_permission = "workspace.provision"
@@ -227,13 +241,12 @@ class TestLucyAuditLogger:
             source_ip=self.source_ip,
         )
         
-        # Verify audit_log was called
-        assert mock_audit_log.called
-        call_args = mock_audit_log.call_args
+        # Verify the event was written on flush
+        event = self._flush_event(mock_audit_log_bulk)
         
-        assert call_args.kwargs["action"] == "lucy.rbac_denial"
-        assert call_args.kwargs["result"] == "DENIED"
-        metadata = call_args.kwargs["metadata"]
+        assert event["action"] == "lucy.rbac_denial"
+        assert event["result"] == "DENIED"
+        metadata = event["metadata"]
         assert metadata["tool_name"] == tool_name
         assert metadata["required_permission"] == required_permission
         assert metadata["user_role"] == user_role
@@ -258,82 +271,105 @@ class TestLucyAuditLogger:
         action_type = self.logger._map_tool_to_action_type("unknown_tool")
         assert action_type == ActionType.LUCY_ACTION
     
-    @patch('src.lucy.audit.audit_log')
-    def test_convenience_function_log_lucy_tool_execution(self, mock_audit_log):
-        """Test convenience function for logging tool execution."""
-        from src.lucy.audit import log_lucy_tool_execution
-        
-        log_lucy_tool_execution(
-            user_id=self.user_id,
-            tool_name="provision_workspace",
-            tool_parameters={"bundle_type": "POWER"},
-            result="Success",
-            success=True,
-        )
-        
-        assert mock_audit_log.called
+    @pytest.mark.parametrize("log_function,kwargs,expected_action", [
+        (
+            log_lucy_tool_execution,
+            {
+                "tool_name": "provision_workspace",
+                "tool_parameters": {"bundle_type": "POWER"},
+                "result": "Success",
+                "success": True,
+            },
+            "lucy.tool.provision_workspace",
+        ),
+        (
+            log_lucy_query,
+            {"query": "I need a workspace", "intent": "provision_workspace"},
+            "lucy.query",
+        ),
+        (
+            log_lucy_rate_limit_exceeded,
+            {"tool_name": "provision_workspace", "limit": 5, "window_seconds": 3600},
+            "lucy.rate_limit_exceeded",
+        ),
+        (
+            log_lucy_budget_denial,
+            {
+                "tool_name": "provision_workspace",
+                "estimated_cost": 50.0,
+                "budget_limit": 1000.0,
+                "current_spend": 980.0,
+            },
+            "lucy.budget_denial",
+        ),
+        (
+            log_lucy_rbac_denial,
+            {
+                "tool_name": "provision_workspace",
+                "required_permission": "workspace.provision",
+                "user_role": "contractor",
+            },
+            "lucy.rbac_denial",
+        ),
+    ], ids=["tool_execution", "query", "rate_limit", "budget_denial", "rbac_denial"])
+    def test_convenience_function(self, log_function, kwargs, expected_action, mock_audit_log_bulk):
+        """Test convenience functions log through the shared Lucy audit logger."""
+        log_function(user_id=self.user_id, **kwargs)
+        
+        event = self._flush_event(mock_audit_log_bulk)
+        assert event["user_id"] == self.user_id
+        assert event["action"] == expected_action
     
-    @patch('src.lucy.audit.audit_log')
-    def test_convenience_function_log_lucy_query(self, mock_audit_log):
-        """Test convenience function for logging query."""
-        from src.lucy.audit import log_lucy_query
+    def test_buffered_events_are_written_in_one_batch(self, mock_audit_log_bulk, lucy_audit_buffer):
+        """Test buffered events are written with a single bulk insert."""
+        for query in ("list my workspaces", "show costs", "check budget"):
+            self.logger.log_query(user_id=self.user_id, query=query)
         
-        log_lucy_query(
-            user_id=self.user_id,
-            query="I need a workspace",
-            intent="provision_workspace",
-        )
+        assert mock_audit_log_bulk.call_count == 0
+        lucy_audit_buffer.flush()
         
-        assert mock_audit_log.called
+        assert mock_audit_log_bulk.call_count == 1
+        batch = mock_audit_log_bulk.call_args.args[0]
+        assert [event["metadata"]["query_length"] for event in batch] == [18, 10, 12]
     
-    @patch('src.lucy.audit.audit_log')
-    def test_convenience_function_log_rate_limit(self, mock_audit_log):
-        """Test convenience function for logging rate limit."""
-        from src.lucy.audit import log_lucy_rate_limit_exceeded
+    def test_full_buffer_drops_oldest_events(self, mock_audit_log_bulk):
+        """Test a full buffer drops and counts its oldest events."""
+        buffer = AuditEventBuffer(max_size=2, start_flusher=False)
         
-        log_lucy_rate_limit_exceeded(
-            user_id=self.user_id,
-            tool_name="provision_workspace",
-            limit=5,
-            window_seconds=3600,
-        )
+        for index in range(3):
+            buffer.append({"resource_id": index})
+        buffer.flush()
         
-        assert mock_audit_log.called
+        assert buffer.dropped_count == 1
+        mock_audit_log_bulk.assert_called_once_with([{"resource_id": 1}, {"resource_id": 2}])
     
-    @patch('src.lucy.audit.audit_log')
-    def test_convenience_function_log_budget_denial(self, mock_audit_log):
-        """Test convenience function for logging budget denial."""
-        from src.lucy.audit import log_lucy_budget_denial
+    def test_failed_write_counts_dropped_events(self, mock_audit_log_bulk):
+        """Test a batch that fails to write is counted as dropped."""
+        mock_audit_log_bulk.side_effect = Exception("Database error")
+        buffer = AuditEventBuffer(batch_size=2, start_flusher=False)
         
-        log_lucy_budget_denial(
-            user_id=self.user_id,
-            tool_name="provision_workspace",
-            estimated_cost=50.0,
-            budget_limit=1000.0,
-            current_spend=980.0,
-        )
+        for index in range(3):
+            buffer.append({"resource_id": index})
+        buffer.flush()
         
-        assert mock_audit_log.called
+        assert buffer.dropped_count == 3
+        assert mock_audit_log_bulk.call_count == 2
     
     @patch('src.lucy.audit.audit_log')
-    def test_convenience_function_log_rbac_denial(self, mock_audit_log):
-        """Test convenience function for logging RBAC denial."""
-        from src.lucy.audit import log_lucy_rbac_denial
+    def test_event_with_session_is_written_immediately(self, mock_audit_log, mock_audit_log_bulk):
+        """Test events logged with an explicit session bypass the buffer."""
+        db = Mock()
         
-        log_lucy_rbac_denial(
-            user_id=self.user_id,
-            tool_name="provision_workspace",
-            required_permission="workspace.provision",
-            user_role="contractor",
-        )
+        self.logger.log_query(user_id=self.user_id, query="show costs", db=db)
+        flush_lucy_audit_log()
         
-        assert mock_audit_log.called
+        assert mock_audit_log.call_args.kwargs["db"] is db
+        assert not mock_audit_log_bulk.called
     
-    @patch('src.lucy.audit.audit_log')
-    def test_audit_logging_does_not_fail_operation(self, mock_audit_log):
+    def test_audit_logging_does_not_fail_operation(self, mock_audit_log_bulk):
         """Test that audit logging failures don't fail the operation."""
-        # Make audit_log raise an exception
-        mock_audit_log.side_effect = Exception("Database error")
+        # Make the bulk write raise an exception
+        mock_audit_log_bulk.side_effect = Exception("Database error")
         
         # Should not raise exception
         self.logger.log_tool_execution(
@@ -344,5 +380,8 @@ class TestLucyAuditLogger:
             success=True,
         )
         
+        # Flushing should not raise either
+        flush_lucy_audit_log()
+        
         # Verify it was attempted
-        assert mock_audit_log.called
+        assert mock_audit_log_bulk.called
@@ -0,0 +1,72 @@
+"""Tests for the Lucy conversation corpus.
+
+Validates that every corpus case is well-formed so evaluation runs against
+Lucy fail on model behavior, not on corpus typos.
+Requirements: 5.3, 5.4, 5.5, 5.6
+"""
+
+import pytest
+
+from src.lucy.intent_recognizer import Intent
+from tests.lucy_conversation_corpus import (
+    CONVERSATION_CORPUS,
+    CORPUS_PARAMS,
+    ExpectedError,
+    get_all_categories,
+)
+
+
+KNOWN_INTENTS = {intent.value for intent in Intent}
+
+# Tools registered with Lucy's tool executor
+KNOWN_TOOLS = {
+    "provision_workspace",
+    "list_workspaces",
+    "start_workspace",
+    "stop_workspace",
+    "terminate_workspace",
+    "get_cost_summary",
+    "get_cost_recommendations",
+    "check_budget",
+    "run_diagnostics",
+    "create_support_ticket",
+}
+
+
+def test_corpus_ids_unique():
+    """Test corpus case IDs are unique."""
+    ids = [case.id for case in CONVERSATION_CORPUS]
+    assert len(ids) == len(set(ids))
+
+
+def test_categories_in_corpus_order():
+    """Test categories are unique and listed in first-appearance order."""
+    expected = list(dict.fromkeys(case.category for case in CONVERSATION_CORPUS))
+    assert get_all_categories() == expected
+
+
+@pytest.mark.parametrize("case", CORPUS_PARAMS)
+def test_case_expected_intent_known(case):
+    """Test each case expects an intent Lucy can recognize."""
+    assert case.expected_intent in KNOWN_INTENTS
+
+
+@pytest.mark.parametrize("case", CORPUS_PARAMS)
+def test_case_expected_tool_known(case):
+    """Test each case expects no tool or a registered tool."""
+    assert case.expected_tool is None or case.expected_tool in KNOWN_TOOLS
+
+
+@pytest.mark.parametrize("case", CORPUS_PARAMS)
+def test_case_expected_error_matches_outcome(case):
+    """Test failing cases name an expected error and succeeding ones don't."""
+    if case.should_succeed:
+        assert case.expected_error is None
+    else:
+        assert isinstance(case.expected_error, ExpectedError)
+
+
+@pytest.mark.parametrize("case", CORPUS_PARAMS)
+def test_case_user_message_present(case):
+    """Test each case has a non-empty user message."""
+    assert case.user_message.strip()
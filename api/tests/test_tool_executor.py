@@ -5,7 +5,6 @@ Requirements: 5.4
 
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import Mock, AsyncMock
 import asyncio
 
 from src.lucy.tool_executor import (
@@ -80,27 +79,15 @@ class MockProvisioningTool(Tool):
 
 
 @pytest.fixture
-def mock_redis():
-    """Create a mock Redis client."""
-    redis_mock = Mock()
-    redis_mock.zremrangebyscore = Mock()
-    redis_mock.zcard = Mock(return_value=0)
-    redis_mock.zrange = Mock(return_value=[])
-    redis_mock.zadd = Mock()
-    redis_mock.expire = Mock()
-    return redis_mock
-
-
-@pytest.fixture
-def rate_limiter(mock_redis):
+def rate_limiter(recording_redis):
     """Create a RateLimiter with mock Redis."""
-    return RateLimiter(mock_redis)
+    return RateLimiter(recording_redis)
 
 
 @pytest.fixture
-def tool_executor(mock_redis):
+def tool_executor(recording_redis):
     """Create a ToolExecutor with mock Redis."""
-    return ToolExecutor(mock_redis)
+    return ToolExecutor(recording_redis)
 
 
 def test_tool_result_success():
@@ -158,9 +145,9 @@ def test_tool_get_schema():
     assert "input_schema" in schema
     assert schema["input_schema"]["type"] == "object"
     assert "param1" in schema["input_schema"]["properties"]
+    assert tool.get_schema() is schema
 
 
-@pytest.mark.asyncio
 async def test_tool_execute():
     """Test tool execution."""
     tool = MockTool()
@@ -173,10 +160,9 @@ async def test_tool_execute():
     assert tool.execute_params["param1"] == "value1"
 
 
-@pytest.mark.asyncio
-async def test_rate_limiter_allows_within_limit(rate_limiter, mock_redis):
+async def test_rate_limiter_allows_within_limit(rate_limiter, recording_redis):
     """Test rate limiter allows requests within limit."""
-    mock_redis.zcard.return_value = 3  # 3 requests in window
+    recording_redis.count = 3  # 3 requests in window
     
     allowed, error = await rate_limiter.check_rate_limit(
         "user123",
@@ -187,13 +173,16 @@ async def test_rate_limiter_allows_within_limit(rate_limiter, mock_redis):
     
     assert allowed is True
     assert error is None
+    
+    # All three commands go to Redis in one round trip
+    assert recording_redis.commands == ["zremrangebyscore", "zcard", "zrange"]
+    assert recording_redis.round_trips == 1
 
 
-@pytest.mark.asyncio
-async def test_rate_limiter_blocks_over_limit(rate_limiter, mock_redis):
+async def test_rate_limiter_blocks_over_limit(rate_limiter, recording_redis):
     """Test rate limiter blocks requests over limit."""
-    mock_redis.zcard.return_value = 5  # At limit
-    mock_redis.zrange.return_value = [(b"timestamp", 1000.0)]
+    recording_redis.count = 5  # At limit
+    recording_redis.oldest = [(b"timestamp", 1000.0)]
     
     allowed, error = await rate_limiter.check_rate_limit(
         "user123",
@@ -208,8 +197,7 @@ async def test_rate_limiter_blocks_over_limit(rate_limiter, mock_redis):
     assert "provisioning" in error
 
 
-@pytest.mark.asyncio
-async def test_rate_limiter_record_execution(rate_limiter, mock_redis):
+async def test_rate_limiter_record_execution(rate_limiter, recording_redis):
     """Test recording tool execution."""
     await rate_limiter.record_execution(
         "user123",
@@ -218,8 +206,8 @@ async def test_rate_limiter_record_execution(rate_limiter, mock_redis):
     )
     
     # Verify Redis calls
-    mock_redis.zadd.assert_called_once()
-    mock_redis.expire.assert_called_once()
+    assert recording_redis.commands == ["zadd", "expire"]
+    assert recording_redis.round_trips == 1
 
 
 def test_rate_limiter_key_format(rate_limiter):
@@ -251,20 +239,28 @@ def test_tool_executor_register_tool(tool_executor):
 
 def test_tool_executor_get_tool_schemas(tool_executor):
     """Test getting all tool schemas."""
-    tool1 = MockTool()
-    tool2 = MockProvisioningTool()
-    
-    tool_executor.register_tool(tool1)
-    tool_executor.register_tool(tool2)
+    tool_executor.register_tools([MockTool(), MockProvisioningTool()])
     
     schemas = tool_executor.get_tool_schemas()
     
     assert len(schemas) == 2
     assert any(s["name"] == "mock_tool" for s in schemas)
     assert any(s["name"] == "provision_workspace" for s in schemas)
+    assert tool_executor.get_tool_schemas() is schemas
+
+
+def test_tool_executor_register_tool_refreshes_schemas(tool_executor):
+    """Test registering a tool after fetching schemas includes it."""
+    tool_executor.register_tool(MockTool())
+    assert len(tool_executor.get_tool_schemas()) == 1
+    
+    tool_executor.register_tool(MockProvisioningTool())
+    
+    assert [s["name"] for s in tool_executor.get_tool_schemas()] == [
+        "mock_tool", "provision_workspace"
+    ]
 
 
-@pytest.mark.asyncio
 async def test_tool_executor_execute_unknown_tool(tool_executor):
     """Test executing unknown tool."""
     result = await tool_executor.execute_tool(
@@ -276,14 +272,13 @@ async def test_tool_executor_execute_unknown_tool(tool_executor):
     assert "Unknown tool" in result.error
 
 
-@pytest.mark.asyncio
-async def test_tool_executor_execute_tool_success(tool_executor, mock_redis):
+async def test_tool_executor_execute_tool_success(tool_executor, recording_redis):
     """Test successful tool execution."""
     tool = MockTool()
     tool_executor.register_tool(tool)
     
     # Mock rate limit check to allow
-    mock_redis.zcard.return_value = 0
+    recording_redis.count = 0
     
     result = await tool_executor.execute_tool(
         "mock_tool",
@@ -296,15 +291,14 @@ async def test_tool_executor_execute_tool_success(tool_executor, mock_redis):
     assert tool.execute_called is True
 
 
-@pytest.mark.asyncio
-async def test_tool_executor_rate_limit_enforcement(tool_executor, mock_redis):
+async def test_tool_executor_rate_limit_enforcement(tool_executor, recording_redis):
     """Test rate limit enforcement during execution."""
     tool = MockProvisioningTool()
     tool_executor.register_tool(tool)
     
     # Mock rate limit exceeded
-    mock_redis.zcard.return_value = 5  # At limit
-    mock_redis.zrange.return_value = [(b"timestamp", 1000.0)]
+    recording_redis.count = 5  # At limit
+    recording_redis.oldest = [(b"timestamp", 1000.0)]
     
     result = await tool_executor.execute_tool(
         "provision_workspace",
@@ -316,14 +310,13 @@ async def test_tool_executor_rate_limit_enforcement(tool_executor, mock_redis):
     assert "Rate limit exceeded" in result.error
 
 
-@pytest.mark.asyncio
-async def test_tool_executor_records_successful_execution(tool_executor, mock_redis):
+async def test_tool_executor_records_successful_execution(tool_executor, recording_redis):
     """Test that successful executions are recorded for rate limiting."""
     tool = MockProvisioningTool()
     tool_executor.register_tool(tool)
     
     # Mock rate limit check to allow
-    mock_redis.zcard.return_value = 0
+    recording_redis.count = 0
     
     result = await tool_executor.execute_tool(
         "provision_workspace",
@@ -334,7 +327,7 @@ async def test_tool_executor_records_successful_execution(tool_executor, mock_re
     assert result.success is True
     
     # Verify execution was recorded
-    mock_redis.zadd.assert_called_once()
+    assert recording_redis.commands.count("zadd") == 1
 
 
 def test_tool_executor_get_tool(tool_executor):
@@ -370,11 +363,16 @@ def test_confirmation_required_exception():
 
 def test_tool_categories():
     """Test ToolCategory enum."""
-    assert ToolCategory.PROVISIONING.value == "provisioning"
-    assert ToolCategory.WORKSPACE_MANAGEMENT.value == "workspace_management"
-    assert ToolCategory.COST_QUERY.value == "cost_query"
-    assert ToolCategory.DIAGNOSTICS.value == "diagnostics"
-    assert ToolCategory.SUPPORT.value == "support"
+    expected = {
+        ToolCategory.PROVISIONING: "provisioning",
+        ToolCategory.WORKSPACE_MANAGEMENT: "workspace_management",
+        ToolCategory.COST_QUERY: "cost_query",
+        ToolCategory.DIAGNOSTICS: "diagnostics",
+        ToolCategory.SUPPORT: "support",
+    }
+    
+    # New categories may be added; the existing values are stored in Redis keys
+    assert expected.items() <= {c: c.value for c in ToolCategory}.items()
 
 
 def test_rate_limit_configuration(tool_executor):
@@ -256,6 +256,7 @@ resource "aws_iam_role_policy" "forge_api_sa" {
         Effect = "Allow"
         Action = [
           "secretsmanager:GetSecretValue",
+          "secretsmanager:BatchGetSecretValue",
           "secretsmanager:DescribeSecret"
         ]
         Resource = "*"